@@ -2,197 +2,471 @@
 Helpers for ingesting Congress Bill Status bulk XML files.
 """
 import os
+import re
+import sys
+import multiprocessing
+from array import array
+from functools import lru_cache
+from itertools import repeat
 import xml.etree.ElementTree as ET
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Dict, List, Optional
-
-
+from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+try:
+    from lxml import etree as LET
+except ImportError:  # pragma: no cover - optional accelerator
+    LET = None
+
+XML_PARSER_BACKEND = "lxml" if LET is not None else "xml.etree"
+
+if LET is not None:
+    _PARSE_ERRORS: tuple = (ET.ParseError, LET.XMLSyntaxError, ValueError)
+
+    def _iterparse(source: BinaryIO, events):
+        return LET.iterparse(
+            source,
+            events=events,
+            resolve_entities=False,
+            no_network=True,
+            huge_tree=True,
+        )
+else:
+    _PARSE_ERRORS = (ET.ParseError,)
+
+    def _iterparse(source: BinaryIO, events):
+        return ET.iterparse(source, events=events)
+
+
+# Bill-level fields captured during the streaming pass (first occurrence wins).
+_BILL_FIELDS = frozenset((
+    "congress",
+    "billType",
+    "type",
+    "billNumber",
+    "number",
+    "updateDateIncludingText",
+    "updateDate",
+))
+_PEOPLE_CONTAINERS = frozenset(("sponsors", "cosponsors"))
+
+# Candidate tag names per field, in priority order.
+_CONGRESS_KEYS = ("congress",)
+_BILL_TYPE_KEYS = ("billType", "type")
+_BILL_NUMBER_KEYS = ("billNumber", "number")
+_UPDATE_DATE_KEYS = ("updateDateIncludingText", "updateDate")
+_BIOGUIDE_KEYS = ("bioguideId", "bioguideID", "bioguide")
+_SPONSOR_NAME_KEYS = ("fullName", "name")
+_PARTY_KEYS = ("party",)
+_STATE_KEYS = ("state",)
+_CHAMBER_KEYS = ("chamber",)
+_WITHDRAWN_DATE_KEYS = ("withdrawnDate", "sponsorshipWithdrawnDate", "withdrawalDate")
+_WITHDRAWN_FLAG_KEYS = ("isWithdrawn", "withdrawn")
+_IS_ORIGINAL_KEYS = ("isOriginalCosponsor", "originalCosponsor", "isOriginal")
+_PERSON_FIELDS = frozenset(
+    _BIOGUIDE_KEYS
+    + _SPONSOR_NAME_KEYS
+    + _PARTY_KEYS
+    + _STATE_KEYS
+    + _CHAMBER_KEYS
+    + _WITHDRAWN_DATE_KEYS
+    + _WITHDRAWN_FLAG_KEYS
+    + _IS_ORIGINAL_KEYS
+)
+_STATUS_FIELDS = frozenset(_WITHDRAWN_DATE_KEYS + _WITHDRAWN_FLAG_KEYS + _IS_ORIGINAL_KEYS)
+
+# Low-cardinality person fields repeated across every bill in a congress.
+_INTERNED_KEYS = ("party", "state", "chamber")
+
+# Column layout of parsed cosponsors (see _extract_cosponsors).
+_COSPONSOR_TEXT_COLUMNS = ("bioguideId", "fullName", "party", "state", "chamber")
+_COSPONSOR_FLAG_COLUMNS = ("is_original", "withdrawn")
+
+# govinfo names bulk files like BILLSTATUS-118hr1234.xml.
+_BILLSTATUS_FILENAME_RE = re.compile(r"^BILLSTATUS-(\d+)[a-z]", re.IGNORECASE)
+
+# Files handed to each worker process per round-trip.
+_PARSE_CHUNKSIZE = 32
+
+
+@lru_cache(maxsize=256)
 def _local_name(tag: str) -> str:
-    if not tag:
+    # lxml reports comments/processing instructions with a callable tag.
+    if not tag or not isinstance(tag, str):
         return ""
-    if "}" in tag:
-        return tag.rsplit("}", 1)[-1]
-    return tag
+    i = tag.find("}")
+    return tag[i + 1:] if i >= 0 else tag
 
 
-def _iter_by_name(root: ET.Element, name: str):
-    for elem in root.iter():
-        if _local_name(elem.tag) == name:
-            yield elem
+def _maybe_strip(text: Optional[str]) -> Optional[str]:
+    """strip() that skips the copy when there is no edge whitespace (the usual case)."""
+    if not text:
+        return text
+    if text[0].isspace() or text[-1].isspace():
+        return text.strip()
+    return text
 
 
-def _find_first(root: ET.Element, name: str) -> Optional[ET.Element]:
-    for elem in _iter_by_name(root, name):
-        return elem
-    return None
+def _item_fields(item: ET.Element) -> Dict[str, str]:
+    """Collect non-empty text of the person fields among an item's direct children."""
+    values: Dict[str, str] = {}
+    for child in item:
+        name = _local_name(child.tag)
+        if name in _PERSON_FIELDS and name not in values and child.text:
+            text = _maybe_strip(child.text)
+            if text:
+                values[name] = text
+    return values
 
 
-def _find_text(root: ET.Element, names: List[str]) -> Optional[str]:
-    for name in names:
-        elem = _find_first(root, name)
-        if elem is not None and elem.text:
-            value = elem.text.strip()
-            if value:
-                return value
-    return None
+def _find_text(values: Dict[str, str], names: Tuple[str, ...]) -> Optional[str]:
+    return next((values[name] for name in names if values.get(name)), None)
+
+
+_TRUTHY = frozenset(("true", "t", "yes", "y", "1"))
 
 
 def _boolish(value: Any) -> bool:
-    if isinstance(value, bool):
+    if value is None:
+        return False
+    if value is True or value is False:
         return value
-    if isinstance(value, int):
+    if type(value) is str:
+        return value.strip().lower() in _TRUTHY
+    if type(value) is int:
         return value != 0
-    if isinstance(value, str):
-        return value.strip().lower() in ("true", "t", "yes", "y", "1")
     return False
 
 
-def _extract_bioguide(item: ET.Element) -> Optional[str]:
-    for key in ("bioguideId", "bioguideID", "bioguide"):
+def _extract_bioguide(item: ET.Element, values: Dict[str, str]) -> Optional[str]:
+    for key in _BIOGUIDE_KEYS:
         if key in item.attrib and item.attrib[key]:
-            return item.attrib[key].strip()
-    return _find_text(item, ["bioguideId", "bioguideID", "bioguide"])
+            return _maybe_strip(item.attrib[key])
+    return _find_text(values, _BIOGUIDE_KEYS)
 
 
 def _extract_cosponsor(item: ET.Element) -> Optional[Dict[str, Any]]:
-    bioguide = _extract_bioguide(item)
+    values = _item_fields(item)
+    bioguide = _extract_bioguide(item, values)
     if not bioguide:
         return None
 
-    withdrawn_date = _find_text(item, ["withdrawnDate", "sponsorshipWithdrawnDate", "withdrawalDate"])
-    withdrawn_flag = _find_text(item, ["isWithdrawn", "withdrawn"])
-    is_original_raw = _find_text(item, ["isOriginalCosponsor", "originalCosponsor", "isOriginal"])
+    is_original = withdrawn = False
+    # Most cosponsors carry none of the status fields; skip the lookups then.
+    if not _STATUS_FIELDS.isdisjoint(values):
+        withdrawn_date = _find_text(values, _WITHDRAWN_DATE_KEYS)
+        withdrawn_flag = _find_text(values, _WITHDRAWN_FLAG_KEYS)
+        is_original = _boolish(_find_text(values, _IS_ORIGINAL_KEYS))
+        withdrawn = bool(withdrawn_date) or _boolish(withdrawn_flag)
 
     return {
         "bioguideId": bioguide,
-        "fullName": _find_text(item, ["fullName", "name"]),
-        "party": _find_text(item, ["party"]),
-        "state": _find_text(item, ["state"]),
-        "chamber": _find_text(item, ["chamber"]),
-        "is_original": _boolish(is_original_raw),
-        "withdrawn": bool(withdrawn_date) or _boolish(withdrawn_flag),
+        "fullName": _find_text(values, _SPONSOR_NAME_KEYS),
+        "party": _find_text(values, _PARTY_KEYS),
+        "state": _find_text(values, _STATE_KEYS),
+        "chamber": _find_text(values, _CHAMBER_KEYS),
+        "is_original": is_original,
+        "withdrawn": withdrawn,
     }
 
 
-def _extract_cosponsors(root: ET.Element) -> List[Dict[str, Any]]:
-    cosponsors_parent = _find_first(root, "cosponsors")
+def _child_items(parent: ET.Element, alt_path: str) -> List[ET.Element]:
+    # "{*}" matches any (or no) namespace and is resolved in C by both parsers.
+    return parent.findall("{*}item") + parent.findall(alt_path)
+
+
+def _empty_cosponsor_columns() -> Dict[str, Any]:
+    cols: Dict[str, Any] = {key: [] for key in _COSPONSOR_TEXT_COLUMNS}
+    for key in _COSPONSOR_FLAG_COLUMNS:
+        cols[key] = array("b")
+    return cols
+
+
+def _extract_cosponsors(cosponsors_parent) -> Dict[str, Any]:
+    """
+    Cosponsors in columnar form: one list per text field plus one
+    array('b') per boolean flag, all aligned by position.
+    """
+    cols = _empty_cosponsor_columns()
     if cosponsors_parent is None:
-        return []
+        return cols
 
-    out: List[Dict[str, Any]] = []
-    for item in cosponsors_parent:
-        if _local_name(item.tag) not in ("item", "cosponsor"):
-            continue
+    for item in _child_items(cosponsors_parent, "{*}cosponsor"):
         normalized = _extract_cosponsor(item)
-        if normalized:
-            out.append(normalized)
-    return out
+        if not normalized:
+            continue
+        for key in _COSPONSOR_TEXT_COLUMNS:
+            cols[key].append(normalized[key])
+        for key in _COSPONSOR_FLAG_COLUMNS:
+            cols[key].append(1 if normalized[key] else 0)
+    return cols
 
 
-def _extract_primary_sponsor(root: ET.Element) -> Optional[Dict[str, Any]]:
-    sponsors_parent = _find_first(root, "sponsors")
+def iter_cosponsor_rows(cosponsors: Any):
+    """
+    Yield one dict per cosponsor from either the columnar shape returned by
+    parse_bill_status_xml or a plain list of cosponsor dicts.
+    """
+    if not cosponsors:
+        return
+    if isinstance(cosponsors, list):
+        yield from cosponsors
+        return
+    text_cols = [cosponsors.get(key) or [] for key in _COSPONSOR_TEXT_COLUMNS]
+    flag_cols = [cosponsors.get(key) or [] for key in _COSPONSOR_FLAG_COLUMNS]
+    for i in range(len(text_cols[0])):
+        row = {key: col[i] for key, col in zip(_COSPONSOR_TEXT_COLUMNS, text_cols)}
+        for key, col in zip(_COSPONSOR_FLAG_COLUMNS, flag_cols):
+            row[key] = bool(col[i]) if i < len(col) else False
+        yield row
+
+
+def _extract_primary_sponsor(sponsors_parent) -> Optional[Dict[str, Any]]:
     if sponsors_parent is None:
         return None
 
-    for item in sponsors_parent:
-        if _local_name(item.tag) not in ("item", "sponsor"):
-            continue
-        bioguide = _extract_bioguide(item)
+    for item in _child_items(sponsors_parent, "{*}sponsor"):
+        values = _item_fields(item)
+        bioguide = _extract_bioguide(item, values)
         if not bioguide:
             continue
         return {
             "bioguideId": bioguide,
-            "fullName": _find_text(item, ["fullName", "name"]),
-            "party": _find_text(item, ["party"]),
-            "state": _find_text(item, ["state"]),
-            "chamber": _find_text(item, ["chamber"]),
+            "fullName": _find_text(values, _SPONSOR_NAME_KEYS),
+            "party": _find_text(values, _PARTY_KEYS),
+            "state": _find_text(values, _STATE_KEYS),
+            "chamber": _find_text(values, _CHAMBER_KEYS),
         }
     return None
 
 
-def parse_bill_status_xml(xml_text: str) -> Optional[Dict[str, Any]]:
+def _congress_matches(raw: str, congress: int) -> bool:
+    try:
+        return int(raw) == congress
+    except ValueError:
+        return False
+
+
+def parse_bill_status_xml(xml_text: str, congress: Optional[int] = None) -> Optional[Dict[str, Any]]:
     """
-    Parse a single Bill Status XML payload.
+    Parse a single Bill Status XML payload given as text.
+    Thin wrapper over parse_bill_status_xml_bytes.
+    """
+    if isinstance(xml_text, str):
+        xml_text = xml_text.encode("utf-8")
+    return parse_bill_status_xml_bytes(xml_text, congress=congress)
+
+
+def parse_bill_status_xml_bytes(xml_bytes: bytes, congress: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """
+    Parse a single Bill Status XML payload from raw bytes.
     Returns normalized bill payload with sponsor/cosponsors.
     """
+    return _parse_bill_status_stream(BytesIO(xml_bytes), congress=congress)
+
+
+def _parse_bill_status_stream(source: BinaryIO, congress: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """
+    Parse a Bill Status document from a binary file-like object. The parser
+    pulls the input in fixed-size blocks rather than reading it up front.
+
+    When ``congress`` is given, parsing stops (returning None) as soon as the
+    bill's <congress> value is known not to match.
+
+    The document is streamed once: bill-level fields are captured as their
+    elements close, the first <sponsors>/<cosponsors> subtrees are extracted
+    when they close, and everything else is cleared as soon as it is seen.
+    """
+    fields: Dict[str, str] = {}
+    pending_fields: Dict[str, Any] = {}
+    containers: Dict[str, Any] = {}
+    open_containers = 0
+    sponsor: Optional[Dict[str, Any]] = None
+    cosponsors: Dict[str, Any] = _empty_cosponsor_columns()
+
     try:
-        root = ET.fromstring(xml_text)
-    except ET.ParseError:
+        for event, elem in _iterparse(source, ("start", "end")):
+            name = _local_name(elem.tag)
+            if event == "start":
+                if name in _BILL_FIELDS:
+                    pending_fields.setdefault(name, elem)
+                elif name in _PEOPLE_CONTAINERS and name not in containers:
+                    containers[name] = elem
+                    open_containers += 1
+                continue
+
+            if name in _BILL_FIELDS and pending_fields.get(name) is elem:
+                fields[name] = _maybe_strip(elem.text) or ""
+                if congress is not None and name == "congress" and not _congress_matches(fields[name], congress):
+                    return None
+            elif name in _PEOPLE_CONTAINERS and containers.get(name) is elem:
+                if name == "sponsors":
+                    sponsor = _extract_primary_sponsor(elem)
+                else:
+                    cosponsors = _extract_cosponsors(elem)
+                open_containers -= 1
+
+            if not open_containers:
+                elem.clear()
+    except _PARSE_ERRORS + (OSError,):
         return None
 
-    congress_raw = _find_text(root, ["congress"])
-    bill_type = _find_text(root, ["billType", "type"])
-    bill_number_raw = _find_text(root, ["billNumber", "number"])
+    congress_raw = _find_text(fields, _CONGRESS_KEYS)
+    bill_type = _find_text(fields, _BILL_TYPE_KEYS)
+    bill_number_raw = _find_text(fields, _BILL_NUMBER_KEYS)
 
     if not (congress_raw and bill_type and bill_number_raw):
         return None
 
     try:
-        congress = int(congress_raw)
-        bill_number = int(str(bill_number_raw).strip())
+        bill_congress = int(congress_raw)
+        bill_number = int(bill_number_raw)
     except (TypeError, ValueError):
         return None
 
-    bill_type = bill_type.strip().lower()
-    bill_id = f"{congress}-{bill_type}-{bill_number}"
+    bill_type = bill_type.lower()
+    bill_id = f"{bill_congress}-{bill_type}-{bill_number}"
 
     return {
         "bill_id": bill_id,
-        "congress": congress,
+        "congress": bill_congress,
         "bill_type": bill_type,
         "bill_number": bill_number,
-        "update_date": _find_text(root, ["updateDateIncludingText", "updateDate"]),
-        "sponsor": _extract_primary_sponsor(root),
-        "cosponsors": _extract_cosponsors(root),
+        "update_date": _find_text(fields, _UPDATE_DATE_KEYS),
+        "sponsor": sponsor,
+        "cosponsors": cosponsors,
     }
 
 
-def parse_bill_status_file(path: str) -> Optional[Dict[str, Any]]:
+def parse_bill_status_file(path: str, congress: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    # Hand the open file to the streaming parser: it reads in blocks, and a
+    # congress mismatch stops the read after the first one.
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            xml_text = f.read()
+        with open(path, "rb") as f:
+            return _parse_bill_status_stream(f, congress=congress)
     except OSError:
         return None
-    return parse_bill_status_xml(xml_text)
 
 
-def _discover_xml_files(base_dir: str) -> List[str]:
+def _intern_people(parsed: Dict[str, Any]) -> None:
+    """Share one str object per distinct party/state/chamber value."""
+    sponsor = parsed.get("sponsor")
+    if sponsor:
+        for key in _INTERNED_KEYS:
+            if sponsor.get(key):
+                sponsor[key] = sys.intern(sponsor[key])
+    cosponsors = parsed.get("cosponsors")
+    if cosponsors:
+        for key in _INTERNED_KEYS:
+            cosponsors[key] = [sys.intern(v) if v else v for v in cosponsors[key]]
+
+
+def _parse_if_congress(path: str, target: int) -> Optional[Dict[str, Any]]:
+    """Worker: parse one file, returning it only if it belongs to ``target``."""
+    parsed = parse_bill_status_file(path, congress=target)
+    if not parsed or parsed.get("congress") != target or not parsed.get("bill_id"):
+        return None
+    return parsed
+
+
+def _filename_congress(path: str) -> Optional[int]:
+    match = _BILLSTATUS_FILENAME_RE.match(os.path.basename(path))
+    return int(match.group(1)) if match else None
+
+
+def _filter_paths_for_congress(paths: List[str], congress: int) -> List[str]:
+    """Drop files whose govinfo filename already names a different congress."""
+    out: List[str] = []
+    for path in paths:
+        file_congress = _filename_congress(path)
+        if file_congress is None or file_congress == congress:
+            out.append(path)
+    return out
+
+
+# base_dir -> ({directory: st_mtime_ns}, [xml paths]) from the last walk.
+_discovery_cache: Dict[str, Tuple[Dict[str, int], List[str]]] = {}
+
+
+def _dirs_unchanged(dir_mtimes: Dict[str, int]) -> bool:
+    for path, mtime_ns in dir_mtimes.items():
+        try:
+            if os.stat(path).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _discover_xml_files(base_dir: str, sort: bool = True) -> List[str]:
     if not base_dir or not os.path.isdir(base_dir):
         return []
+
+    # Adding/removing an entry bumps its parent directory's mtime, so an
+    # unchanged set of directory mtimes means the listing is still valid.
+    cache_key = os.path.abspath(base_dir)
+    cached = _discovery_cache.get(cache_key)
+    if cached is not None and _dirs_unchanged(cached[0]):
+        files = list(cached[1])
+        if sort:
+            files.sort()
+        return files
+
     files: List[str] = []
-    for root, _, filenames in os.walk(base_dir):
-        for filename in filenames:
-            if filename.lower().endswith(".xml"):
-                files.append(os.path.join(root, filename))
-    files.sort()
+    dir_mtimes: Dict[str, int] = {}
+    # scandir hands back cached d_type info, so no extra stat per entry.
+    stack = [base_dir]
+    while stack:
+        current = stack.pop()
+        try:
+            dir_mtimes[current] = os.stat(current).st_mtime_ns
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            stack.append(entry.path)
+                    elif entry.name.lower().endswith(".xml"):
+                        files.append(entry.path)
+        except OSError:
+            continue
+    _discovery_cache[cache_key] = (dir_mtimes, list(files))
+    if sort:
+        files.sort()
     return files
 
 
+# cron_refresh runs build_stats on a worker thread alongside the IL refresh;
+# forking a multithreaded process can hand the children held locks, so the
+# parse workers start from a clean interpreter instead.
+_POOL_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
 def load_bulk_bill_status(
     congress: int,
     base_dir: str,
-    max_workers: int = 4,
+    max_workers: Optional[int] = 4,
 ) -> Dict[str, Dict[str, Any]]:
     """
     Load Bill Status bulk XML files for a target congress.
     Returns mapping: bill_id -> parsed bill payload.
+
+    Parsing is CPU-bound Python work, so files are fanned out across worker
+    processes rather than threads.
     """
-    paths = _discover_xml_files(base_dir)
+    paths = _filter_paths_for_congress(_discover_xml_files(base_dir, sort=False), congress)
     if not paths:
         return {}
 
     out: Dict[str, Dict[str, Any]] = {}
-    with ThreadPoolExecutor(max_workers=max_workers) as pool:
-        futs = {pool.submit(parse_bill_status_file, path): path for path in paths}
-        for fut in as_completed(futs):
-            parsed = fut.result()
-            if not parsed:
-                continue
-            if parsed.get("congress") != congress:
-                continue
-            bill_id = parsed.get("bill_id")
-            if not bill_id:
-                continue
-            out[bill_id] = parsed
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(), mp_context=_POOL_CONTEXT) as pool:
+        for parsed in pool.map(
+            _parse_if_congress, paths, repeat(congress), chunksize=_PARSE_CHUNKSIZE
+        ):
+            if parsed:
+                # Results are unpickled as fresh strings, so intern on this side.
+                _intern_people(parsed)
+                out[parsed["bill_id"]] = parsed
     return out
 
@@ -3,21 +3,21 @@ Nightly refresh script for Congress and Illinois stats.
 Intended to be run by a scheduler (e.g., Render cron job).
 """
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from main import build_stats, save_cache, DEFAULT_CONGRESS, DEFAULT_IL_SESSION
 from illinois_stats import build_il_stats, save_il_cache
 from govinfo_bulk_sync import sync_billstatus_bulk, DEFAULT_BULK_JSON_ROOT
+from database import checkpoint_wal
+
+
+# A comma-separated entry that is a whole integer (surrounding whitespace allowed).
+_INT_ENTRY_RE = re.compile(r"(?:^|,)\s*([+-]?\d+)\s*(?=,|$)")
 
 
 def _parse_int_list(value: str) -> list[int]:
-    items = [v.strip() for v in (value or "").split(",") if v.strip()]
-    out = []
-    for item in items:
-        try:
-            out.append(int(item))
-        except ValueError:
-            continue
-    return out
+    return [int(m) for m in _INT_ENTRY_RE.findall(value or "")]
 
 
 def main() -> None:
@@ -40,8 +40,9 @@ def main() -> None:
     bulk_dir = os.environ.get("BILL_STATUS_BULK_DIR", "").strip()
     bulk_root = os.environ.get("GOVINFO_BULK_JSON_ROOT", "")
 
-    for congress in congress_list:
-        if sync_bulk and bulk_dir:
+    # Bulk syncs share one manifest database under bulk_dir, so run them serially first.
+    if sync_bulk and bulk_dir:
+        for congress in congress_list:
             sync_summary = sync_billstatus_bulk(
                 congress=congress,
                 dest_dir=bulk_dir,
@@ -53,6 +54,8 @@ def main() -> None:
                 root_json_url=bulk_root or DEFAULT_BULK_JSON_ROOT,
             )
             print(f"[cron] Billstatus sync summary: {sync_summary}", flush=True)
+
+    def refresh_congress(congress: int) -> None:
         stats = build_stats(
             congress,
             api_key=api_key,
@@ -61,10 +64,33 @@ def main() -> None:
         )
         save_cache(congress, stats)
 
-    for session in il_list:
+    def refresh_il(session: int) -> None:
         stats = build_il_stats(session)
         save_il_cache(session, stats)
 
+    # The refreshes are independent and mostly wait on HTTP, so overlap them.
+    # Their saves share one SQLite file; database.py's writer lock, which
+    # illinois_database also takes, keeps those writes serial.
+    tasks = [("Congress", c, refresh_congress) for c in congress_list]
+    tasks += [("IL session", s, refresh_il) for s in il_list]
+    first_error = None
+    with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+        futs = {pool.submit(fn, arg): (label, arg) for label, arg, fn in tasks}
+        for fut in as_completed(futs):
+            label, arg = futs[fut]
+            try:
+                fut.result()
+            except Exception as e:
+                print(f"[cron] {label} {arg} refresh failed: {e}", flush=True)
+                if first_error is None:
+                    first_error = e
+            else:
+                print(f"[cron] {label} {arg} refresh complete", flush=True)
+    # Leave a compact database file behind after the nightly writes.
+    checkpoint_wal()
+    if first_error is not None:
+        raise first_error
+
 
 if __name__ == "__main__":
     main()
@@ -6,117 +6,407 @@ import os
 import sqlite3
 import json
 import time
+import atexit
+import queue
+import threading
+import urllib.parse
 from typing import Dict, Any, List, Optional
 from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain, islice
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional accelerator
+    zstandard = None
 
 # Database path - can be overridden via environment variable
 DB_PATH = os.environ.get("DATABASE_PATH", os.path.join(os.path.dirname(__file__), "congress_stats.db"))
+# Idle read-only connections kept around between calls
+DB_READ_POOL_SIZE = int(os.environ.get("DB_READ_POOL_SIZE", "4"))
+
+
+# Per-connection tuning. WAL itself is persisted in the file by init_database().
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=5000",
+    # Checkpoint every ~40MB of WAL instead of the 1000-page default, so bulk
+    # ingests are not interrupted by frequent small checkpoints.
+    "PRAGMA wal_autocheckpoint=10000",
+)
+
+# Large batch saves shift the planner's statistics; re-run PRAGMA optimize
+# after this many of them (it is a no-op when nothing looks stale).
+_OPTIMIZE_EVERY_BATCHES = 20
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize to JSON text, using orjson (C) when available."""
+    if orjson is not None:
+        # Non-str keys are stringified, matching json.dumps.
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj)
+
+
+def _json_loads(data: Any) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Every zstd frame starts with this magic, which tells compressed stats blobs
+# apart from plain JSON text rows written before compression was enabled.
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_STATS_ZSTD_LEVEL = 3
+
+
+def _encode_stats_blob(stats: Dict[str, Any]) -> Any:
+    """Stats JSON as a zstd-compressed BLOB, or plain TEXT without zstandard."""
+    text = _json_dumps(stats)
+    if zstandard is None:
+        return text
+    return zstandard.ZstdCompressor(level=_STATS_ZSTD_LEVEL).compress(text.encode("utf-8"))
+
+
+def _decode_stats_blob(value: Any) -> Optional[Dict[str, Any]]:
+    if isinstance(value, (bytes, memoryview)):
+        data = bytes(value)
+        if data.startswith(_ZSTD_MAGIC):
+            if zstandard is None:
+                print("[db] Stats cache is zstd-compressed but zstandard is not installed", flush=True)
+                return None
+            data = zstandard.ZstdDecompressor().decompress(data)
+        return _json_loads(data)
+    return _json_loads(value)
+
+
+def _is_memory_db(path: str) -> bool:
+    return path == ":memory:" or path.startswith("file::memory:")
+
+
+def _configure_connection(conn: sqlite3.Connection) -> None:
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+
+
+def _open_connection(readonly: bool = False) -> sqlite3.Connection:
+    # Connections are long-lived, so a larger statement cache lets the hot
+    # save_*/load_* SQL skip re-parsing and re-planning on every call.
+    if readonly and not _is_memory_db(DB_PATH):
+        # Pool readers open the file read-only: they can never take the
+        # write lock, and a stray write fails loudly instead of blocking.
+        uri = f"file:{urllib.parse.quote(os.path.abspath(DB_PATH))}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=256)
+    else:
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False, cached_statements=256)
+    conn.row_factory = sqlite3.Row
+    _configure_connection(conn)
+    return conn
+
+
+# importlib.reload() re-runs this module (tests do, to switch DATABASE_PATH);
+# release the previous module instance's pool before rebuilding it.
+if "close_db_connections" in globals():
+    close_db_connections()
+
+# One shared writer (SQLite allows a single writer anyway) plus a small pool
+# of readers. Connections are opened lazily and reused across calls.
+# illinois_database takes _write_lock for its writes too (same file).
+_write_lock = threading.RLock()
+_write_conn: Optional[sqlite3.Connection] = None
+_read_pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=DB_READ_POOL_SIZE)
+
+# Stored in PRAGMA user_version. Bump it whenever _create_schema() changes so
+# existing databases pick up the new DDL.
+CURRENT_SCHEMA_VERSION = 2
+
+# The schema is applied on first use rather than at import, so processes that
+# never touch the database (CLI helpers, pool workers) skip it entirely.
+_init_lock = threading.Lock()
+_initialized = False
+_batches_since_optimize = 0
+# Nesting depth of bulk_transaction(); only touched while holding _write_lock.
+_bulk_depth = 0
+
+
+def _writer_connection() -> sqlite3.Connection:
+    """Return the shared writer connection; the caller holds _write_lock."""
+    global _write_conn
+    if _write_conn is None:
+        _write_conn = _open_connection()
+    return _write_conn
+
+
+def _maybe_init() -> None:
+    """Run init_database() once per process, on the first connection request."""
+    if _initialized:
+        return
+    with _init_lock:
+        if not _initialized:
+            init_database()
 
 
 @contextmanager
-def get_db_connection():
-    """Context manager for database connections."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+def get_db_connection(readonly: bool = False):
+    """
+    Context manager for database connections.
+    Writers share one connection under a lock; readonly callers borrow
+    from the reader pool. Uncommitted work is rolled back on exit, just as
+    closing a private connection would have discarded it.
+    """
+    _maybe_init()
+    if not readonly:
+        with _write_lock:
+            conn = _writer_connection()
+            try:
+                yield conn
+            finally:
+                # Inside bulk_transaction() the outermost block decides.
+                if conn.in_transaction and not _bulk_depth:
+                    conn.rollback()
+        return
+
+    try:
+        conn = _read_pool.get_nowait()
+    except queue.Empty:
+        conn = _open_connection(readonly=True)
     try:
         yield conn
     finally:
-        conn.close()
+        if conn.in_transaction:
+            conn.rollback()
+        try:
+            _read_pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
 
 
-def init_database():
-    """Initialize the database schema."""
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
+@contextmanager
+def bulk_transaction():
+    """
+    Group several save_*/delete_* calls into one write transaction, so a
+    refresh pays for one commit instead of one per helper:
 
-        # Legislators table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS legislators (
-                bioguide_id TEXT PRIMARY KEY,
-                name TEXT,
-                party TEXT,
-                state TEXT,
-                chamber TEXT,
-                updated_at INTEGER
-            )
-        """)
+        with bulk_transaction():
+            save_legislators_batch(...)
+            save_bills_batch(...)
 
-        # Bills table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS bills (
-                bill_id TEXT PRIMARY KEY,
-                congress INTEGER NOT NULL,
-                bill_type TEXT NOT NULL,
-                bill_number INTEGER NOT NULL,
-                sponsor_bioguide_id TEXT,
-                title TEXT,
-                latest_action_text TEXT,
-                latest_action_date TEXT,
-                update_date TEXT,
-                cosponsors_last_update_date TEXT,
-                cosponsors_updated_at INTEGER,
-                updated_at INTEGER,
-                FOREIGN KEY (sponsor_bioguide_id) REFERENCES legislators(bioguide_id)
-            )
-        """)
+    The writer lock is held throughout; an exception rolls everything back.
+    """
+    global _bulk_depth
+    with get_db_connection() as conn:
+        if not _bulk_depth and not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        _bulk_depth += 1
+        try:
+            yield conn
+        finally:
+            _bulk_depth -= 1
+        if not _bulk_depth:
+            conn.commit()
+
+
+def _commit(conn: sqlite3.Connection) -> None:
+    """Commit unless an enclosing bulk_transaction() will."""
+    if not _bulk_depth:
+        conn.commit()
 
-        # Bill cosponsors table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS bill_cosponsors (
-                bill_id TEXT NOT NULL,
-                congress INTEGER NOT NULL,
-                bioguide_id TEXT NOT NULL,
-                is_original INTEGER DEFAULT 0,
-                withdrawn INTEGER DEFAULT 0,
-                updated_at INTEGER,
-                PRIMARY KEY (bill_id, bioguide_id),
-                FOREIGN KEY (bill_id) REFERENCES bills(bill_id),
-                FOREIGN KEY (bioguide_id) REFERENCES legislators(bioguide_id)
-            )
-        """)
 
-        # Laws table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS laws (
-                law_id TEXT PRIMARY KEY,
-                congress INTEGER NOT NULL,
-                law_type TEXT NOT NULL,
-                law_number TEXT,
-                bill_id TEXT,
-                sponsor_bioguide_id TEXT,
-                updated_at INTEGER,
-                FOREIGN KEY (bill_id) REFERENCES bills(bill_id),
-                FOREIGN KEY (sponsor_bioguide_id) REFERENCES legislators(bioguide_id)
-            )
-        """)
+def close_db_connections() -> None:
+    """Close the pooled connections (called at interpreter exit)."""
+    global _write_conn
+    with _write_lock:
+        if _write_conn is not None:
+            _write_conn.close()
+            _write_conn = None
+    while True:
+        try:
+            _read_pool.get_nowait().close()
+        except queue.Empty:
+            break
 
-        # Cache metadata table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS cache_metadata (
-                congress INTEGER PRIMARY KEY,
-                last_full_refresh INTEGER,
-                total_bills INTEGER,
-                total_laws INTEGER,
-                stats_json TEXT
-            )
-        """)
 
-        # Create indexes for faster queries
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_bills_congress ON bills(congress)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_bills_sponsor ON bills(sponsor_bioguide_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_bill_cosponsors_congress ON bill_cosponsors(congress)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_bill_cosponsors_bioguide ON bill_cosponsors(bioguide_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_laws_congress ON laws(congress)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_laws_sponsor ON laws(sponsor_bioguide_id)")
+atexit.register(close_db_connections)
 
-        conn.commit()
-        print(f"[db] Database initialized at {DB_PATH}", flush=True)
 
-        # Ensure new columns exist in existing databases
-        _ensure_column(cursor, "bills", "update_date", "TEXT")
-        _ensure_column(cursor, "bills", "cosponsors_last_update_date", "TEXT")
-        _ensure_column(cursor, "bills", "cosponsors_updated_at", "INTEGER")
-        conn.commit()
+def init_database():
+    """Initialize the database schema (idempotent)."""
+    global _initialized
+    # Uses the writer connection directly: get_db_connection() calls back
+    # into here on first use.
+    with _write_lock:
+        conn = _writer_connection()
+        try:
+            _apply_schema(conn)
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+    _initialized = True
+    print(f"[db] Database initialized at {DB_PATH}", flush=True)
+
+
+def _apply_schema(conn: sqlite3.Connection) -> None:
+    cursor = conn.cursor()
+
+    # WAL lets readers run alongside the writer and, with synchronous=NORMAL,
+    # avoids an fsync per commit. The mode sticks to the database file.
+    if not _is_memory_db(DB_PATH):
+        cursor.execute("PRAGMA journal_mode=WAL")
+
+    # A database already at the current version needs none of the DDL or
+    # PRAGMA table_info introspection below.
+    cursor.execute("PRAGMA user_version")
+    if cursor.fetchone()[0] < CURRENT_SCHEMA_VERSION:
+        _create_schema(conn)
+
+    # Give the planner statistics for the composite indexes once; after
+    # that, PRAGMA optimize only re-analyzes when it looks worthwhile.
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+    if cursor.fetchone() is None:
+        cursor.execute("ANALYZE")
+    else:
+        cursor.execute("PRAGMA optimize")
+    conn.commit()
+
+
+def _create_schema(conn: sqlite3.Connection) -> None:
+    """Create tables and indexes and migrate older layouts."""
+    cursor = conn.cursor()
+
+    # Apply the whole schema (tables, indexes, column migrations) atomically.
+    cursor.execute("BEGIN IMMEDIATE")
+
+    # Legislators table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS legislators (
+            bioguide_id TEXT PRIMARY KEY,
+            name TEXT,
+            party TEXT,
+            state TEXT,
+            chamber TEXT,
+            updated_at INTEGER
+        )
+    """)
+
+    # Bills table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS bills (
+            bill_id TEXT PRIMARY KEY,
+            congress INTEGER NOT NULL,
+            bill_type TEXT NOT NULL,
+            bill_number INTEGER NOT NULL,
+            sponsor_bioguide_id TEXT,
+            title TEXT,
+            latest_action_text TEXT,
+            latest_action_date TEXT,
+            update_date TEXT,
+            cosponsors_last_update_date TEXT,
+            cosponsors_updated_at INTEGER,
+            updated_at INTEGER,
+            FOREIGN KEY (sponsor_bioguide_id) REFERENCES legislators(bioguide_id)
+        )
+    """)
+
+    # Bill cosponsors table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS bill_cosponsors (
+            bill_id TEXT NOT NULL,
+            congress INTEGER NOT NULL,
+            bioguide_id TEXT NOT NULL,
+            is_original INTEGER DEFAULT 0,
+            withdrawn INTEGER DEFAULT 0,
+            updated_at INTEGER,
+            PRIMARY KEY (bill_id, bioguide_id),
+            FOREIGN KEY (bill_id) REFERENCES bills(bill_id),
+            FOREIGN KEY (bioguide_id) REFERENCES legislators(bioguide_id)
+        )
+    """)
+
+    # Laws table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS laws (
+            law_id TEXT PRIMARY KEY,
+            congress INTEGER NOT NULL,
+            law_type TEXT NOT NULL,
+            law_number TEXT,
+            bill_id TEXT,
+            sponsor_bioguide_id TEXT,
+            updated_at INTEGER,
+            FOREIGN KEY (bill_id) REFERENCES bills(bill_id),
+            FOREIGN KEY (sponsor_bioguide_id) REFERENCES legislators(bioguide_id)
+        )
+    """)
+
+    # Cache metadata table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS cache_metadata (
+            congress INTEGER PRIMARY KEY,
+            last_full_refresh INTEGER,
+            total_bills INTEGER,
+            total_laws INTEGER,
+            stats_json TEXT
+        )
+    """)
+
+    # Create indexes for faster queries. The composite ones cover the
+    # get_stats_from_db join probes, so SQLite answers them from the index
+    # without visiting table rows. Keys stay as the API's natural TEXT ids
+    # (bioguide ids, "118-hr-1"): they are short, and the frontend and cron
+    # jobs address rows by them, so integer surrogates would add a lookup
+    # on every write without shrinking these covering indexes much.
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_bills_cong_sponsor "
+        "ON bills(congress, sponsor_bioguide_id, bill_id)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_cosp_cong_bio "
+        "ON bill_cosponsors(congress, bioguide_id, bill_id, withdrawn, is_original)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_laws_cong_bill "
+        "ON laws(congress, bill_id, law_type, law_id)"
+    )
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_bill_cosponsors_bioguide ON bill_cosponsors(bioguide_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_laws_sponsor ON laws(sponsor_bioguide_id)")
+
+    # Superseded by the composite indexes above (each is a prefix of one,
+    # or has no query left that uses it).
+    cursor.execute("DROP INDEX IF EXISTS idx_bills_congress")
+    cursor.execute("DROP INDEX IF EXISTS idx_bills_sponsor")
+    cursor.execute("DROP INDEX IF EXISTS idx_bill_cosponsors_congress")
+    cursor.execute("DROP INDEX IF EXISTS idx_laws_congress")
+
+    # Ensure new columns exist in existing databases
+    _ensure_column(cursor, "bills", "update_date", "TEXT")
+    _ensure_column(cursor, "bills", "cosponsors_last_update_date", "TEXT")
+    _ensure_column(cursor, "bills", "cosponsors_updated_at", "INTEGER")
+    cursor.execute(f"PRAGMA user_version = {CURRENT_SCHEMA_VERSION}")
+    conn.commit()
+
+
+def _after_batch_write(conn: sqlite3.Connection) -> None:
+    """Count a committed batch save and periodically refresh planner stats."""
+    global _batches_since_optimize
+    _batches_since_optimize += 1
+    if _batches_since_optimize >= _OPTIMIZE_EVERY_BATCHES and not conn.in_transaction:
+        _batches_since_optimize = 0
+        conn.execute("PRAGMA optimize")
+
+
+def checkpoint_wal() -> None:
+    """Fold the WAL back into the main database file and truncate it."""
+    if _is_memory_db(DB_PATH):
+        return
+    with get_db_connection() as conn:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
 
 
 def _ensure_column(cursor: sqlite3.Cursor, table: str, column: str, coltype: str) -> None:
@@ -128,15 +418,194 @@ def _ensure_column(cursor: sqlite3.Cursor, table: str, column: str, coltype: str
     cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {coltype}")
 
 
+# Shared by the single-row helpers, BatchWriter and the *_batch functions.
+# The WHERE clauses leave rows whose data is unchanged untouched, so a
+# re-sync does not rewrite pages or grow the WAL for them (updated_at then
+# records the last actual change).
+_LEGISLATOR_UPSERT_SQL = """
+    INSERT INTO legislators (bioguide_id, name, party, state, chamber, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(bioguide_id) DO UPDATE SET
+        name=excluded.name,
+        party=excluded.party,
+        state=excluded.state,
+        chamber=excluded.chamber,
+        updated_at=excluded.updated_at
+    WHERE (excluded.name, excluded.party, excluded.state, excluded.chamber)
+        IS NOT (legislators.name, legislators.party, legislators.state, legislators.chamber)
+"""
+
+_BILL_UPSERT_SQL = """
+    INSERT INTO bills
+    (bill_id, congress, bill_type, bill_number, sponsor_bioguide_id,
+     title, latest_action_text, latest_action_date, update_date, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(bill_id) DO UPDATE SET
+        congress=excluded.congress,
+        bill_type=excluded.bill_type,
+        bill_number=excluded.bill_number,
+        sponsor_bioguide_id=excluded.sponsor_bioguide_id,
+        title=excluded.title,
+        latest_action_text=excluded.latest_action_text,
+        latest_action_date=excluded.latest_action_date,
+        update_date=excluded.update_date,
+        updated_at=excluded.updated_at
+    WHERE (excluded.sponsor_bioguide_id, excluded.title, excluded.latest_action_text,
+           excluded.latest_action_date, excluded.update_date)
+        IS NOT (bills.sponsor_bioguide_id, bills.title, bills.latest_action_text,
+                bills.latest_action_date, bills.update_date)
+"""
+
+_LAW_UPSERT_SQL = """
+    INSERT INTO laws
+    (law_id, congress, law_type, law_number, bill_id, sponsor_bioguide_id, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(law_id) DO UPDATE SET
+        congress=excluded.congress,
+        law_type=excluded.law_type,
+        law_number=excluded.law_number,
+        bill_id=excluded.bill_id,
+        sponsor_bioguide_id=excluded.sponsor_bioguide_id,
+        updated_at=excluded.updated_at
+    WHERE (excluded.law_number, excluded.bill_id, excluded.sponsor_bioguide_id)
+        IS NOT (laws.law_number, laws.bill_id, laws.sponsor_bioguide_id)
+"""
+
+
+# Bound-parameter cap of SQLite builds before 3.32; newer ones allow more.
+_MAX_SQL_VARIABLES = 999
+
+
+@lru_cache(maxsize=None)
+def _multi_row_sql(sql: str, ncols: int, nrows: int) -> str:
+    """Repeat the VALUES tuple of a single-row INSERT nrows times."""
+    one_row = "(" + ", ".join("?" * ncols) + ")"
+    if "VALUES " + one_row not in sql:
+        raise ValueError(f"expected a single-row VALUES {one_row} clause in: {sql}")
+    return sql.replace("VALUES " + one_row, "VALUES " + ", ".join([one_row] * nrows), 1)
+
+
+def _execute_packed(cursor: sqlite3.Cursor, sql: str, ncols: int, rows) -> int:
+    """
+    Run a single-row INSERT for every row in rows, packing as many rows per
+    statement as the parameter limit allows. Fewer, wider statements mean
+    fewer VDBE resets and Python/C crossings than executemany. The remainder
+    goes through the single-row statement. Returns the number of rows.
+    """
+    per_stmt = _MAX_SQL_VARIABLES // ncols
+    packed_sql = _multi_row_sql(sql, ncols, per_stmt)
+    rows = iter(rows)
+    written = 0
+    while True:
+        batch = list(islice(rows, per_stmt))
+        if len(batch) < per_stmt:
+            break
+        cursor.execute(packed_sql, tuple(chain.from_iterable(batch)))
+        written += per_stmt
+    if batch:
+        cursor.executemany(sql, batch)
+        written += len(batch)
+    return written
+
+
+# Only a handful of bill types exist ("HR", "S", "HJRES", ...), so cache the
+# lower-cased code instead of calling .lower() for every row.
+@lru_cache(maxsize=64)
+def _type_code(raw_type: str) -> str:
+    return raw_type.lower()
+
+
+class BatchWriter:
+    """
+    Buffer single-row legislator/bill/law saves and write them with
+    executemany, committing once per flush instead of once per row.
+
+        with BatchWriter() as w:
+            for ...:
+                w.add_bill(...)
+    """
+
+    def __init__(self, flush_size: int = 1000):
+        self.flush_size = flush_size
+        self._legislators: List[tuple] = []
+        self._bills: List[tuple] = []
+        self._laws: List[tuple] = []
+        # One timestamp per flush; a batch of rows shares its updated_at.
+        self._now = int(time.time())
+
+    def add_legislator(self, bioguide_id: str, name: str, party: str, state: str, chamber: str) -> None:
+        self._legislators.append((bioguide_id, name, party, state, chamber, self._now))
+        self._maybe_flush()
+
+    def add_bill(
+        self,
+        congress: int,
+        bill_type: str,
+        bill_number: int,
+        sponsor_bioguide_id: str,
+        title: str = None,
+        latest_action_text: str = None,
+        latest_action_date: str = None,
+        update_date: str = None,
+    ) -> None:
+        bill_type = _type_code(bill_type)
+        bill_id = f"{congress}-{bill_type}-{bill_number}"
+        self._bills.append((
+            bill_id, congress, bill_type, bill_number, sponsor_bioguide_id,
+            title, latest_action_text, latest_action_date, update_date, self._now,
+        ))
+        self._maybe_flush()
+
+    def add_law(self, congress: int, law_type: str, law_number: str, bill_id: str,
+                sponsor_bioguide_id: str = None) -> None:
+        law_id = f"{congress}-{law_type}-{law_number}"
+        self._laws.append((law_id, congress, law_type, law_number, bill_id, sponsor_bioguide_id, self._now))
+        self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        if len(self._legislators) + len(self._bills) + len(self._laws) >= self.flush_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not (self._legislators or self._bills or self._laws):
+            return
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            # Legislators first so bill/law sponsor references land after them.
+            if self._legislators:
+                cursor.executemany(_LEGISLATOR_UPSERT_SQL, self._legislators)
+            if self._bills:
+                cursor.executemany(_BILL_UPSERT_SQL, self._bills)
+            if self._laws:
+                cursor.executemany(_LAW_UPSERT_SQL, self._laws)
+            _commit(conn)
+        self._legislators.clear()
+        self._bills.clear()
+        self._laws.clear()
+        self._now = int(time.time())
+
+    def __enter__(self) -> "BatchWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
+
+
 def save_legislator(bioguide_id: str, name: str, party: str, state: str, chamber: str):
-    """Save or update a legislator."""
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT OR REPLACE INTO legislators (bioguide_id, name, party, state, chamber, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (bioguide_id, name, party, state, chamber, int(time.time())))
-        conn.commit()
+    """Save or update a legislator. Loops should use BatchWriter instead."""
+    with BatchWriter() as writer:
+        writer.add_legislator(bioguide_id, name, party, state, chamber)
+
+
+def _iter_legislator_rows(legislators: List[Dict[str, Any]], now: int):
+    """Yield _LEGISLATOR_UPSERT_SQL parameter tuples for rows with a bioguideId."""
+    get = dict.get  # unbound lookup, saves a bound-method allocation per call
+    for l in legislators:
+        bioguide_id = get(l, "bioguideId")
+        if bioguide_id:
+            yield (bioguide_id, get(l, "sponsorName") or get(l, "name"), get(l, "party"),
+                   get(l, "state"), get(l, "chamber"), now)
 
 
 def save_legislators_batch(legislators: List[Dict[str, Any]]):
@@ -144,15 +613,8 @@ def save_legislators_batch(legislators: List[Dict[str, Any]]):
     with get_db_connection() as conn:
         cursor = conn.cursor()
         now = int(time.time())
-        cursor.executemany("""
-            INSERT OR REPLACE INTO legislators (bioguide_id, name, party, state, chamber, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, [
-            (l["bioguideId"], l.get("sponsorName") or l.get("name"), l.get("party"),
-             l.get("state"), l.get("chamber"), now)
-            for l in legislators if l.get("bioguideId")
-        ])
-        conn.commit()
+        cursor.executemany(_LEGISLATOR_UPSERT_SQL, _iter_legislator_rows(legislators, now))
+        _commit(conn)
         print(f"[db] Saved {len(legislators)} legislators", flush=True)
 
 
@@ -166,29 +628,41 @@ def save_bill(
     latest_action_date: str = None,
     update_date: str = None,
 ):
-    """Save or update a bill."""
-    bill_id = f"{congress}-{bill_type.lower()}-{bill_number}"
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        now = int(time.time())
-        cursor.execute("""
-            INSERT INTO bills
-            (bill_id, congress, bill_type, bill_number, sponsor_bioguide_id,
-             title, latest_action_text, latest_action_date, update_date, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(bill_id) DO UPDATE SET
-                congress=excluded.congress,
-                bill_type=excluded.bill_type,
-                bill_number=excluded.bill_number,
-                sponsor_bioguide_id=excluded.sponsor_bioguide_id,
-                title=excluded.title,
-                latest_action_text=excluded.latest_action_text,
-                latest_action_date=excluded.latest_action_date,
-                update_date=excluded.update_date,
-                updated_at=excluded.updated_at
-        """, (bill_id, congress, bill_type.lower(), bill_number, sponsor_bioguide_id,
-              title, latest_action_text, latest_action_date, update_date, now))
-        conn.commit()
+    """Save or update a bill. Loops should use BatchWriter instead."""
+    with BatchWriter() as writer:
+        writer.add_bill(
+            congress, bill_type, bill_number, sponsor_bioguide_id,
+            title, latest_action_text, latest_action_date, update_date,
+        )
+
+
+def _iter_bill_rows(congress: int, bills: List[Dict[str, Any]], now: int):
+    """Yield _BILL_UPSERT_SQL parameter tuples, skipping incomplete bills."""
+    cong_str = str(congress)
+    get = dict.get
+    for b in bills:
+        bill_type = _type_code(get(b, "type") or "")
+        bill_number = get(b, "number")
+        if not bill_type or not bill_number:
+            continue
+        bill_id = "-".join((cong_str, bill_type, str(bill_number)))
+        sponsor = get(b, "_sponsor_info") or {}
+        latest = get(b, "latestAction") or {}
+        update_date = (
+            get(b, "_update_date")
+            or get(b, "updateDateIncludingText")
+            or get(b, "updateDate")
+            or get(latest, "actionDate")
+        )
+        yield (
+            bill_id, congress, bill_type, bill_number,
+            get(sponsor, "bioguideId"),
+            get(b, "title"),
+            get(latest, "text"),
+            get(latest, "actionDate"),
+            update_date,
+            now
+        )
 
 
 def save_bills_batch(congress: int, bills: List[Dict[str, Any]]):
@@ -196,49 +670,27 @@ def save_bills_batch(congress: int, bills: List[Dict[str, Any]]):
     with get_db_connection() as conn:
         cursor = conn.cursor()
         now = int(time.time())
-        data = []
-        for b in bills:
-            bill_type = (b.get("type") or "").lower()
-            bill_number = b.get("number")
-            if not bill_type or not bill_number:
-                continue
-            bill_id = f"{congress}-{bill_type}-{bill_number}"
-            sponsor = b.get("_sponsor_info") or {}
-            latest = b.get("latestAction") or {}
-            update_date = (
-                b.get("_update_date")
-                or b.get("updateDateIncludingText")
-                or b.get("updateDate")
-                or latest.get("actionDate")
-            )
-            data.append((
-                bill_id, congress, bill_type, bill_number,
-                sponsor.get("bioguideId"),
-                b.get("title"),
-                latest.get("text"),
-                latest.get("actionDate"),
-                update_date,
-                now
-            ))
-
-        cursor.executemany("""
-            INSERT INTO bills
-            (bill_id, congress, bill_type, bill_number, sponsor_bioguide_id,
-             title, latest_action_text, latest_action_date, update_date, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(bill_id) DO UPDATE SET
-                congress=excluded.congress,
-                bill_type=excluded.bill_type,
-                bill_number=excluded.bill_number,
-                sponsor_bioguide_id=excluded.sponsor_bioguide_id,
-                title=excluded.title,
-                latest_action_text=excluded.latest_action_text,
-                latest_action_date=excluded.latest_action_date,
-                update_date=excluded.update_date,
-                updated_at=excluded.updated_at
-        """, data)
-        conn.commit()
-        print(f"[db] Saved {len(data)} bills for Congress {congress}", flush=True)
+        written = _execute_packed(cursor, _BILL_UPSERT_SQL, 10, _iter_bill_rows(congress, bills, now))
+        _commit(conn)
+        _after_batch_write(conn)
+        print(f"[db] Saved {written} bills for Congress {congress}", flush=True)
+
+
+def _iter_cosponsor_rows(congress: int, cosponsors: List[Dict[str, Any]], now: int):
+    """Yield bill_cosponsors parameter tuples, skipping incomplete records."""
+    for c in cosponsors:
+        bill_id = c.get("bill_id")
+        bioguide_id = c.get("bioguide_id")
+        if not bill_id or not bioguide_id:
+            continue
+        yield (
+            bill_id,
+            congress,
+            bioguide_id,
+            1 if c.get("is_original") else 0,
+            1 if c.get("withdrawn") else 0,
+            now,
+        )
 
 
 def save_bill_cosponsors_batch(congress: int, cosponsors: List[Dict[str, Any]]):
@@ -248,42 +700,49 @@ def save_bill_cosponsors_batch(congress: int, cosponsors: List[Dict[str, Any]]):
     with get_db_connection() as conn:
         cursor = conn.cursor()
         now = int(time.time())
-        data = []
-        for c in cosponsors:
-            bill_id = c.get("bill_id")
-            bioguide_id = c.get("bioguide_id")
-            if not bill_id or not bioguide_id:
-                continue
-            data.append((
-                bill_id,
-                congress,
-                bioguide_id,
-                1 if c.get("is_original") else 0,
-                1 if c.get("withdrawn") else 0,
-                now,
-            ))
-
         cursor.executemany("""
-            INSERT OR REPLACE INTO bill_cosponsors
+            INSERT INTO bill_cosponsors
             (bill_id, congress, bioguide_id, is_original, withdrawn, updated_at)
             VALUES (?, ?, ?, ?, ?, ?)
-        """, data)
-        conn.commit()
-        print(f"[db] Saved {len(data)} bill cosponsors for Congress {congress}", flush=True)
+            ON CONFLICT(bill_id, bioguide_id) DO UPDATE SET
+                congress=excluded.congress,
+                is_original=excluded.is_original,
+                withdrawn=excluded.withdrawn,
+                updated_at=excluded.updated_at
+        """, _iter_cosponsor_rows(congress, cosponsors, now))
+        _commit(conn)
+        _after_batch_write(conn)
+        print(f"[db] Saved {cursor.rowcount} bill cosponsors for Congress {congress}", flush=True)
 
 
 def save_law(congress: int, law_type: str, law_number: str, bill_id: str,
              sponsor_bioguide_id: str = None):
-    """Save or update a law."""
-    law_id = f"{congress}-{law_type}-{law_number}"
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT OR REPLACE INTO laws
-            (law_id, congress, law_type, law_number, bill_id, sponsor_bioguide_id, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (law_id, congress, law_type, law_number, bill_id, sponsor_bioguide_id, int(time.time())))
-        conn.commit()
+    """Save or update a law. Loops should use BatchWriter instead."""
+    with BatchWriter() as writer:
+        writer.add_law(congress, law_type, law_number, bill_id, sponsor_bioguide_id)
+
+
+def _iter_law_rows(congress: int, laws: List[Dict[str, Any]], now: int):
+    """Yield _LAW_UPSERT_SQL parameter tuples, skipping laws without a number."""
+    cong_str = str(congress)
+    get = dict.get
+    for law in laws:
+        law_type = get(law, "_law_type", "public")
+        law_number = get(law, "number")
+        if not law_number:
+            continue
+
+        # Get bill reference
+        bill = get(law, "bill") or law
+        bill_type = _type_code(get(bill, "type") or "")
+        bill_num = get(bill, "number")
+        bill_id = "-".join((cong_str, bill_type, str(bill_num))) if bill_type and bill_num else None
+
+        law_id = "-".join((cong_str, law_type, str(law_number)))
+        yield (
+            law_id, congress, law_type, law_number, bill_id,
+            get(law, "_sponsor_bioguide_id"), now
+        )
 
 
 def save_laws_batch(congress: int, laws: List[Dict[str, Any]]):
@@ -291,64 +750,51 @@ def save_laws_batch(congress: int, laws: List[Dict[str, Any]]):
     with get_db_connection() as conn:
         cursor = conn.cursor()
         now = int(time.time())
-        data = []
-        for law in laws:
-            law_type = law.get("_law_type", "public")
-            law_number = law.get("number")
-            if not law_number:
-                continue
-
-            # Get bill reference
-            bill = law.get("bill") or law
-            bill_type = (bill.get("type") or "").lower()
-            bill_num = bill.get("number")
-            bill_id = f"{congress}-{bill_type}-{bill_num}" if bill_type and bill_num else None
-
-            law_id = f"{congress}-{law_type}-{law_number}"
-            data.append((
-                law_id, congress, law_type, law_number, bill_id,
-                law.get("_sponsor_bioguide_id"), now
-            ))
-
-        cursor.executemany("""
-            INSERT OR REPLACE INTO laws
-            (law_id, congress, law_type, law_number, bill_id, sponsor_bioguide_id, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, data)
-        conn.commit()
-        print(f"[db] Saved {len(data)} laws for Congress {congress}", flush=True)
+        written = _execute_packed(cursor, _LAW_UPSERT_SQL, 7, _iter_law_rows(congress, laws, now))
+        _commit(conn)
+        print(f"[db] Saved {written} laws for Congress {congress}", flush=True)
 
 
 def save_stats_cache(congress: int, stats: Dict[str, Any]):
     """Save computed stats to cache."""
+    # Serialize and compress before taking the writer lock.
+    blob = _encode_stats_blob(stats)
+    summary = stats.get("summary", {})
+    now = int(time.time())
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        summary = stats.get("summary", {})
         cursor.execute("""
-            INSERT OR REPLACE INTO cache_metadata
+            INSERT INTO cache_metadata
             (congress, last_full_refresh, total_bills, total_laws, stats_json)
             VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(congress) DO UPDATE SET
+                last_full_refresh=excluded.last_full_refresh,
+                total_bills=excluded.total_bills,
+                total_laws=excluded.total_laws,
+                stats_json=excluded.stats_json
         """, (
             congress,
-            int(time.time()),
+            now,
             summary.get("total_bills", 0),
             summary.get("total_laws", 0),
-            json.dumps(stats)
+            blob,
         ))
-        conn.commit()
+        _commit(conn)
         print(f"[db] Saved stats cache for Congress {congress}", flush=True)
 
 
 def load_stats_cache(congress: int) -> Optional[Dict[str, Any]]:
     """Load cached stats from database."""
-    with get_db_connection() as conn:
+    with get_db_connection(readonly=True) as conn:
         cursor = conn.cursor()
         cursor.execute("""
             SELECT stats_json, last_full_refresh FROM cache_metadata WHERE congress = ?
         """, (congress,))
         row = cursor.fetchone()
         if row and row["stats_json"]:
-            stats = json.loads(row["stats_json"])
+            stats = _decode_stats_blob(row["stats_json"])
+            if stats is None:
+                return None
             print(f"[db] Loaded stats cache for Congress {congress} (cached at {row['last_full_refresh']})", flush=True)
             return stats
         return None
@@ -356,7 +802,7 @@ def load_stats_cache(congress: int) -> Optional[Dict[str, Any]]:
 
 def get_cache_metadata(congress: int) -> Optional[Dict[str, Any]]:
     """Get cache metadata without the full stats JSON."""
-    with get_db_connection() as conn:
+    with get_db_connection(readonly=True) as conn:
         cursor = conn.cursor()
         cursor.execute("""
             SELECT congress, last_full_refresh, total_bills, total_laws
@@ -375,20 +821,22 @@ def get_cache_metadata(congress: int) -> Optional[Dict[str, Any]]:
 
 def get_bill_cosponsor_refresh_map(congress: int) -> Dict[str, Dict[str, Any]]:
     """Get per-bill cosponsor refresh metadata."""
-    with get_db_connection() as conn:
+    with get_db_connection(readonly=True) as conn:
         cursor = conn.cursor()
+        # Tuple rows for this cursor only; the pooled connection keeps Row.
+        cursor.row_factory = None
         cursor.execute("""
             SELECT bill_id, cosponsors_last_update_date, cosponsors_updated_at
             FROM bills
             WHERE congress = ?
         """, (congress,))
-        out: Dict[str, Dict[str, Any]] = {}
-        for row in cursor.fetchall():
-            out[row["bill_id"]] = {
-                "cosponsors_last_update_date": row["cosponsors_last_update_date"],
-                "cosponsors_updated_at": row["cosponsors_updated_at"],
+        return {
+            bill_id: {
+                "cosponsors_last_update_date": last_update_date,
+                "cosponsors_updated_at": updated_at,
             }
-        return out
+            for bill_id, last_update_date, updated_at in cursor
+        }
 
 
 def mark_bill_cosponsors_refreshed(congress: int, bill_updates: Dict[str, Optional[str]]) -> None:
@@ -398,27 +846,20 @@ def mark_bill_cosponsors_refreshed(congress: int, bill_updates: Dict[str, Option
     now = int(time.time())
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        with_update = []
-        without_update = []
-        for bill_id, update_date in bill_updates.items():
-            if update_date:
-                with_update.append((update_date, now, bill_id, congress))
-            else:
-                without_update.append((now, bill_id, congress))
-
-        if with_update:
-            cursor.executemany("""
-                UPDATE bills
-                SET cosponsors_last_update_date = ?, cosponsors_updated_at = ?
-                WHERE bill_id = ? AND congress = ?
-            """, with_update)
-        if without_update:
-            cursor.executemany("""
-                UPDATE bills
-                SET cosponsors_updated_at = ?
-                WHERE bill_id = ? AND congress = ?
-            """, without_update)
-        conn.commit()
+        # A missing update date keeps the stored one; one statement covers both cases.
+        cursor.executemany("""
+            UPDATE bills
+            SET cosponsors_last_update_date = COALESCE(?, cosponsors_last_update_date),
+                cosponsors_updated_at = ?
+            WHERE bill_id = ? AND congress = ?
+        """, [
+            (update_date or None, now, bill_id, congress)
+            for bill_id, update_date in bill_updates.items()
+        ])
+        _commit(conn)
+
+
+_DELETE_CHUNK_SIZE = 500
 
 
 def delete_bill_cosponsors_for_bills(congress: int, bill_ids: List[str]) -> None:
@@ -427,11 +868,16 @@ def delete_bill_cosponsors_for_bills(congress: int, bill_ids: List[str]) -> None
         return
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        cursor.executemany("""
-            DELETE FROM bill_cosponsors
-            WHERE congress = ? AND bill_id = ?
-        """, [(congress, bill_id) for bill_id in bill_ids])
-        conn.commit()
+        # One IN (...) statement per chunk, all in one transaction; chunks keep
+        # the bound parameters under SQLITE_MAX_VARIABLE_NUMBER.
+        for i in range(0, len(bill_ids), _DELETE_CHUNK_SIZE):
+            chunk = bill_ids[i:i + _DELETE_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(
+                f"DELETE FROM bill_cosponsors WHERE congress = ? AND bill_id IN ({placeholders})",
+                (congress, *chunk),
+            )
+        _commit(conn)
 
 
 def clear_bill_cosponsors_for_congress(congress: int) -> None:
@@ -439,7 +885,63 @@ def clear_bill_cosponsors_for_congress(congress: int) -> None:
     with get_db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("DELETE FROM bill_cosponsors WHERE congress = ?", (congress,))
-        conn.commit()
+        _commit(conn)
+
+
+_STATS_ROWS_SQL = """
+    SELECT
+        l.bioguide_id,
+        l.name as sponsor_name,
+        l.party,
+        l.state,
+        l.chamber,
+        COUNT(DISTINCT b.bill_id) as sponsored_total,
+        COUNT(DISTINCT CASE WHEN bc.withdrawn = 0 THEN bc.bill_id END) as cosponsor_total,
+        COUNT(DISTINCT CASE WHEN bc.withdrawn = 0 AND bc.is_original = 1 THEN bc.bill_id END) as original_cosponsor_total,
+        COUNT(DISTINCT CASE WHEN law.law_type = 'public' THEN law.law_id END) as public_law_count,
+        COUNT(DISTINCT CASE WHEN law.law_type = 'private' THEN law.law_id END) as private_law_count,
+        COUNT(DISTINCT law.law_id) as enacted_total
+    FROM legislators l
+    LEFT JOIN bills b ON l.bioguide_id = b.sponsor_bioguide_id AND b.congress = ?
+    LEFT JOIN bill_cosponsors bc ON l.bioguide_id = bc.bioguide_id AND bc.congress = ?
+    LEFT JOIN laws law ON b.bill_id = law.bill_id AND law.congress = ?
+    GROUP BY l.bioguide_id
+    HAVING sponsored_total > 0 OR cosponsor_total > 0 OR original_cosponsor_total > 0
+    ORDER BY sponsored_total DESC, sponsor_name ASC
+"""
+
+
+def _iter_stats_rows(cursor: sqlite3.Cursor, congress: int):
+    """Yield per-legislator stat dicts straight off the cursor."""
+    # Plain tuples: unpacking by position skips sqlite3.Row's name lookups.
+    cursor.row_factory = None
+    cursor.execute(_STATS_ROWS_SQL, (congress, congress, congress))
+    for (bioguide_id, sponsor_name, party, state, chamber, sponsored_total,
+         cosponsor_total, original_cosponsor_total, public_law_count,
+         private_law_count, enacted_total) in cursor:
+        yield {
+            "bioguideId": bioguide_id,
+            "sponsorName": sponsor_name,
+            "party": party,
+            "state": state,
+            "chamber": chamber,
+            "sponsored_total": sponsored_total,
+            "primary_sponsor_total": sponsored_total,
+            "cosponsor_total": cosponsor_total,
+            "original_cosponsor_total": original_cosponsor_total,
+            "public_law_count": public_law_count,
+            "private_law_count": private_law_count,
+            "enacted_total": enacted_total,
+        }
+
+
+def iter_stats_from_db(congress: int):
+    """
+    Stream per-legislator stats rows for a congress without materializing
+    the full result set. The reader connection is held until exhausted.
+    """
+    with get_db_connection(readonly=True) as conn:
+        yield from _iter_stats_rows(conn.cursor(), congress)
 
 
 def get_stats_from_db(congress: int) -> Optional[Dict[str, Any]]:
@@ -447,64 +949,25 @@ def get_stats_from_db(congress: int) -> Optional[Dict[str, Any]]:
     Compute stats directly from the database tables.
     Useful when we have the raw data but no cached stats.
     """
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-
+    with get_db_connection(readonly=True) as conn:
         # Get legislator stats with bill and law counts
-        cursor.execute("""
-            SELECT
-                l.bioguide_id,
-                l.name as sponsor_name,
-                l.party,
-                l.state,
-                l.chamber,
-                COUNT(DISTINCT b.bill_id) as sponsored_total,
-                COUNT(DISTINCT CASE WHEN bc.withdrawn = 0 THEN bc.bill_id END) as cosponsor_total,
-                COUNT(DISTINCT CASE WHEN bc.withdrawn = 0 AND bc.is_original = 1 THEN bc.bill_id END) as original_cosponsor_total,
-                COUNT(DISTINCT CASE WHEN law.law_type = 'public' THEN law.law_id END) as public_law_count,
-                COUNT(DISTINCT CASE WHEN law.law_type = 'private' THEN law.law_id END) as private_law_count,
-                COUNT(DISTINCT law.law_id) as enacted_total
-            FROM legislators l
-            LEFT JOIN bills b ON l.bioguide_id = b.sponsor_bioguide_id AND b.congress = ?
-            LEFT JOIN bill_cosponsors bc ON l.bioguide_id = bc.bioguide_id AND bc.congress = ?
-            LEFT JOIN laws law ON b.bill_id = law.bill_id AND law.congress = ?
-            GROUP BY l.bioguide_id
-            HAVING sponsored_total > 0 OR cosponsor_total > 0 OR original_cosponsor_total > 0
-            ORDER BY sponsored_total DESC, sponsor_name ASC
-        """, (congress, congress, congress))
-
-        rows = []
-        for row in cursor.fetchall():
-            rows.append({
-                "bioguideId": row["bioguide_id"],
-                "sponsorName": row["sponsor_name"],
-                "party": row["party"],
-                "state": row["state"],
-                "chamber": row["chamber"],
-                "sponsored_total": row["sponsored_total"],
-                "primary_sponsor_total": row["sponsored_total"],
-                "cosponsor_total": row["cosponsor_total"],
-                "original_cosponsor_total": row["original_cosponsor_total"],
-                "public_law_count": row["public_law_count"],
-                "private_law_count": row["private_law_count"],
-                "enacted_total": row["enacted_total"],
-            })
+        rows = list(_iter_stats_rows(conn.cursor(), congress))
+        cursor = conn.cursor()
 
         if not rows:
             return None
 
-        # Get totals
-        cursor.execute("SELECT COUNT(*) FROM bills WHERE congress = ?", (congress,))
-        total_bills = cursor.fetchone()[0]
-
-        cursor.execute("SELECT COUNT(*) FROM laws WHERE congress = ?", (congress,))
-        total_laws = cursor.fetchone()[0]
-
-        cursor.execute("SELECT COUNT(*) FROM laws WHERE congress = ? AND law_type = 'public'", (congress,))
-        public_laws = cursor.fetchone()[0]
-
-        cursor.execute("SELECT COUNT(*) FROM laws WHERE congress = ? AND law_type = 'private'", (congress,))
-        private_laws = cursor.fetchone()[0]
+        # Get totals in one round trip; the law breakdown is a single scan.
+        cursor.execute("""
+            SELECT
+                (SELECT COUNT(*) FROM bills WHERE congress = ?),
+                COUNT(*),
+                COALESCE(SUM(law_type = 'public'), 0),
+                COALESCE(SUM(law_type = 'private'), 0)
+            FROM laws
+            WHERE congress = ?
+        """, (congress, congress))
+        total_bills, total_laws, public_laws, private_laws = cursor.fetchone()
 
         return {
             "congress": congress,
@@ -525,13 +988,12 @@ def clear_congress_data(congress: int):
     """Clear all data for a specific congress."""
     with get_db_connection() as conn:
         cursor = conn.cursor()
+        if not conn.in_transaction:
+            cursor.execute("BEGIN IMMEDIATE")
         cursor.execute("DELETE FROM laws WHERE congress = ?", (congress,))
         cursor.execute("DELETE FROM bill_cosponsors WHERE congress = ?", (congress,))
         cursor.execute("DELETE FROM bills WHERE congress = ?", (congress,))
         cursor.execute("DELETE FROM cache_metadata WHERE congress = ?", (congress,))
-        conn.commit()
+        _commit(conn)
         print(f"[db] Cleared data for Congress {congress}", flush=True)
 
-
-# Initialize database on module import
-init_database()
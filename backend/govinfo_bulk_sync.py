@@ -3,15 +3,27 @@ Sync helpers for GovInfo Bill Status bulk XML data.
 """
 import json
 import os
+import re
+import shutil
+import sqlite3
+import tempfile
+import time
 import zipfile
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass
-from io import BytesIO
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse, urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
 
 DEFAULT_BULK_JSON_ROOT = "https://www.govinfo.gov/bulkdata/json/BILLSTATUS"
 
@@ -30,15 +42,23 @@ def _headers(api_key: Optional[str]) -> Dict[str, str]:
     return {"Accept": "application/json", "X-Api-Key": api_key}
 
 
+@lru_cache(maxsize=4096)
+def _dir_base(base_url: str) -> str:
+    return base_url.rstrip("/") + "/"
+
+
 def _norm_url(base_url: str, maybe_url: str) -> Optional[str]:
     if not maybe_url:
         return None
+    # GovInfo listings almost always carry absolute links; skip urljoin.
+    if isinstance(maybe_url, str) and maybe_url.startswith(("http://", "https://")):
+        return maybe_url.strip()
     maybe_url = str(maybe_url).strip()
     if not maybe_url:
         return None
-    if maybe_url.startswith("http://") or maybe_url.startswith("https://"):
+    if maybe_url.startswith(("http://", "https://")):
         return maybe_url
-    return urljoin(base_url.rstrip("/") + "/", maybe_url)
+    return urljoin(_dir_base(base_url), maybe_url)
 
 
 def _as_bool(value: Any) -> Optional[bool]:
@@ -54,10 +74,10 @@ def _as_bool(value: Any) -> Optional[bool]:
 
 
 def _is_file_url(url: str) -> bool:
-    lower = url.lower()
-    return lower.endswith(".xml") or lower.endswith(".zip")
+    return url.lower().endswith((".xml", ".zip"))
 
 
+@lru_cache(maxsize=4096)
 def _to_json_listing_url(url: str) -> str:
     """
     Convert GovInfo bulk directory URLs into JSON index URLs.
@@ -104,82 +124,155 @@ def _extract_links(node: Dict[str, Any]) -> List[str]:
     return links
 
 
+_BILLSTATUS_MARKER_RE = re.compile(r"/BILLSTATUS/", re.IGNORECASE)
+
+
 def _billstatus_relative_path(file_url: str) -> str:
-    path = urlparse(file_url).path
-    marker = "/BILLSTATUS/"
-    idx = path.upper().find(marker)
-    if idx >= 0:
-        return path[idx + len(marker):].lstrip("/")
-    return os.path.basename(path)
+    # Slice the URL string directly; only the rare marker-less URL needs
+    # urlparse's full parse.
+    path = file_url.split("?", 1)[0].split("#", 1)[0]
+    m = _BILLSTATUS_MARKER_RE.search(path)
+    if m:
+        return path[m.end():].lstrip("/")
+    return os.path.basename(urlparse(file_url).path)
 
 
-def discover_billstatus_files(
+# Concurrent listing requests during discovery; the walk is latency-bound.
+DISCOVERY_WORKERS = 16
+
+
+def _new_session(pool_size: int = DISCOVERY_WORKERS) -> requests.Session:
+    """Session whose connection pool is large enough for the worker threads."""
+    sess = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    sess.mount("https://", adapter)
+    sess.mount("http://", adapter)
+    return sess
+
+
+def _fetch_listing(sess: requests.Session, url: str, api_key: Optional[str]) -> Any:
+    """GET one JSON directory listing; None on any failure."""
+    try:
+        resp = sess.get(url, headers=_headers(api_key), timeout=(10, 30))
+        if resp.status_code != 200:
+            return None
+        return resp.json()
+    except (RequestException, ValueError):
+        return None
+
+
+def _scan_listing(current: str, payload: Any, files: Dict[str, RemoteFile]) -> List[str]:
+    """Record file entries of one listing in files; return its subdirectory URLs."""
+    subdirs: List[str] = []
+    for node in _extract_nodes(payload):
+        explicit_dir = None
+        for key in ("isDirectory", "directory", "isDir", "dir", "folder", "isFolder"):
+            if key in node:
+                explicit_dir = _as_bool(node.get(key))
+                if explicit_dir is not None:
+                    break
+
+        typ = str(node.get("type") or "").lower()
+        if typ in ("directory", "dir", "folder"):
+            explicit_dir = True
+        elif typ in ("file",):
+            explicit_dir = False
+
+        links = _extract_links(node)
+        if not links:
+            continue
+
+        for raw_link in links:
+            full_url = _norm_url(current, raw_link)
+            if not full_url:
+                continue
+
+            if _is_file_url(full_url):
+                rel = _billstatus_relative_path(full_url)
+                files[full_url] = RemoteFile(
+                    url=full_url,
+                    relative_path=rel,
+                    modified=_extract_modified(node),
+                )
+                continue
+
+            is_dir = explicit_dir if explicit_dir is not None else full_url.endswith("/")
+            if is_dir:
+                subdirs.append(full_url)
+    return subdirs
+
+
+def iter_billstatus_listings(
     congress: int,
     api_key: Optional[str] = None,
     root_json_url: str = DEFAULT_BULK_JSON_ROOT,
     session: Optional[requests.Session] = None,
-) -> List[RemoteFile]:
+    max_workers: int = DISCOVERY_WORKERS,
+) -> Iterator[List[RemoteFile]]:
     """
-    Discover Bill Status XML/ZIP files for a congress by traversing the GovInfo bulk JSON tree.
+    Yield the Bill Status XML/ZIP files of each GovInfo bulk JSON listing for
+    a congress, one list per listing, as the tree is traversed so callers can
+    start downloading before the walk ends. Listings are fetched concurrently;
+    results are merged on the calling thread.
     """
-    sess = session or requests.Session()
+    sess = session or _new_session(max_workers)
     start_url = f"{root_json_url.rstrip('/')}/{congress}"
-    pending = [start_url]
     seen = set()
-    files: Dict[str, RemoteFile] = {}
-
-    while pending:
-        current = pending.pop()
-        current = _to_json_listing_url(current)
-        if current in seen:
-            continue
-        seen.add(current)
-
-        try:
-            resp = sess.get(current, headers=_headers(api_key), timeout=(10, 30))
-            if resp.status_code != 200:
-                continue
-            payload = resp.json()
-        except (RequestException, ValueError):
-            continue
-
-        for node in _extract_nodes(payload):
-            explicit_dir = None
-            for key in ("isDirectory", "directory", "isDir", "dir", "folder", "isFolder"):
-                if key in node:
-                    explicit_dir = _as_bool(node.get(key))
-                    if explicit_dir is not None:
-                        break
-
-            typ = str(node.get("type") or "").lower()
-            if typ in ("directory", "dir", "folder"):
-                explicit_dir = True
-            elif typ in ("file",):
-                explicit_dir = False
-
-            links = _extract_links(node)
-            if not links:
-                continue
-
-            for raw_link in links:
-                full_url = _norm_url(current, raw_link)
-                if not full_url:
+    yielded = set()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        in_flight: Dict[Future, str] = {}
+
+        def submit(url: str) -> None:
+            url = _to_json_listing_url(url)
+            if url in seen:
+                return
+            seen.add(url)
+            in_flight[pool.submit(_fetch_listing, sess, url, api_key)] = url
+
+        submit(start_url)
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for fut in done:
+                current = in_flight.pop(fut)
+                payload = fut.result()
+                if payload is None:
                     continue
+                listing_files: Dict[str, RemoteFile] = {}
+                for subdir in _scan_listing(current, payload, listing_files):
+                    submit(subdir)
+                batch = [remote for url, remote in listing_files.items() if url not in yielded]
+                if batch:
+                    yielded.update(remote.url for remote in batch)
+                    yield batch
 
-                if _is_file_url(full_url):
-                    rel = _billstatus_relative_path(full_url)
-                    files[full_url] = RemoteFile(
-                        url=full_url,
-                        relative_path=rel,
-                        modified=_extract_modified(node),
-                    )
-                    continue
 
-                is_dir = explicit_dir if explicit_dir is not None else full_url.endswith("/")
-                if is_dir:
-                    pending.append(full_url)
+def iter_billstatus_files(
+    congress: int,
+    api_key: Optional[str] = None,
+    root_json_url: str = DEFAULT_BULK_JSON_ROOT,
+    session: Optional[requests.Session] = None,
+    max_workers: int = DISCOVERY_WORKERS,
+) -> Iterator[RemoteFile]:
+    """
+    Yield Bill Status XML/ZIP files for a congress as the GovInfo bulk JSON
+    tree is traversed.
+    """
+    for batch in iter_billstatus_listings(congress, api_key, root_json_url, session, max_workers):
+        yield from batch
+
 
-    return list(files.values())
+def discover_billstatus_files(
+    congress: int,
+    api_key: Optional[str] = None,
+    root_json_url: str = DEFAULT_BULK_JSON_ROOT,
+    session: Optional[requests.Session] = None,
+    max_workers: int = DISCOVERY_WORKERS,
+) -> List[RemoteFile]:
+    """
+    Discover Bill Status XML/ZIP files for a congress by traversing the GovInfo bulk JSON tree.
+    """
+    return list(iter_billstatus_files(congress, api_key, root_json_url, session, max_workers))
 
 
 def _manifest_path(dest_dir: str) -> str:
@@ -191,122 +284,295 @@ def _load_manifest(dest_dir: str) -> Dict[str, Dict[str, Any]]:
     if not os.path.exists(fp):
         return {}
     try:
-        with open(fp, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            if isinstance(data, dict):
-                return data
+        if orjson is not None:
+            with open(fp, "rb") as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(fp, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        if isinstance(data, dict):
+            return data
     except Exception:
         pass
     return {}
 
 
-def _save_manifest(dest_dir: str, manifest: Dict[str, Dict[str, Any]]) -> None:
+_MANIFEST_FIELDS = ("source_url", "modified", "etag", "last_modified")
+# Keep IN (...) lists under SQLite's bound-parameter limit.
+_MANIFEST_LOOKUP_CHUNK = 500
+# Commit manifest updates every this many synced files.
+_MANIFEST_COMMIT_EVERY = 200
+
+
+def _manifest_db_path(dest_dir: str) -> str:
+    return os.path.join(dest_dir, ".billstatus_manifest.sqlite")
+
+
+def _open_manifest(dest_dir: str) -> sqlite3.Connection:
+    """
+    Open the per-directory manifest database, importing (and removing) the
+    JSON manifest written by earlier versions on first use.
+    """
     os.makedirs(dest_dir, exist_ok=True)
-    fp = _manifest_path(dest_dir)
-    tmp = fp + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(manifest, f, indent=2, sort_keys=True)
-    os.replace(tmp, fp)
+    conn = sqlite3.connect(_manifest_db_path(dest_dir))
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS billstatus_manifest (
+            rel_path TEXT PRIMARY KEY,
+            source_url TEXT,
+            modified TEXT,
+            etag TEXT,
+            last_modified TEXT,
+            synced_at INTEGER
+        )
+    """)
+    legacy = _load_manifest(dest_dir)
+    if legacy:
+        _save_manifest_entries(conn, legacy)
+    conn.commit()
+    if os.path.exists(_manifest_path(dest_dir)):
+        os.remove(_manifest_path(dest_dir))
+    return conn
+
+
+def _load_manifest_entries(conn: sqlite3.Connection, rel_paths: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch the stored manifest entries for rel_paths."""
+    out: Dict[str, Dict[str, Any]] = {}
+    for i in range(0, len(rel_paths), _MANIFEST_LOOKUP_CHUNK):
+        chunk = rel_paths[i:i + _MANIFEST_LOOKUP_CHUNK]
+        placeholders = ",".join("?" * len(chunk))
+        cursor = conn.execute(
+            f"SELECT rel_path, {', '.join(_MANIFEST_FIELDS)} FROM billstatus_manifest "
+            f"WHERE rel_path IN ({placeholders})",
+            chunk,
+        )
+        for rel_path, *values in cursor:
+            out[rel_path] = dict(zip(_MANIFEST_FIELDS, values))
+    return out
+
+
+def _save_manifest_entries(conn: sqlite3.Connection, entries: Dict[str, Dict[str, Any]]) -> None:
+    """Upsert manifest entries; the caller commits."""
+    now = int(time.time())
+    conn.executemany(
+        """
+        INSERT INTO billstatus_manifest
+        (rel_path, source_url, modified, etag, last_modified, synced_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT(rel_path) DO UPDATE SET
+            source_url=excluded.source_url,
+            modified=excluded.modified,
+            etag=excluded.etag,
+            last_modified=excluded.last_modified,
+            synced_at=excluded.synced_at
+        """,
+        (
+            (rel_path, *(entry.get(field) for field in _MANIFEST_FIELDS), now)
+            for rel_path, entry in entries.items()
+        ),
+    )
 
 
-def _download_bytes(url: str, api_key: Optional[str], session: requests.Session) -> Optional[bytes]:
-    try:
-        resp = session.get(url, headers=_headers(api_key), timeout=(10, 60))
-        if resp.status_code != 200:
-            return None
-        return resp.content
-    except RequestException:
-        return None
+# Buffer size for streaming ZIP members and downloads to disk.
+_COPY_CHUNK = 1 << 20
+
 
+def _download_to(
+    url: str,
+    path: str,
+    api_key: Optional[str],
+    session: requests.Session,
+    validators: Optional[Dict[str, Any]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Stream url straight to path (via a temp file and rename), so memory use
+    stays at one chunk regardless of file size.
 
-def _write_bytes(path: str, data: bytes) -> None:
-    os.makedirs(os.path.dirname(path), exist_ok=True)
+    validators holds the etag/last_modified stored for a previous download;
+    they are sent as a conditional GET. Returns {"not_modified": True} on a
+    304, the new validators after a download, or None on failure.
+    """
+    headers = _headers(api_key)
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
     tmp = path + ".tmp"
-    with open(tmp, "wb") as f:
-        f.write(data)
-    os.replace(tmp, path)
+    try:
+        with session.get(url, headers=headers, stream=True, timeout=(10, 60)) as resp:
+            if resp.status_code == 304:
+                return {"not_modified": True}
+            if resp.status_code != 200:
+                return None
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp, "wb") as f:
+                # iter_content (unlike resp.raw) undoes any Content-Encoding.
+                for chunk in resp.iter_content(_COPY_CHUNK):
+                    f.write(chunk)
+            result = {
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+            }
+        os.replace(tmp, path)
+        return result
+    except (RequestException, OSError):
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        return None
 
 
-def _write_zip_xmls(dest_dir: str, rel_path: str, zip_bytes: bytes) -> List[str]:
+def _write_zip_xmls(dest_dir: str, rel_path: str, zip_path: str) -> List[str]:
     """
-    Extract XML files from a downloaded ZIP and write them under dest_dir.
+    Extract XML files from a downloaded ZIP file and write them under dest_dir.
+    Members are streamed to disk in bounded chunks rather than read whole.
     Returns relative paths written.
     """
     written: List[str] = []
-    with zipfile.ZipFile(BytesIO(zip_bytes)) as zf:
+    made_dirs = set()
+    with zipfile.ZipFile(zip_path) as zf:
         for name in zf.namelist():
             if not name.lower().endswith(".xml"):
                 continue
             rel = os.path.join(os.path.dirname(rel_path), os.path.basename(name))
             target = os.path.join(dest_dir, rel)
-            data = zf.read(name)
-            _write_bytes(target, data)
+            target_dir = os.path.dirname(target)
+            if target_dir not in made_dirs:
+                os.makedirs(target_dir, exist_ok=True)
+                made_dirs.add(target_dir)
+            tmp = target + ".tmp"
+            with zf.open(name) as src, open(tmp, "wb") as dst:
+                shutil.copyfileobj(src, dst, _COPY_CHUNK)
+            os.replace(tmp, target)
             written.append(rel)
     return written
 
 
+# Concurrent file downloads; kept modest to stay under GovInfo rate limits.
+DOWNLOAD_WORKERS = 8
+
+
+def _fetch_item(item: RemoteFile, dest_dir: str, api_key: Optional[str],
+                sess: requests.Session, validators: Optional[Dict[str, Any]] = None
+                ) -> Optional[Dict[str, Any]]:
+    """
+    Download one remote file under dest_dir, extracting XML members of ZIPs.
+    Returns _download_to's result plus the relative paths written under
+    "written", {"not_modified": True} if the server answered 304, or None on
+    failure.
+    """
+    try:
+        if item.url.lower().endswith(".zip"):
+            # Download to a scratch file; ZipFile reads members from disk.
+            os.makedirs(dest_dir, exist_ok=True)
+            fd, zip_path = tempfile.mkstemp(suffix=".zip", dir=dest_dir)
+            os.close(fd)
+            try:
+                result = _download_to(item.url, zip_path, api_key, sess, validators)
+                if result is None or result.get("not_modified"):
+                    return result
+                result["written"] = _write_zip_xmls(dest_dir, item.relative_path, zip_path)
+                return result
+            finally:
+                if os.path.exists(zip_path):
+                    os.remove(zip_path)
+        target = os.path.join(dest_dir, item.relative_path)
+        result = _download_to(item.url, target, api_key, sess, validators)
+        if result is not None and not result.get("not_modified"):
+            result["written"] = [item.relative_path]
+        return result
+    except Exception:
+        return None
+
+
 def sync_billstatus_bulk(
     congress: int,
     dest_dir: str,
     api_key: Optional[str] = None,
     root_json_url: str = DEFAULT_BULK_JSON_ROOT,
     session: Optional[requests.Session] = None,
+    max_workers: int = DOWNLOAD_WORKERS,
 ) -> Dict[str, Any]:
     """
     Discover and sync Bill Status XML files to local disk with manifest-based skipping.
     """
-    sess = session or requests.Session()
-    discovered = discover_billstatus_files(
-        congress=congress,
-        api_key=api_key,
-        root_json_url=root_json_url,
-        session=sess,
-    )
-
-    manifest = _load_manifest(dest_dir)
-    next_manifest = dict(manifest)
+    sess = session or _new_session(DISCOVERY_WORKERS + max_workers)
 
+    discovered = 0
     downloaded = 0
     skipped = 0
     failed = 0
 
-    for item in discovered:
-        rel = item.relative_path
-        old = manifest.get(rel) or {}
-        if item.modified and old.get("modified") == item.modified:
-            skipped += 1
-            continue
+    conn = _open_manifest(dest_dir)
 
-        data = _download_bytes(item.url, api_key, sess)
-        if data is None:
+    def record(item: RemoteFile, old: Optional[Dict[str, Any]],
+               result: Optional[Dict[str, Any]]) -> None:
+        nonlocal downloaded, skipped, failed
+        if result is None:
             failed += 1
-            continue
-
-        try:
-            if item.url.lower().endswith(".zip"):
-                written = _write_zip_xmls(dest_dir, rel, data)
-                for rel_xml in written:
-                    next_manifest[rel_xml] = {
-                        "source_url": item.url,
-                        "modified": item.modified,
-                    }
-            else:
-                target = os.path.join(dest_dir, rel)
-                _write_bytes(target, data)
-                next_manifest[rel] = {
-                    "source_url": item.url,
-                    "modified": item.modified,
-                }
-            downloaded += 1
-        except Exception:
-            failed += 1
-            continue
+            return
+        if result.get("not_modified"):
+            # Nothing to write, but remember the listing's timestamp so the
+            # next sync skips this file without a request.
+            old = old or {}
+            _save_manifest_entries(conn, {item.relative_path: {
+                "source_url": item.url,
+                "modified": item.modified,
+                "etag": old.get("etag"),
+                "last_modified": old.get("last_modified"),
+            }})
+            skipped += 1
+            return
+        entry = {
+            "source_url": item.url,
+            "modified": item.modified,
+            "etag": result.get("etag"),
+            "last_modified": result.get("last_modified"),
+        }
+        # ZIPs also get an entry of their own so the next sync can skip
+        # or conditionally fetch the archive itself.
+        updates = {item.relative_path: entry}
+        for rel_path in result["written"]:
+            updates[rel_path] = entry
+        _save_manifest_entries(conn, updates)
+        downloaded += 1
+        if downloaded % _MANIFEST_COMMIT_EVERY == 0:
+            conn.commit()
 
-    _save_manifest(dest_dir, next_manifest)
+    try:
+        # Discovery and downloads form a pipeline: each file is queued for
+        # download as soon as its listing arrives. Downloads run on their own
+        # pool; manifest reads and writes stay on this thread.
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futs: Dict[Future, Tuple[RemoteFile, Optional[Dict[str, Any]]]] = {}
+            for batch in iter_billstatus_listings(
+                congress=congress,
+                api_key=api_key,
+                root_json_url=root_json_url,
+                session=sess,
+            ):
+                discovered += len(batch)
+                stored = _load_manifest_entries(conn, [item.relative_path for item in batch])
+                for item in batch:
+                    old = stored.get(item.relative_path)
+                    if item.modified and (old or {}).get("modified") == item.modified:
+                        skipped += 1
+                        continue
+                    futs[pool.submit(_fetch_item, item, dest_dir, api_key, sess, old)] = (item, old)
+
+                for fut in [f for f in futs if f.done()]:
+                    record(*futs.pop(fut), fut.result())
+
+            for fut in as_completed(futs):
+                record(*futs[fut], fut.result())
+        conn.commit()
+    finally:
+        conn.close()
 
     return {
         "congress": congress,
-        "discovered": len(discovered),
+        "discovered": discovered,
         "downloaded": downloaded,
         "skipped": skipped,
         "failed": failed,
@@ -3,11 +3,26 @@ SQLite database module for Illinois General Assembly Bill Stats.
 Provides persistent storage for IL legislators, bills, and laws data.
 """
 import os
+import re
 import sqlite3
 import json
 import time
-from typing import Dict, Any, List, Optional
+import atexit
+import threading
+from functools import lru_cache
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+try:
+    from . import database as congress_db
+except ImportError:
+    import database as congress_db
 
 # Database path - uses same database as Congress stats
 DB_PATH = os.environ.get("DATABASE_PATH", os.path.join(os.path.dirname(__file__), "congress_stats.db"))
@@ -17,136 +32,581 @@ NETWORK_VIEW_EDGE_BUNDLING = "edge_bundling"
 NETWORK_VIEWS = {NETWORK_VIEW_NETWORK, NETWORK_VIEW_EDGE_BUNDLING}
 
 
+# Per-connection tuning. WAL itself is persisted in the file by init_il_database().
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+# importlib.reload() re-runs this module (tests do, to switch DATABASE_PATH);
+# close the previous module instance's connections first.
+if "close_il_connections" in globals():
+    close_il_connections()
+
+# One long-lived connection per thread (the IL fetch runs on a thread pool),
+# so the page cache stays warm and nothing reconnects per call.
+_tls = threading.local()
+_all_conns: List[sqlite3.Connection] = []
+_all_conns_lock = threading.Lock()
+
+
+def _get_conn() -> sqlite3.Connection:
+    """Return this thread's connection, opening and tuning it on first use."""
+    conn = getattr(_tls, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        _tls.conn = conn
+        with _all_conns_lock:
+            _all_conns.append(conn)
+    return conn
+
+
+# IL and congress tables share one file, and SQLite allows one writer at a
+# time. IL writes take database.py's writer lock, so a long congress save
+# (or IL import) makes the other side wait here instead of failing with
+# "database is locked" once busy_timeout runs out.
+_write_lock = congress_db._write_lock
+
+# The IL schema is applied on first use rather than at import, so importing
+# this module (main, tests, CLI helpers) never touches the database file.
+_init_lock = threading.Lock()
+_initialized = False
+
+
+def _maybe_init() -> None:
+    """Run init_il_database() once per process, on the first connection request."""
+    if _initialized:
+        return
+    # Writer lock first, always: _write_connection() holds it when it gets here.
+    with _write_lock, _init_lock:
+        if not _initialized:
+            init_il_database()
+
+
 @contextmanager
 def get_db_connection():
-    """Context manager for database connections."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+    """
+    Context manager yielding this thread's connection. It stays open for
+    reuse; uncommitted work is rolled back on exit, as closing it would have.
+    """
+    _maybe_init()
+    conn = _get_conn()
     try:
         yield conn
     finally:
-        conn.close()
+        # Inside an import transaction the outermost block decides.
+        if conn.in_transaction and not _import_depth():
+            conn.rollback()
+
+
+@contextmanager
+def _write_connection():
+    """get_db_connection() for helpers that write; holds the shared writer lock."""
+    _maybe_init()
+    with _write_lock:
+        with get_db_connection() as conn:
+            yield conn
+
+
+def _import_depth() -> int:
+    return getattr(_tls, "import_depth", 0)
+
+
+def _commit(conn: sqlite3.Connection) -> None:
+    """Commit unless an enclosing import transaction will."""
+    if not _import_depth():
+        conn.commit()
+
+
+def begin_il_import() -> None:
+    """
+    Start (or nest into) a write transaction on this thread's connection.
+    Until the matching commit_il_import(), the save_il_* / update_il_bill
+    helpers join it instead of committing row by row.
+    """
+    _maybe_init()
+    conn = _get_conn()
+    depth = _import_depth()
+    if not depth:
+        # Held until the outermost commit/rollback on this thread.
+        _write_lock.acquire()
+        _tls.holds_write_lock = True
+        if not conn.in_transaction:
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+            except BaseException:
+                _release_import_lock()
+                raise
+    _tls.import_depth = depth + 1
+
+
+def _release_import_lock() -> None:
+    if getattr(_tls, "holds_write_lock", False):
+        _tls.holds_write_lock = False
+        _write_lock.release()
+
+
+def commit_il_import() -> None:
+    """Leave the import transaction; the outermost call commits it."""
+    depth = _import_depth() - 1
+    _tls.import_depth = max(depth, 0)
+    if depth <= 0:
+        try:
+            _get_conn().commit()
+        finally:
+            _release_import_lock()
+
+
+def rollback_il_import() -> None:
+    """Abandon the whole import transaction, however deeply nested."""
+    _tls.import_depth = 0
+    try:
+        _get_conn().rollback()
+    finally:
+        _release_import_lock()
+
+
+@contextmanager
+def bulk_transaction():
+    """
+    Group IL writes into one transaction:
+
+        with il_db.bulk_transaction():
+            for bill in bills:
+                il_db.update_il_bill(...)
+
+    An exception rolls everything back.
+    """
+    begin_il_import()
+    try:
+        yield _get_conn()
+    except BaseException:
+        rollback_il_import()
+        raise
+    commit_il_import()
+
+
+def close_il_connections() -> None:
+    """Close every thread's connection (called at interpreter exit)."""
+    with _all_conns_lock:
+        conns = list(_all_conns)
+        _all_conns.clear()
+    for conn in conns:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+
+atexit.register(close_il_connections)
 
 
-def _ensure_table_columns(cursor: sqlite3.Cursor, table: str, columns: Dict[str, str]) -> None:
-    """Ensure a table has the requested columns, adding any that are missing."""
+def _json_dumps(obj: Any) -> str:
+    """Serialize to compact JSON text, using orjson (C) when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _json_loads(data: Any) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _iso_date(value: Optional[str]) -> Optional[str]:
+    """Convert an IL M/D/YYYY date to YYYY-MM-DD; anything else is returned unchanged."""
+    if not value or "/" not in value:
+        return value
+    try:
+        return datetime.strptime(value.strip(), "%m/%d/%Y").strftime("%Y-%m-%d")
+    except ValueError:
+        return value
+
+
+def _ensure_table_columns(cursor: sqlite3.Cursor, table: str, columns: Dict[str, str]) -> List[str]:
+    """Ensure a table has the requested columns, adding any that are missing. Returns the added names."""
     cursor.execute(f"PRAGMA table_info({table})")
     existing = {row[1] for row in cursor.fetchall()}
+    added = []
     for name, col_type in columns.items():
         if name in existing:
             continue
         cursor.execute(f"ALTER TABLE {table} ADD COLUMN {name} {col_type}")
+        added.append(name)
+    return added
 
 
-def init_il_database():
-    """Initialize the Illinois-specific database schema."""
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
+# Stored in il_schema_version rather than PRAGMA user_version, which the
+# congress schema in database.py already owns for this shared file. Bump it
+# whenever _create_il_schema() changes so existing databases pick it up.
+IL_SCHEMA_VERSION = 2
 
-        # IL Legislators table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS il_legislators (
-                member_id TEXT PRIMARY KEY,
-                ga_session INTEGER NOT NULL,
-                chamber TEXT NOT NULL,
-                district INTEGER NOT NULL,
-                name TEXT NOT NULL,
-                first_name TEXT,
-                last_name TEXT,
-                party TEXT,
-                title TEXT,
-                updated_at INTEGER
-            )
-        """)
 
-        # IL Bills table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS il_bills (
-                bill_id TEXT PRIMARY KEY,
-                ga_session INTEGER NOT NULL,
-                bill_type TEXT NOT NULL,
-                bill_number INTEGER NOT NULL,
-                sponsor_member_id TEXT,
-                sponsor_name_raw TEXT,
-                primary_sponsor_name TEXT,
-                chief_co_sponsors TEXT,
-                co_sponsors TEXT,
-                title TEXT,
-                synopsis TEXT,
-                latest_action_text TEXT,
-                latest_action_date TEXT,
-                public_act_number TEXT,
-                updated_at INTEGER,
-                FOREIGN KEY (sponsor_member_id) REFERENCES il_legislators(member_id)
-            )
-        """)
+def _il_schema_version(cursor: sqlite3.Cursor) -> int:
+    try:
+        cursor.execute("SELECT MAX(version) FROM il_schema_version")
+    except sqlite3.OperationalError:
+        return 0
+    return cursor.fetchone()[0] or 0
 
-        # IL Laws table (for enacted bills)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS il_laws (
-                law_id TEXT PRIMARY KEY,
-                ga_session INTEGER NOT NULL,
-                public_act_number TEXT NOT NULL,
-                bill_id TEXT,
-                sponsor_member_id TEXT,
-                effective_date TEXT,
-                updated_at INTEGER,
-                FOREIGN KEY (bill_id) REFERENCES il_bills(bill_id),
-                FOREIGN KEY (sponsor_member_id) REFERENCES il_legislators(member_id)
-            )
-        """)
 
-        # IL Cache metadata
+def init_il_database():
+    """
+    Initialize the Illinois-specific database schema. Runs on the first
+    connection request; a database already at IL_SCHEMA_VERSION costs one query.
+    """
+    global _initialized
+    # Uses the thread's connection directly: get_db_connection() calls back
+    # into here on first use.
+    conn = _get_conn()
+    cursor = conn.cursor()
+    with _write_lock:
+        try:
+            if _il_schema_version(cursor) < IL_SCHEMA_VERSION:
+                # WAL lets readers run alongside the writer; the mode sticks to the file.
+                cursor.execute("PRAGMA journal_mode=WAL")
+
+                # The write lock serializes processes reaching their first
+                # connection together; whoever gets it second sees the new
+                # version and has nothing to do.
+                cursor.execute("BEGIN IMMEDIATE")
+                if _il_schema_version(cursor) < IL_SCHEMA_VERSION:
+                    _create_il_schema(cursor)
+                    conn.commit()
+                    print(f"[il_db] Illinois database tables initialized", flush=True)
+        finally:
+            if conn.in_transaction and not _import_depth():
+                conn.rollback()
+    _initialized = True
+
+
+def _create_il_schema(cursor: sqlite3.Cursor) -> None:
+    """Create or migrate every IL table, index and column, then stamp IL_SCHEMA_VERSION."""
+    # IL Legislators table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS il_legislators (
+            member_id TEXT PRIMARY KEY,
+            ga_session INTEGER NOT NULL,
+            chamber TEXT NOT NULL,
+            district INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            first_name TEXT,
+            last_name TEXT,
+            party TEXT,
+            title TEXT,
+            updated_at INTEGER
+        )
+    """)
+
+    # IL Bills table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS il_bills (
+            bill_id TEXT PRIMARY KEY,
+            ga_session INTEGER NOT NULL,
+            bill_type TEXT NOT NULL,
+            bill_number INTEGER NOT NULL,
+            sponsor_member_id TEXT,
+            sponsor_name_raw TEXT,
+            primary_sponsor_name TEXT,
+            chief_co_sponsors TEXT,
+            co_sponsors TEXT,
+            title TEXT,
+            synopsis TEXT,
+            latest_action_text TEXT,
+            latest_action_date TEXT,
+            public_act_number TEXT,
+            updated_at INTEGER,
+            FOREIGN KEY (sponsor_member_id) REFERENCES il_legislators(member_id)
+        )
+    """)
+
+    # IL Laws table (for enacted bills)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS il_laws (
+            law_id TEXT PRIMARY KEY,
+            ga_session INTEGER NOT NULL,
+            public_act_number TEXT NOT NULL,
+            bill_id TEXT,
+            sponsor_member_id TEXT,
+            effective_date TEXT,
+            updated_at INTEGER,
+            FOREIGN KEY (bill_id) REFERENCES il_bills(bill_id),
+            FOREIGN KEY (sponsor_member_id) REFERENCES il_legislators(member_id)
+        )
+    """)
+
+    # IL Cache metadata
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS il_cache_metadata (
+            ga_session INTEGER PRIMARY KEY,
+            last_full_refresh INTEGER,
+            total_bills INTEGER,
+            total_laws INTEGER,
+            total_members INTEGER,
+            unmatched_sponsors INTEGER,
+            stats_json TEXT
+        )
+    """)
+
+    # Co-sponsors resolved to member ids, one row per (bill, member), so
+    # the co-sponsor network is a GROUP BY instead of JSON parsing and
+    # name matching on every request.
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'il_bill_cosponsors'")
+    cosponsors_existed = cursor.fetchone() is not None
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS il_bill_cosponsors (
+            bill_id TEXT NOT NULL,
+            member_id TEXT NOT NULL,
+            role TEXT NOT NULL CHECK (role IN ('chief', 'co')),
+            PRIMARY KEY (bill_id, member_id)
+        )
+    """)
+
+    # Create indexes for faster queries
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_il_bill_cosponsors_member ON il_bill_cosponsors(member_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_il_bills_session ON il_bills(ga_session)")
+    # Per-session sponsor aggregation (get_il_stats_from_db) is a range scan
+    # on this; it supersedes the old sponsor-only index.
+    cursor.execute("DROP INDEX IF EXISTS idx_il_bills_sponsor")
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_il_bills_session_sponsor ON il_bills(ga_session, sponsor_member_id)"
+    )
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_il_bills_session_pa ON il_bills(ga_session, public_act_number)
+        WHERE public_act_number IS NOT NULL
+    """)
+    # Matches get_pending_bills_for_update's filter term for term
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_il_bills_session_pending ON il_bills(ga_session)
+        WHERE public_act_number IS NULL OR public_act_number = ''
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_il_laws_session ON il_laws(ga_session)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_il_laws_sponsor ON il_laws(sponsor_member_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_il_legislators_session ON il_legislators(ga_session)")
+
+    # Ensure new sponsor role columns exist in existing databases
+    added = _ensure_table_columns(cursor, "il_bills", {
+        "primary_sponsor_name": "TEXT",
+        "chief_co_sponsors": "TEXT",
+        "co_sponsors": "TEXT",
+        "filing_date": "TEXT",
+        "enactment_date": "TEXT",
+        # Sponsor metadata copied from il_legislators so stats need no joins
+        "sponsor_party": "TEXT",
+        "sponsor_chamber": "TEXT",
+        "sponsor_district": "INTEGER",
+        "is_enacted": "INTEGER DEFAULT 0",
+    })
+    if "is_enacted" in added:
         cursor.execute("""
-            CREATE TABLE IF NOT EXISTS il_cache_metadata (
-                ga_session INTEGER PRIMARY KEY,
-                last_full_refresh INTEGER,
-                total_bills INTEGER,
-                total_laws INTEGER,
-                total_members INTEGER,
-                unmatched_sponsors INTEGER,
-                stats_json TEXT
-            )
+            UPDATE il_bills SET
+                is_enacted = (public_act_number IS NOT NULL AND public_act_number != ''),
+                sponsor_party = (SELECT party FROM il_legislators WHERE member_id = sponsor_member_id),
+                sponsor_chamber = (SELECT chamber FROM il_legislators WHERE member_id = sponsor_member_id),
+                sponsor_district = (SELECT district FROM il_legislators WHERE member_id = sponsor_member_id)
         """)
+    # filing_date/enactment_date are stored as YYYY-MM-DD so they sort
+    # and bucket by month in SQL; convert rows written before that.
+    cursor.execute("""
+        SELECT bill_id, filing_date, enactment_date FROM il_bills
+        WHERE filing_date LIKE '%/%' OR enactment_date LIKE '%/%'
+    """)
+    legacy_dates = cursor.fetchall()
+    if legacy_dates:
+        cursor.executemany(
+            "UPDATE il_bills SET filing_date = ?, enactment_date = ? WHERE bill_id = ?",
+            [(_iso_date(row[1]), _iso_date(row[2]), row[0]) for row in legacy_dates],
+        )
+    if not cosponsors_existed:
+        cursor.execute("SELECT DISTINCT ga_session FROM il_bills")
+        for (session,) in cursor.fetchall():
+            _rebuild_session_cosponsors(cursor, session)
+
+    _create_sponsor_stats(cursor)
+
+    cursor.execute("CREATE TABLE IF NOT EXISTS il_schema_version (version INTEGER NOT NULL)")
+    cursor.execute("DELETE FROM il_schema_version")
+    cursor.execute("INSERT INTO il_schema_version (version) VALUES (?)", (IL_SCHEMA_VERSION,))
+
+
+def _create_sponsor_stats(cursor: sqlite3.Cursor) -> None:
+    """Create il_sponsor_stats, its il_bills triggers, and repopulate it."""
+    # Per-sponsor totals kept current by triggers, so get_il_stats_from_db
+    # reads one row per legislator instead of aggregating every bill.
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS il_sponsor_stats (
+            ga_session INTEGER NOT NULL,
+            member_id TEXT NOT NULL,
+            sponsored_total INTEGER NOT NULL DEFAULT 0,
+            enacted_total INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (ga_session, member_id)
+        )
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_il_bills_sponsor_stats_ai
+        AFTER INSERT ON il_bills WHEN NEW.sponsor_member_id IS NOT NULL
+        BEGIN
+            INSERT INTO il_sponsor_stats (ga_session, member_id, sponsored_total, enacted_total)
+            VALUES (NEW.ga_session, NEW.sponsor_member_id, 1, NEW.is_enacted)
+            ON CONFLICT(ga_session, member_id) DO UPDATE SET
+                sponsored_total = sponsored_total + 1,
+                enacted_total = enacted_total + excluded.enacted_total;
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_il_bills_sponsor_stats_ad
+        AFTER DELETE ON il_bills WHEN OLD.sponsor_member_id IS NOT NULL
+        BEGIN
+            UPDATE il_sponsor_stats SET
+                sponsored_total = sponsored_total - 1,
+                enacted_total = enacted_total - OLD.is_enacted
+            WHERE ga_session = OLD.ga_session AND member_id = OLD.sponsor_member_id;
+            DELETE FROM il_sponsor_stats
+            WHERE ga_session = OLD.ga_session AND member_id = OLD.sponsor_member_id
+              AND sponsored_total <= 0;
+        END
+    """)
+    # An update is the delete of the old row's contribution plus the
+    # insert of the new one; both steps are no-ops for unsponsored bills.
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_il_bills_sponsor_stats_au
+        AFTER UPDATE OF ga_session, sponsor_member_id, is_enacted ON il_bills
+        BEGIN
+            UPDATE il_sponsor_stats SET
+                sponsored_total = sponsored_total - 1,
+                enacted_total = enacted_total - OLD.is_enacted
+            WHERE OLD.sponsor_member_id IS NOT NULL
+              AND ga_session = OLD.ga_session AND member_id = OLD.sponsor_member_id;
+            DELETE FROM il_sponsor_stats
+            WHERE OLD.sponsor_member_id IS NOT NULL
+              AND ga_session = OLD.ga_session AND member_id = OLD.sponsor_member_id
+              AND sponsored_total <= 0;
+            INSERT INTO il_sponsor_stats (ga_session, member_id, sponsored_total, enacted_total)
+            SELECT NEW.ga_session, NEW.sponsor_member_id, 1, NEW.is_enacted
+            WHERE NEW.sponsor_member_id IS NOT NULL
+            ON CONFLICT(ga_session, member_id) DO UPDATE SET
+                sponsored_total = sponsored_total + 1,
+                enacted_total = enacted_total + excluded.enacted_total;
+        END
+    """)
+    cursor.execute("DELETE FROM il_sponsor_stats")
+    cursor.execute("""
+        INSERT INTO il_sponsor_stats (ga_session, member_id, sponsored_total, enacted_total)
+        SELECT ga_session, sponsor_member_id, COUNT(*), COALESCE(SUM(is_enacted), 0)
+        FROM il_bills
+        WHERE sponsor_member_id IS NOT NULL
+        GROUP BY ga_session, sponsor_member_id
+    """)
+
+
+# Multi-row INSERT packing is shared with the congress tables.
+_execute_packed = congress_db._execute_packed
+
+
+# UPSERTs rather than INSERT OR REPLACE: an existing row is updated in
+# place (no delete + reinsert touching every index), and not at all when
+# nothing but updated_at would change.
+_IL_LEGISLATOR_UPSERT_SQL = """
+    INSERT INTO il_legislators
+    (member_id, ga_session, chamber, district, name, first_name, last_name, party, title, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(member_id) DO UPDATE SET
+        ga_session=excluded.ga_session,
+        chamber=excluded.chamber,
+        district=excluded.district,
+        name=excluded.name,
+        first_name=excluded.first_name,
+        last_name=excluded.last_name,
+        party=excluded.party,
+        title=excluded.title,
+        updated_at=excluded.updated_at
+    WHERE (excluded.ga_session, excluded.chamber, excluded.district, excluded.name,
+           excluded.first_name, excluded.last_name, excluded.party, excluded.title)
+        IS NOT (il_legislators.ga_session, il_legislators.chamber, il_legislators.district,
+                il_legislators.name, il_legislators.first_name, il_legislators.last_name,
+                il_legislators.party, il_legislators.title)
+"""
 
-        # Create indexes for faster queries
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_il_bills_session ON il_bills(ga_session)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_il_bills_sponsor ON il_bills(sponsor_member_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_il_laws_session ON il_laws(ga_session)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_il_laws_sponsor ON il_laws(sponsor_member_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_il_legislators_session ON il_legislators(ga_session)")
-
-        # Ensure new sponsor role columns exist in existing databases
-        _ensure_table_columns(cursor, "il_bills", {
-            "primary_sponsor_name": "TEXT",
-            "chief_co_sponsors": "TEXT",
-            "co_sponsors": "TEXT",
-            "filing_date": "TEXT",
-            "enactment_date": "TEXT",
-        })
+_IL_BILL_UPSERT_SQL = """
+    INSERT INTO il_bills
+    (bill_id, ga_session, bill_type, bill_number, sponsor_member_id, sponsor_name_raw,
+     primary_sponsor_name, chief_co_sponsors, co_sponsors,
+     title, synopsis, latest_action_text, latest_action_date, filing_date, enactment_date,
+     public_act_number, sponsor_party, sponsor_chamber, sponsor_district, is_enacted, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(bill_id) DO UPDATE SET
+        ga_session=excluded.ga_session,
+        bill_type=excluded.bill_type,
+        bill_number=excluded.bill_number,
+        sponsor_member_id=excluded.sponsor_member_id,
+        sponsor_name_raw=excluded.sponsor_name_raw,
+        primary_sponsor_name=excluded.primary_sponsor_name,
+        chief_co_sponsors=excluded.chief_co_sponsors,
+        co_sponsors=excluded.co_sponsors,
+        title=excluded.title,
+        synopsis=excluded.synopsis,
+        latest_action_text=excluded.latest_action_text,
+        latest_action_date=excluded.latest_action_date,
+        filing_date=excluded.filing_date,
+        enactment_date=excluded.enactment_date,
+        public_act_number=excluded.public_act_number,
+        sponsor_party=excluded.sponsor_party,
+        sponsor_chamber=excluded.sponsor_chamber,
+        sponsor_district=excluded.sponsor_district,
+        is_enacted=excluded.is_enacted,
+        updated_at=excluded.updated_at
+    WHERE (excluded.sponsor_member_id, excluded.sponsor_name_raw, excluded.primary_sponsor_name,
+           excluded.chief_co_sponsors, excluded.co_sponsors, excluded.title, excluded.synopsis,
+           excluded.latest_action_text, excluded.latest_action_date, excluded.filing_date,
+           excluded.enactment_date, excluded.public_act_number, excluded.sponsor_party,
+           excluded.sponsor_chamber, excluded.sponsor_district)
+        IS NOT (il_bills.sponsor_member_id, il_bills.sponsor_name_raw, il_bills.primary_sponsor_name,
+                il_bills.chief_co_sponsors, il_bills.co_sponsors, il_bills.title, il_bills.synopsis,
+                il_bills.latest_action_text, il_bills.latest_action_date, il_bills.filing_date,
+                il_bills.enactment_date, il_bills.public_act_number, il_bills.sponsor_party,
+                il_bills.sponsor_chamber, il_bills.sponsor_district)
+"""
 
-        conn.commit()
-        print(f"[il_db] Illinois database tables initialized", flush=True)
+_IL_LAW_UPSERT_SQL = """
+    INSERT INTO il_laws
+    (law_id, ga_session, public_act_number, bill_id, sponsor_member_id, effective_date, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(law_id) DO UPDATE SET
+        ga_session=excluded.ga_session,
+        public_act_number=excluded.public_act_number,
+        bill_id=excluded.bill_id,
+        sponsor_member_id=excluded.sponsor_member_id,
+        effective_date=excluded.effective_date,
+        updated_at=excluded.updated_at
+    WHERE (excluded.ga_session, excluded.bill_id, excluded.sponsor_member_id, excluded.effective_date)
+        IS NOT (il_laws.ga_session, il_laws.bill_id, il_laws.sponsor_member_id, il_laws.effective_date)
+"""
 
 
 def save_il_legislator(member_id: str, ga_session: int, chamber: str, district: int,
                        name: str, first_name: str = None, last_name: str = None,
                        party: str = None, title: str = None):
     """Save or update an Illinois legislator."""
-    with get_db_connection() as conn:
+    with _write_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("""
-            INSERT OR REPLACE INTO il_legislators
-            (member_id, ga_session, chamber, district, name, first_name, last_name, party, title, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (member_id, ga_session, chamber, district, name, first_name, last_name,
-              party, title, int(time.time())))
-        conn.commit()
+        cursor.execute(_IL_LEGISLATOR_UPSERT_SQL, (
+            member_id, ga_session, chamber, district, name, first_name, last_name,
+            party, title, int(time.time()),
+        ))
+        _commit(conn)
 
 
 def save_il_legislators_batch(ga_session: int, legislators: List[Dict[str, Any]]):
     """Save multiple Illinois legislators in a single transaction."""
-    with get_db_connection() as conn:
+    with _write_connection() as conn:
         cursor = conn.cursor()
         now = int(time.time())
         data = []
@@ -167,12 +627,10 @@ def save_il_legislators_batch(ga_session: int, legislators: List[Dict[str, Any]]
                 now
             ))
 
-        cursor.executemany("""
-            INSERT OR REPLACE INTO il_legislators
-            (member_id, ga_session, chamber, district, name, first_name, last_name, party, title, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, data)
-        conn.commit()
+        _execute_packed(cursor, _IL_LEGISLATOR_UPSERT_SQL, 10, data)
+        # Co-sponsor names resolve against this roster
+        _rebuild_session_cosponsors(cursor, ga_session)
+        _commit(conn)
         print(f"[il_db] Saved {len(data)} IL legislators for session {ga_session}", flush=True)
 
 
@@ -185,62 +643,81 @@ def save_il_bill(ga_session: int, bill_type: str, bill_number: int,
                  public_act_number: str = None):
     """Save or update an Illinois bill."""
     bill_id = f"{ga_session}-{bill_type.lower()}-{bill_number}"
-    with get_db_connection() as conn:
+    with _write_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("""
-            INSERT OR REPLACE INTO il_bills
-            (bill_id, ga_session, bill_type, bill_number, sponsor_member_id, sponsor_name_raw,
-             primary_sponsor_name, chief_co_sponsors, co_sponsors,
-             title, synopsis, latest_action_text, latest_action_date, public_act_number, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (bill_id, ga_session, bill_type.lower(), bill_number, sponsor_member_id,
-              sponsor_name_raw, primary_sponsor_name, json.dumps(chief_co_sponsors or []),
-              json.dumps(co_sponsors or []), title, synopsis, latest_action_text, latest_action_date,
-              public_act_number, int(time.time())))
-        conn.commit()
+        # An upsert rather than INSERT OR REPLACE: REPLACE's implicit delete
+        # would bypass il_sponsor_stats' delete trigger.
+        cursor.execute("SELECT party, chamber, district FROM il_legislators WHERE member_id = ?",
+                       (sponsor_member_id,))
+        sponsor = cursor.fetchone() or (None, None, None)
+        cursor.execute(_IL_BILL_UPSERT_SQL, (
+            bill_id, ga_session, bill_type.lower(), bill_number, sponsor_member_id,
+            sponsor_name_raw, primary_sponsor_name, _json_dumps(chief_co_sponsors or []),
+            _json_dumps(co_sponsors or []), title, synopsis, latest_action_text, latest_action_date,
+            None, None, public_act_number, sponsor[0], sponsor[1], sponsor[2],
+            1 if public_act_number else 0, int(time.time()),
+        ))
+        _commit(conn)
 
 
-def save_il_bills_batch(ga_session: int, bills: List[Dict[str, Any]]):
-    """Save multiple Illinois bills in a single transaction."""
-    with get_db_connection() as conn:
+def save_il_bills_batch(ga_session: int, bills: List[Dict[str, Any]],
+                        legislators_by_id: Optional[Dict[str, Dict[str, Any]]] = None):
+    """
+    Save multiple Illinois bills in a single transaction.
+    Sponsor party/chamber/district are copied from legislators_by_id (or the
+    session's stored legislators when not given).
+    """
+    with _write_connection() as conn:
         cursor = conn.cursor()
+        if legislators_by_id is None:
+            cursor.execute(
+                "SELECT member_id, name, first_name, last_name, party, chamber, district "
+                "FROM il_legislators WHERE ga_session = ?",
+                (ga_session,),
+            )
+            legislators_by_id = {row["member_id"]: dict(row) for row in cursor.fetchall()}
+        no_sponsor: Dict[str, Any] = {}
         now = int(time.time())
         data = []
+        cosponsors = []
         for b in bills:
             bill_type = (b.get("bill_type") or "").lower()
             bill_number = b.get("bill_number")
             if not bill_type or bill_number is None:
                 continue
             bill_id = f"{ga_session}-{bill_type}-{bill_number}"
+            sponsor_member_id = b.get("sponsor_member_id")
+            sponsor = legislators_by_id.get(sponsor_member_id, no_sponsor) if sponsor_member_id else no_sponsor
+            cosponsors.append((bill_id, sponsor_member_id,
+                               b.get("chief_co_sponsors") or [], b.get("co_sponsors") or []))
             data.append((
                 bill_id,
                 ga_session,
                 bill_type,
                 bill_number,
-                b.get("sponsor_member_id"),
+                sponsor_member_id,
                 b.get("sponsor_name_raw"),
                 b.get("primary_sponsor_name"),
-                json.dumps(b.get("chief_co_sponsors") or []),
-                json.dumps(b.get("co_sponsors") or []),
+                _json_dumps(b.get("chief_co_sponsors") or []),
+                _json_dumps(b.get("co_sponsors") or []),
                 b.get("title"),
                 b.get("synopsis"),
                 b.get("latest_action_text"),
                 b.get("latest_action_date"),
-                b.get("filing_date"),
-                b.get("enactment_date"),
+                _iso_date(b.get("filing_date")),
+                _iso_date(b.get("enactment_date")),
                 b.get("public_act_number"),
+                sponsor.get("party"),
+                sponsor.get("chamber"),
+                sponsor.get("district"),
+                1 if b.get("public_act_number") else 0,
                 now
             ))
 
-        cursor.executemany("""
-            INSERT OR REPLACE INTO il_bills
-            (bill_id, ga_session, bill_type, bill_number, sponsor_member_id, sponsor_name_raw,
-             primary_sponsor_name, chief_co_sponsors, co_sponsors,
-             title, synopsis, latest_action_text, latest_action_date, filing_date, enactment_date,
-             public_act_number, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, data)
-        conn.commit()
+        _execute_packed(cursor, _IL_BILL_UPSERT_SQL, 21, data)
+        _replace_bill_cosponsors(cursor, cosponsors, _cosponsor_matcher(legislators_by_id.values()))
+        _commit(conn)
+        congress_db._after_batch_write(conn)
         print(f"[il_db] Saved {len(data)} IL bills for session {ga_session}", flush=True)
 
 
@@ -248,20 +725,18 @@ def save_il_law(ga_session: int, public_act_number: str, bill_id: str = None,
                 sponsor_member_id: str = None, effective_date: str = None):
     """Save or update an Illinois law."""
     law_id = f"PA-{public_act_number}"
-    with get_db_connection() as conn:
+    with _write_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("""
-            INSERT OR REPLACE INTO il_laws
-            (law_id, ga_session, public_act_number, bill_id, sponsor_member_id, effective_date, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (law_id, ga_session, public_act_number, bill_id, sponsor_member_id,
-              effective_date, int(time.time())))
-        conn.commit()
+        cursor.execute(_IL_LAW_UPSERT_SQL, (
+            law_id, ga_session, public_act_number, bill_id, sponsor_member_id,
+            effective_date, int(time.time()),
+        ))
+        _commit(conn)
 
 
 def save_il_laws_batch(ga_session: int, laws: List[Dict[str, Any]]):
     """Save multiple Illinois laws in a single transaction."""
-    with get_db_connection() as conn:
+    with _write_connection() as conn:
         cursor = conn.cursor()
         now = int(time.time())
         data = []
@@ -280,18 +755,14 @@ def save_il_laws_batch(ga_session: int, laws: List[Dict[str, Any]]):
                 now
             ))
 
-        cursor.executemany("""
-            INSERT OR REPLACE INTO il_laws
-            (law_id, ga_session, public_act_number, bill_id, sponsor_member_id, effective_date, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, data)
-        conn.commit()
+        _execute_packed(cursor, _IL_LAW_UPSERT_SQL, 7, data)
+        _commit(conn)
         print(f"[il_db] Saved {len(data)} IL laws for session {ga_session}", flush=True)
 
 
 def save_il_stats_cache(ga_session: int, stats: Dict[str, Any]):
     """Save computed Illinois stats to cache."""
-    with get_db_connection() as conn:
+    with _write_connection() as conn:
         cursor = conn.cursor()
         summary = stats.get("summary", {})
         cursor.execute("""
@@ -305,24 +776,41 @@ def save_il_stats_cache(ga_session: int, stats: Dict[str, Any]):
             summary.get("total_laws", 0),
             summary.get("total_legislators", 0),
             stats.get("unmatched_sponsors", 0),
-            json.dumps(stats)
+            _json_dumps(stats)
         ))
-        conn.commit()
+        _commit(conn)
+        _stats_memo.pop(ga_session, None)
         print(f"[il_db] Saved stats cache for IL session {ga_session}", flush=True)
 
 
+# Parsed stats blobs by session, tagged with the last_full_refresh they were
+# read at, so repeat hits skip re-reading and re-decoding a multi-MB blob.
+_stats_memo: Dict[int, Tuple[int, Dict[str, Any]]] = {}
+
+
 def load_il_stats_cache(ga_session: int) -> Optional[Dict[str, Any]]:
     """Load cached Illinois stats from database."""
     with get_db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("""
-            SELECT stats_json, last_full_refresh FROM il_cache_metadata WHERE ga_session = ?
+            SELECT last_full_refresh FROM il_cache_metadata WHERE ga_session = ?
         """, (ga_session,))
         row = cursor.fetchone()
-        if row and row["stats_json"]:
-            stats = json.loads(row["stats_json"])
-            print(f"[il_db] Loaded stats cache for IL session {ga_session} (cached at {row['last_full_refresh']})", flush=True)
-            return stats
+        if row is None:
+            return None
+        refreshed_at = row[0]
+        memo = _stats_memo.get(ga_session)
+        if memo is not None and memo[0] == refreshed_at:
+            # Callers tag the top level (e.g. _refresh_status); hand out a copy
+            return dict(memo[1])
+
+        cursor.execute("SELECT stats_json FROM il_cache_metadata WHERE ga_session = ?", (ga_session,))
+        row = cursor.fetchone()
+        if row and row[0]:
+            stats = _json_loads(row[0])
+            _stats_memo[ga_session] = (refreshed_at, stats)
+            print(f"[il_db] Loaded stats cache for IL session {ga_session} (cached at {refreshed_at})", flush=True)
+            return dict(stats)
         return None
 
 
@@ -355,24 +843,22 @@ def get_il_stats_from_db(ga_session: int) -> Optional[Dict[str, Any]]:
     with get_db_connection() as conn:
         cursor = conn.cursor()
 
-        # Get legislator stats with bill and law counts
+        # il_sponsor_stats is maintained by triggers on il_bills, so this
+        # is one row per sponsoring legislator rather than a bill scan.
         cursor.execute("""
             SELECT
-                l.member_id,
+                s.member_id,
                 l.name as sponsor_name,
                 l.party,
                 l.chamber,
                 l.district,
-                COUNT(DISTINCT b.bill_id) as sponsored_total,
-                COUNT(DISTINCT law.law_id) as enacted_total
-            FROM il_legislators l
-            LEFT JOIN il_bills b ON l.member_id = b.sponsor_member_id AND b.ga_session = ?
-            LEFT JOIN il_laws law ON b.bill_id = law.bill_id AND law.ga_session = ?
-            WHERE l.ga_session = ?
-            GROUP BY l.member_id
-            HAVING sponsored_total > 0
-            ORDER BY sponsored_total DESC, sponsor_name ASC
-        """, (ga_session, ga_session, ga_session))
+                s.sponsored_total,
+                s.enacted_total
+            FROM il_sponsor_stats s
+            JOIN il_legislators l ON l.member_id = s.member_id
+            WHERE s.ga_session = ?
+            ORDER BY s.sponsored_total DESC, sponsor_name ASC
+        """, (ga_session,))
 
         rows = []
         for row in cursor.fetchall():
@@ -411,26 +897,47 @@ def get_il_stats_from_db(ga_session: int) -> Optional[Dict[str, Any]]:
 
 def clear_il_session_data(ga_session: int):
     """Clear all data for a specific Illinois GA session."""
-    with get_db_connection() as conn:
+    with _write_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("DELETE FROM il_laws WHERE ga_session = ?", (ga_session,))
+        cursor.execute("""
+            DELETE FROM il_bill_cosponsors
+            WHERE bill_id IN (SELECT bill_id FROM il_bills WHERE ga_session = ?)
+        """, (ga_session,))
         cursor.execute("DELETE FROM il_bills WHERE ga_session = ?", (ga_session,))
         cursor.execute("DELETE FROM il_legislators WHERE ga_session = ?", (ga_session,))
         cursor.execute("DELETE FROM il_cache_metadata WHERE ga_session = ?", (ga_session,))
-        conn.commit()
+        _commit(conn)
+        _stats_memo.pop(ga_session, None)
         print(f"[il_db] Cleared data for IL session {ga_session}", flush=True)
 
 
+# Columns the readers below hand back; SELECT * would also drag in
+# updated_at and the denormalized sponsor columns.
+_IL_LEGISLATOR_COLUMNS = (
+    "member_id", "ga_session", "chamber", "district", "name",
+    "first_name", "last_name", "party", "title",
+)
+_IL_BILL_COLUMNS = (
+    "bill_id", "ga_session", "bill_type", "bill_number", "sponsor_member_id",
+    "sponsor_name_raw", "primary_sponsor_name", "chief_co_sponsors", "co_sponsors",
+    "title", "synopsis", "latest_action_text", "latest_action_date",
+    "filing_date", "enactment_date", "public_act_number",
+)
+_IL_LEGISLATOR_SELECT = f"SELECT {', '.join(_IL_LEGISLATOR_COLUMNS)} FROM il_legislators"
+_IL_BILL_SELECT = f"SELECT {', '.join(_IL_BILL_COLUMNS)} FROM il_bills"
+_PENDING_BILL_COLUMNS = ("bill_id", "bill_type", "bill_number", "latest_action_date")
+
+
 def get_il_legislator_by_id(member_id: str) -> Optional[Dict[str, Any]]:
     """Get a single legislator by member_id."""
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("""
-            SELECT * FROM il_legislators WHERE member_id = ?
-        """, (member_id,))
+        cursor.row_factory = None
+        cursor.execute(_IL_LEGISLATOR_SELECT + " WHERE member_id = ?", (member_id,))
         row = cursor.fetchone()
         if row:
-            return dict(row)
+            return dict(zip(_IL_LEGISLATOR_COLUMNS, row))
         return None
 
 
@@ -438,10 +945,11 @@ def get_il_legislators_by_session(ga_session: int) -> List[Dict[str, Any]]:
     """Get all legislators for a session."""
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("""
-            SELECT * FROM il_legislators WHERE ga_session = ? ORDER BY chamber, district
-        """, (ga_session,))
-        return [dict(row) for row in cursor.fetchall()]
+        cursor.row_factory = None
+        cursor.execute(_IL_LEGISLATOR_SELECT + " WHERE ga_session = ? ORDER BY chamber, district",
+                       (ga_session,))
+        columns = _IL_LEGISLATOR_COLUMNS
+        return [dict(zip(columns, row)) for row in cursor]
 
 
 def get_existing_bill_filenames(ga_session: int) -> set:
@@ -451,29 +959,36 @@ def get_existing_bill_filenames(ga_session: int) -> set:
     """
     with get_db_connection() as conn:
         cursor = conn.cursor()
+        cursor.row_factory = None
         cursor.execute("""
             SELECT bill_type, bill_number FROM il_bills WHERE ga_session = ?
         """, (ga_session,))
-
-        filenames = set()
-        for row in cursor.fetchall():
-            bill_type = row["bill_type"].upper()
-            bill_number = row["bill_number"]
-            # Reconstruct filename: 10400HB0001.xml
-            filename = f"{ga_session}00{bill_type}{bill_number:04d}.xml"
-            filenames.add(filename)
-
-        return filenames
+        # Reconstruct filename: 10400HB0001.xml
+        return {f"{ga_session}00{bill_type.upper()}{bill_number:04d}.xml" for bill_type, bill_number in cursor}
 
 
 def get_all_bills_for_session(ga_session: int) -> List[Dict[str, Any]]:
     """Get all bills for a session from database."""
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("""
-            SELECT * FROM il_bills WHERE ga_session = ?
-        """, (ga_session,))
-        return [dict(row) for row in cursor.fetchall()]
+        cursor.row_factory = None
+        cursor.execute(_IL_BILL_SELECT + " WHERE ga_session = ?", (ga_session,))
+        columns = _IL_BILL_COLUMNS
+        return [dict(zip(columns, row)) for row in cursor]
+
+
+def iter_bills_for_session(ga_session: int) -> Iterator[Dict[str, Any]]:
+    """
+    Yield a session's bills one at a time straight off the cursor, for
+    callers that make a single pass and don't need the whole list at once.
+    """
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(_IL_BILL_SELECT + " WHERE ga_session = ?", (ga_session,))
+        columns = _IL_BILL_COLUMNS
+        for row in cursor:
+            yield dict(zip(columns, row))
 
 
 def get_pending_bills_for_update(ga_session: int) -> List[Dict[str, Any]]:
@@ -483,12 +998,72 @@ def get_pending_bills_for_update(ga_session: int) -> List[Dict[str, Any]]:
     """
     with get_db_connection() as conn:
         cursor = conn.cursor()
+        cursor.row_factory = None
         cursor.execute("""
             SELECT bill_id, bill_type, bill_number, latest_action_date
             FROM il_bills
             WHERE ga_session = ? AND (public_act_number IS NULL OR public_act_number = '')
         """, (ga_session,))
-        return [dict(row) for row in cursor.fetchall()]
+        columns = _PENDING_BILL_COLUMNS
+        return [dict(zip(columns, row)) for row in cursor]
+
+
+# Columns update_il_bill may set, in the order they appear in its SQL
+_UPDATABLE_BILL_FIELDS = (
+    "public_act_number", "latest_action_date", "latest_action_text",
+    "sponsor_member_id", "primary_sponsor_name", "chief_co_sponsors",
+    "co_sponsors", "title", "synopsis", "filing_date", "enactment_date",
+)
+_COSPONSOR_FIELDS = frozenset(("sponsor_member_id", "chief_co_sponsors", "co_sponsors"))
+
+
+@lru_cache(maxsize=64)
+def _bill_update_sql(fields: Tuple[str, ...]) -> str:
+    """UPDATE statement for one shape of update; a handful of shapes cover nearly every call."""
+    assignments = [f"{field} = ?" for field in fields]
+    # Keep the denormalized columns in step with their sources
+    if "public_act_number" in fields:
+        assignments.append("is_enacted = ?")
+    if "sponsor_member_id" in fields:
+        for column, source in (("sponsor_party", "party"), ("sponsor_chamber", "chamber"),
+                               ("sponsor_district", "district")):
+            assignments.append(f"{column} = (SELECT {source} FROM il_legislators WHERE member_id = ?)")
+    assignments.append("updated_at = ?")
+    return f"UPDATE il_bills SET {', '.join(assignments)} WHERE bill_id = ?"
+
+
+def _apply_bill_updates(cursor: sqlite3.Cursor, updates: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+    """Run (bill_id, data) updates with one executemany per field shape. Returns the number applied."""
+    now = int(time.time())
+    by_shape: Dict[Tuple[str, ...], List[list]] = {}
+    cosponsors_changed = []
+    for bill_id, data in updates:
+        fields = tuple(field for field in _UPDATABLE_BILL_FIELDS if field in data)
+        if not fields:
+            continue
+        values = []
+        for field in fields:
+            value = data[field]
+            # JSON-encode lists
+            if isinstance(value, list):
+                value = _json_dumps(value)
+            elif field in ("filing_date", "enactment_date"):
+                value = _iso_date(value)
+            values.append(value)
+        if "public_act_number" in data:
+            values.append(1 if data["public_act_number"] else 0)
+        if "sponsor_member_id" in data:
+            values.extend((data["sponsor_member_id"],) * 3)
+        values.append(now)
+        values.append(bill_id)
+        by_shape.setdefault(fields, []).append(values)
+        if _COSPONSOR_FIELDS & data.keys():
+            cosponsors_changed.append(bill_id)
+
+    for fields, params in by_shape.items():
+        cursor.executemany(_bill_update_sql(fields), params)
+    _rebuild_bill_cosponsors(cursor, cosponsors_changed)
+    return sum(len(params) for params in by_shape.values())
 
 
 def update_il_bill(bill_id: str, data: Dict[str, Any]) -> None:
@@ -496,41 +1071,16 @@ def update_il_bill(bill_id: str, data: Dict[str, Any]) -> None:
     Update an existing bill record with new data.
     Used when re-fetching a bill that may have become a public act.
     """
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
+    with _write_connection() as conn:
+        if _apply_bill_updates(conn.cursor(), [(bill_id, data)]):
+            _commit(conn)
 
-        # Build dynamic update query based on provided fields
-        update_fields = []
-        values = []
 
-        allowed_fields = [
-            "public_act_number", "latest_action_date", "latest_action_text",
-            "sponsor_member_id", "primary_sponsor_name", "chief_co_sponsors",
-            "co_sponsors", "title", "synopsis", "filing_date", "enactment_date"
-        ]
-
-        for field in allowed_fields:
-            if field in data:
-                update_fields.append(f"{field} = ?")
-                value = data[field]
-                # JSON-encode lists
-                if isinstance(value, list):
-                    value = json.dumps(value)
-                values.append(value)
-
-        if not update_fields:
-            return
-
-        # Add updated_at timestamp
-        update_fields.append("updated_at = ?")
-        values.append(int(time.time()))
-
-        # Add bill_id for WHERE clause
-        values.append(bill_id)
-
-        query = f"UPDATE il_bills SET {', '.join(update_fields)} WHERE bill_id = ?"
-        cursor.execute(query, values)
-        conn.commit()
+def update_il_bills_batch(updates: List[Tuple[str, Dict[str, Any]]]) -> None:
+    """Apply many update_il_bill-style (bill_id, data) updates in a single transaction."""
+    with bulk_transaction() as conn:
+        applied = _apply_bill_updates(conn.cursor(), updates)
+    print(f"[il_db] Updated {applied} IL bills", flush=True)
 
 
 def get_il_timeline_data(ga_session: int) -> Dict[str, Any]:
@@ -541,48 +1091,23 @@ def get_il_timeline_data(ga_session: int) -> Dict[str, Any]:
     with get_db_connection() as conn:
         cursor = conn.cursor()
 
-        # Get filing dates
+        # Dates are stored as YYYY-MM-DD, so the first 7 chars are the month
         cursor.execute("""
-            SELECT filing_date, COUNT(*) as count
+            SELECT substr(filing_date, 1, 7) AS month, COUNT(*)
             FROM il_bills
             WHERE ga_session = ? AND filing_date IS NOT NULL AND filing_date != ''
-            GROUP BY substr(filing_date, 1, 7)
-            ORDER BY filing_date
+            GROUP BY month
         """, (ga_session,))
+        filed_by_month: Dict[str, int] = dict(cursor.fetchall())
 
-        # Parse and aggregate by month (filing_date is M/D/YYYY format)
-        filed_by_month: Dict[str, int] = {}
-        for row in cursor.fetchall():
-            date_str = row["filing_date"]
-            try:
-                # Parse M/D/YYYY and convert to YYYY-MM
-                parts = date_str.split("/")
-                if len(parts) == 3:
-                    month_key = f"{parts[2]}-{parts[0].zfill(2)}"
-                    filed_by_month[month_key] = filed_by_month.get(month_key, 0) + row["count"]
-            except (ValueError, IndexError):
-                continue
-
-        # Get enactment dates
         cursor.execute("""
-            SELECT enactment_date, COUNT(*) as count
+            SELECT substr(enactment_date, 1, 7) AS month, COUNT(*)
             FROM il_bills
             WHERE ga_session = ? AND enactment_date IS NOT NULL AND enactment_date != ''
-                AND public_act_number IS NOT NULL AND public_act_number != ''
-            GROUP BY substr(enactment_date, 1, 7)
-            ORDER BY enactment_date
+                AND is_enacted = 1
+            GROUP BY month
         """, (ga_session,))
-
-        enacted_by_month: Dict[str, int] = {}
-        for row in cursor.fetchall():
-            date_str = row["enactment_date"]
-            try:
-                parts = date_str.split("/")
-                if len(parts) == 3:
-                    month_key = f"{parts[2]}-{parts[0].zfill(2)}"
-                    enacted_by_month[month_key] = enacted_by_month.get(month_key, 0) + row["count"]
-            except (ValueError, IndexError):
-                continue
+        enacted_by_month: Dict[str, int] = dict(cursor.fetchall())
 
         # Get all months in order
         all_months = sorted(set(list(filed_by_month.keys()) + list(enacted_by_month.keys())))
@@ -595,16 +1120,17 @@ def get_il_timeline_data(ga_session: int) -> Dict[str, Any]:
         }
 
 
+_NAME_TITLE_OR_SUFFIX = re.compile(
+    r'^(?:Rep\.|Sen\.|Representative|Senator)\s+|,?\s+(?:Jr\.?|Sr\.?|II|III|IV|V)$', re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=4096)
 def _normalize_name_for_network(name: str) -> str:
     """Normalize name for network matching - lowercase, strip titles/suffixes."""
     if not name:
         return ""
-    import re
-    # Remove titles
-    name = re.sub(r'^(Rep\.|Sen\.|Representative|Senator)\s+', '', name.strip(), flags=re.IGNORECASE)
-    # Remove suffixes
-    name = re.sub(r',?\s+(Jr\.?|Sr\.?|II|III|IV|V)$', '', name, flags=re.IGNORECASE)
-    return ' '.join(name.split()).lower()
+    return ' '.join(_NAME_TITLE_OR_SUFFIX.sub('', name.strip()).split()).lower()
 
 
 def _get_name_parts(name: str) -> tuple:
@@ -615,6 +1141,119 @@ def _get_name_parts(name: str) -> tuple:
     return (name, name)
 
 
+def _cosponsor_matcher(legislators: Iterable[Dict[str, Any]]) -> Callable[[str], Optional[str]]:
+    """
+    Build a co-sponsor name -> member_id matcher over legislator dicts:
+    exact normalized name, then "first last", then a unique last name.
+    Results are memoized since the same names recur on thousands of bills.
+    """
+    lookup_exact: Dict[str, str] = {}  # normalized name -> member_id
+    lookup_last: Dict[str, list] = {}  # last name -> [member_ids]
+    lookup_first_last: Dict[str, str] = {}  # "first last" -> member_id
+    for leg in legislators:
+        member_id = leg["member_id"]
+        lookup_exact[_normalize_name_for_network(leg.get("name"))] = member_id
+        first_name = (leg.get("first_name") or "").lower().strip()
+        last_name = (leg.get("last_name") or "").lower().strip()
+        if first_name and last_name:
+            lookup_first_last[f"{first_name} {last_name}"] = member_id
+        if last_name:
+            lookup_last.setdefault(last_name, []).append(member_id)
+
+    matched: Dict[str, Optional[str]] = {}
+
+    def match(name: str) -> Optional[str]:
+        if name in matched:
+            return matched[name]
+        normalized = _normalize_name_for_network(name)
+        first, last = _get_name_parts(normalized)
+        member_id = lookup_exact.get(normalized) or lookup_first_last.get(f"{first} {last}")
+        if member_id is None and len(lookup_last.get(last, ())) == 1:
+            member_id = lookup_last[last][0]
+        matched[name] = member_id
+        return member_id
+
+    return match
+
+
+def _replace_bill_cosponsors(cursor: sqlite3.Cursor,
+                             bills: List[Tuple[str, Optional[str], List[str], List[str]]],
+                             match: Callable[[str], Optional[str]]) -> None:
+    """
+    Rewrite il_bill_cosponsors for (bill_id, sponsor_member_id, chief, co)
+    tuples. Unmatched names and the sponsor themself are dropped; a member
+    listed in both roles is recorded once, as chief.
+    """
+    if not bills:
+        return
+    cursor.executemany("DELETE FROM il_bill_cosponsors WHERE bill_id = ?", [(b[0],) for b in bills])
+    rows: Dict[Tuple[str, str], str] = {}
+    for bill_id, sponsor_id, chief, co in bills:
+        if not sponsor_id:
+            continue
+        for role, names in (("chief", chief), ("co", co)):
+            for name in names:
+                member_id = match(name)
+                if member_id and member_id != sponsor_id:
+                    rows.setdefault((bill_id, member_id), role)
+    _execute_packed(cursor, """
+        INSERT INTO il_bill_cosponsors (bill_id, member_id, role) VALUES (?, ?, ?)
+    """, 3, ((bill_id, member_id, role) for (bill_id, member_id), role in rows.items()))
+
+
+def _load_json_list(raw: Optional[str]) -> List[str]:
+    try:
+        return _json_loads(raw or "[]")
+    except ValueError:
+        return []
+
+
+def _session_cosponsor_matcher(cursor: sqlite3.Cursor, ga_session: int) -> Callable[[str], Optional[str]]:
+    """_cosponsor_matcher over one session's legislators."""
+    cursor.execute("""
+        SELECT member_id, name, first_name, last_name
+        FROM il_legislators WHERE ga_session = ?
+    """, (ga_session,))
+    return _cosponsor_matcher(
+        {"member_id": row[0], "name": row[1], "first_name": row[2], "last_name": row[3]}
+        for row in cursor.fetchall()
+    )
+
+
+def _rebuild_session_cosponsors(cursor: sqlite3.Cursor, ga_session: int) -> None:
+    """Re-resolve stored co-sponsor names for a session against its legislators."""
+    match = _session_cosponsor_matcher(cursor, ga_session)
+    cursor.execute("""
+        SELECT bill_id, sponsor_member_id, chief_co_sponsors, co_sponsors
+        FROM il_bills WHERE ga_session = ?
+    """, (ga_session,))
+    bills = [
+        (row[0], row[1], _load_json_list(row[2]), _load_json_list(row[3]))
+        for row in cursor.fetchall()
+    ]
+    _replace_bill_cosponsors(cursor, bills, match)
+
+
+def _rebuild_bill_cosponsors(cursor: sqlite3.Cursor, bill_ids: List[str]) -> None:
+    """
+    Re-resolve stored co-sponsor names for the given bills, building one
+    matcher and making one _replace_bill_cosponsors call per session.
+    """
+    by_session: Dict[int, List[Tuple[str, Optional[str], List[str], List[str]]]] = {}
+    for i in range(0, len(bill_ids), congress_db._MAX_SQL_VARIABLES):
+        chunk = bill_ids[i:i + congress_db._MAX_SQL_VARIABLES]
+        cursor.execute(f"""
+            SELECT ga_session, bill_id, sponsor_member_id, chief_co_sponsors, co_sponsors
+            FROM il_bills WHERE bill_id IN ({",".join("?" * len(chunk))})
+        """, chunk)
+        for row in cursor.fetchall():
+            by_session.setdefault(row[0], []).append(
+                (row[1], row[2], _load_json_list(row[3]), _load_json_list(row[4]))
+            )
+    for ga_session, bills in by_session.items():
+        _replace_bill_cosponsors(cursor, bills, _session_cosponsor_matcher(cursor, ga_session))
+
+
 def _normalize_network_view(view: Optional[str]) -> str:
     """Normalize graph view mode."""
     if not view:
@@ -713,105 +1352,28 @@ def get_il_network_data(
     with get_db_connection() as conn:
         cursor = conn.cursor()
 
-        # Get all legislators for lookup FIRST
         cursor.execute("""
-            SELECT member_id, name, first_name, last_name, party, chamber, district
+            SELECT member_id, name, party, chamber, district
             FROM il_legislators WHERE ga_session = ?
         """, (ga_session,))
+        legislator_info: Dict[str, Dict[str, Any]] = {
+            row["member_id"]: dict(row) for row in cursor.fetchall()
+        }
 
-        legislator_info: Dict[str, Dict[str, Any]] = {}
-        # Build multiple lookup indexes for fuzzy matching
-        lookup_exact: Dict[str, str] = {}  # normalized name -> member_id
-        lookup_last: Dict[str, list] = {}  # last name -> [member_ids]
-        lookup_first_last: Dict[str, str] = {}  # "first last" -> member_id
-
-        for row in cursor.fetchall():
-            member_id = row["member_id"]
-            legislator_info[member_id] = {
-                "id": member_id,
-                "name": row["name"],
-                "party": row["party"],
-                "chamber": row["chamber"],
-                "district": row["district"],
-            }
-            # Build lookup indexes
-            normalized = _normalize_name_for_network(row["name"])
-            lookup_exact[normalized] = member_id
-
-            first_name = (row["first_name"] or "").lower().strip()
-            last_name = (row["last_name"] or "").lower().strip()
-            if first_name and last_name:
-                lookup_first_last[f"{first_name} {last_name}"] = member_id
-            if last_name:
-                if last_name not in lookup_last:
-                    lookup_last[last_name] = []
-                lookup_last[last_name].append(member_id)
-
-        # Now get all bills with sponsors and co-sponsors
+        # Sponsor <-> co-sponsor pairs, counted per bill, from the resolved
+        # co-sponsor rows written at save time.
         cursor.execute("""
             SELECT
-                b.bill_id,
-                b.sponsor_member_id,
-                b.chief_co_sponsors,
-                b.co_sponsors
+                MIN(b.sponsor_member_id, c.member_id) AS source,
+                MAX(b.sponsor_member_id, c.member_id) AS target,
+                COUNT(*) AS value
             FROM il_bills b
+            JOIN il_bill_cosponsors c ON c.bill_id = b.bill_id
             WHERE b.ga_session = ? AND b.sponsor_member_id IS NOT NULL
-        """, (ga_session,))
-
-        bills = cursor.fetchall()  # Fetch all before processing
-
-        # Build connection counts between legislators
-        connections: Dict[tuple, int] = {}  # (member1, member2) -> count
-
-        def match_cosponsor(name: str) -> Optional[str]:
-            """Match co-sponsor name to member_id using fuzzy matching."""
-            normalized = _normalize_name_for_network(name)
-            # Try exact match
-            if normalized in lookup_exact:
-                return lookup_exact[normalized]
-            # Try first+last match
-            first, last = _get_name_parts(normalized)
-            key = f"{first} {last}"
-            if key in lookup_first_last:
-                return lookup_first_last[key]
-            # Try last name only (if unique)
-            if last in lookup_last and len(lookup_last[last]) == 1:
-                return lookup_last[last][0]
-            return None
-
-        # Process bills for co-sponsorship links
-        for row in bills:
-            sponsor_id = row["sponsor_member_id"]
-            if not sponsor_id:
-                continue
-
-            # Parse co-sponsors JSON
-            chief_co = []
-            co = []
-            try:
-                chief_co = json.loads(row["chief_co_sponsors"] or "[]")
-            except json.JSONDecodeError:
-                pass
-            try:
-                co = json.loads(row["co_sponsors"] or "[]")
-            except json.JSONDecodeError:
-                pass
-
-            all_cosponsors = chief_co + co
-
-            # For each co-sponsor, create a link to the primary sponsor
-            for cosponsor_name in all_cosponsors:
-                cosponsor_id = match_cosponsor(cosponsor_name)
-
-                if not cosponsor_id or cosponsor_id == sponsor_id:
-                    continue
-
-                # Create sorted pair for undirected link
-                pair = tuple(sorted([sponsor_id, cosponsor_id]))
-                connections[pair] = connections.get(pair, 0) + 1
-
-        # Filter to only connections >= min_connections
-        filtered_connections = {k: v for k, v in connections.items() if v >= min_connections}
+            GROUP BY source, target
+            HAVING value >= ?
+        """, (ga_session, min_connections))
+        filtered_connections = {(row[0], row[1]): row[2] for row in cursor.fetchall()}
 
         # Build nodes and links
         active_ids = set()
@@ -853,6 +1415,3 @@ def get_il_network_data(
             payload["hierarchy"] = build_il_edge_bundling_hierarchy(nodes, links)
         return payload
 
-
-# Initialize IL database tables on module import
-init_il_database()
@@ -6,13 +6,29 @@ import os
 import re
 import time
 import json
-import xml.etree.ElementTree as ET
+import threading
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from html.parser import HTMLParser
+from functools import lru_cache
+from itertools import takewhile
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from lxml import etree as ET
+except ImportError:  # pragma: no cover - optional accelerator
+    import xml.etree.ElementTree as ET
+    lxml_available = False
+else:
+    lxml_available = True
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from requests.exceptions import Timeout, RequestException, ConnectionError as ReqConnErr
 
 # Import database module
@@ -26,8 +42,7 @@ except ImportError:
 # =======================
 IL_FTP_ROOT = os.environ.get("IL_FTP_ROOT", "https://ilga.gov/ftp")
 IL_CACHE_DIR = os.environ.get("IL_CACHE_DIR", "./cache/illinois")
-IL_MAX_WORKERS = int(os.environ.get("IL_MAX_WORKERS", "4"))  # Lower for FTP politeness
-IL_REQUEST_DELAY = float(os.environ.get("IL_REQUEST_DELAY", "0.1"))  # Delay between requests
+IL_MAX_WORKERS = int(os.environ.get("IL_MAX_WORKERS", "4"))  # Max requests in flight to ILGA
 BIPARTISAN_PRIOR_WEIGHT = max(0, int(os.environ.get("IL_BIPARTISAN_PRIOR_WEIGHT", "20")))
 
 os.makedirs(IL_CACHE_DIR, exist_ok=True)
@@ -52,124 +67,157 @@ CO_ADD_PATTERN = re.compile(r'\bAdded\s+Co-?Sponsors?\b', re.IGNORECASE)
 CHIEF_CO_REMOVE_PATTERN = re.compile(r'\bRemoved\s+Chief\s+Co-?Sponsors?\b', re.IGNORECASE)
 CO_REMOVE_PATTERN = re.compile(r'\bRemoved\s+Co-?Sponsors?\b', re.IGNORECASE)
 
+# Action name-list patterns (_split_name_list and the sponsor helpers)
+NAME_LIST_TITLE_PATTERN = re.compile(r'^(Reps?\.|Rep\.|Sens?\.|Sen\.|Representatives?|Senators?)\s+', re.IGNORECASE)
+SUFFIX_COMMA_PATTERN = re.compile(r',\s*(Jr\.?|Sr\.?|II|III|IV|V)\b')
+AND_SEPARATOR_PATTERN = re.compile(r'\s+and\s+', re.IGNORECASE)
+TITLE_IN_NAME_PATTERN = re.compile(r'(Rep\.|Sen\.|Representative|Senator)', re.IGNORECASE)
+SENATE_TITLE_PATTERN = re.compile(r'\b(Sen\.|Senator)\b', re.IGNORECASE)
+HOUSE_TITLE_PATTERN = re.compile(r'\b(Rep\.|Representative)\b', re.IGNORECASE)
+FILED_ACTION_PATTERN = re.compile(r'\b(Filed|Prefiled)\b', re.IGNORECASE)
+
+# <a href> targets in ILGA's directory listings; matched on the raw bytes
+DIRECTORY_HREF_PATTERN = re.compile(rb'<a\s[^>]*?\bhref\s*=\s*["\']?([^"\'\s>]+)', re.IGNORECASE)
+
+# Bill-status filenames, e.g. 10400HB0001.xml
+BILL_FILENAME_PATTERN = re.compile(r'(\d{3})00(HB|SB|HR|SR|HJR|SJR|HJRCA|SJRCA)(\d+)\.xml', re.IGNORECASE)
+BILL_LIST_FILENAME_PATTERN = re.compile(r'\d{3}00(HB|SB)\d+\.xml', re.IGNORECASE)
+
 # Name normalization patterns
 TITLE_PATTERN = re.compile(r'^(Rep\.|Sen\.|Representative|Senator)\s+', re.IGNORECASE)
 SUFFIX_PATTERN = re.compile(r',?\s+(Jr\.?|Sr\.?|II|III|IV|V)$', re.IGNORECASE)
+# The same title/suffix rules as plain strings, for normalize_name
+NAME_TITLES = ("representative", "senator", "rep.", "sen.")
+NAME_SUFFIXES = frozenset({"jr", "jr.", "sr", "sr.", "ii", "iii", "iv", "v"})
 
 # Track background refresh status for Illinois
 _il_refresh_status: Dict[int, Dict[str, Any]] = {}
 
 
 # =======================
-# HTML Directory Parser
+# HTTP helpers
 # =======================
-class DirectoryListingParser(HTMLParser):
-    """Parse HTML directory listing to extract file links."""
-
-    def __init__(self):
-        super().__init__()
-        self.files = []
-
-    def handle_starttag(self, tag, attrs):
-        if tag == 'a':
-            for name, value in attrs:
-                if name == 'href' and value and not value.startswith('?'):
-                    # Handle both relative and absolute paths
-                    if value.startswith('/'):
-                        # Extract just the filename from absolute paths
-                        filename = value.rsplit('/', 1)[-1]
-                        if filename and filename.endswith('.xml'):
-                            self.files.append(filename)
-                    else:
-                        self.files.append(value)
+class _ILRetry(Retry):
+    """Retry that also backs off before the first retry (urllib3 2.x doesn't)."""
+
+    def get_backoff_time(self) -> float:
+        consecutive = len(list(takewhile(lambda h: h.redirect_location is None, reversed(self.history))))
+        if consecutive == 0:
+            return 0
+        return min(self.backoff_max, self.backoff_factor * (2 ** (consecutive - 1)))
+
+
+def _new_il_session() -> requests.Session:
+    """Keep-alive session whose pool has a connection for every fetch worker."""
+    sess = requests.Session()
+    # Three attempts on 5xx and connection errors, sleeping 1.2s before the
+    # second and 2.4s before the third; the final response comes back
+    # unraised so il_http_get reports it.
+    retry = _ILRetry(
+        total=2,
+        backoff_factor=1.2,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=("GET",),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=IL_MAX_WORKERS, pool_maxsize=IL_MAX_WORKERS, max_retries=retry)
+    sess.mount("https://", adapter)
+    sess.mount("http://", adapter)
+    return sess
+
+
+# Shared by the fetch threads so bill downloads reuse TCP/TLS connections
+# to ilga.gov instead of handshaking per file.
+_IL_SESSION = _new_il_session()
+# Caps requests in flight across every fetch pool (background refreshes of
+# different sessions can overlap), in place of sleeping between requests.
+_IL_REQUEST_SLOTS = threading.BoundedSemaphore(IL_MAX_WORKERS)
 
 
-# =======================
-# HTTP helpers
-# =======================
 def il_http_get(url: str, timeout: Tuple[int, int] = (15, 45)) -> requests.Response:
     """
     GET helper for ILGA FTP with retries and timeouts.
     Returns the raw response object.
     """
-    for attempt in range(3):
-        try:
+    try:
+        with _IL_REQUEST_SLOTS:
             t0 = time.time()
             print(f"[il_http] GET {url}", flush=True)
 
-            resp = requests.get(url, timeout=timeout)
+            resp = _IL_SESSION.get(url, timeout=timeout)
             dt = time.time() - t0
             print(f"[il_http] <- {resp.status_code} in {dt:.2f}s", flush=True)
 
-            if resp.status_code == 200:
-                return resp
+        resp.raise_for_status()
+        return resp
 
-            if resp.status_code >= 500 and attempt < 2:
-                time.sleep(1.2 * (attempt + 1))
-                continue
+    except (Timeout, ReqConnErr) as e:
+        raise RuntimeError(f"ILGA FTP timeout: {type(e).__name__}") from e
 
-            resp.raise_for_status()
+    except RequestException as e:
+        raise RuntimeError(f"ILGA FTP error: {type(e).__name__}") from e
 
-        except (Timeout, ReqConnErr) as e:
-            if attempt < 2:
-                time.sleep(1.2 * (attempt + 1))
-                continue
-            raise RuntimeError(f"ILGA FTP timeout: {type(e).__name__}") from e
 
-        except RequestException as e:
-            if attempt < 2:
-                time.sleep(1.2 * (attempt + 1))
-                continue
-            raise RuntimeError(f"ILGA FTP error: {type(e).__name__}") from e
-
-    raise RuntimeError("ILGA FTP unavailable after retries.")
-
-
-def il_fetch_xml(url: str) -> str:
-    """Fetch XML content from URL, stripping BOM if present."""
-    resp = il_http_get(url)
-    # Try UTF-8 first, fall back to Latin-1 for files with accented characters
-    try:
-        content = resp.content.decode('utf-8-sig')
-    except UnicodeDecodeError:
-        # Some ILGA files contain Latin-1 encoded characters (e.g., accented names)
-        content = resp.content.decode('latin-1')
-    return content
+def il_fetch_xml(url: str) -> bytes:
+    """Fetch raw XML bytes from URL; _parse_xml handles BOMs and encodings."""
+    return il_http_get(url).content
 
 
 def il_fetch_directory_listing(url: str) -> List[str]:
     """Fetch and parse directory listing to get file names."""
     resp = il_http_get(url)
-    parser = DirectoryListingParser()
-    parser.feed(resp.text)
-    return parser.files
+    files = []
+    for match in DIRECTORY_HREF_PATTERN.finditer(resp.content):
+        value = match.group(1).decode('latin-1')
+        if value.startswith('?'):
+            continue
+        # Handle both relative and absolute paths
+        if value.startswith('/'):
+            # Extract just the filename from absolute paths
+            filename = value.rsplit('/', 1)[-1]
+            if filename and filename.endswith('.xml'):
+                files.append(filename)
+        else:
+            files.append(value)
+    return files
 
 
 # =======================
 # Name normalization and matching
 # =======================
+@lru_cache(maxsize=8192)
 def normalize_name(raw_name: str) -> str:
     """
     Normalize name for matching:
     1. Remove title prefix (Rep., Sen., Representative, Senator)
     2. Remove suffix (Jr., Sr., II, III, IV)
     3. Lowercase and strip whitespace
+
+    Cached: the same few hundred names recur across thousands of bills.
     """
     if not raw_name:
         return ""
 
-    # Step 1: Remove title
-    name = TITLE_PATTERN.sub('', raw_name.strip())
+    # A plain scan; same result as TITLE_PATTERN then SUFFIX_PATTERN.
+    name = raw_name.strip()
 
-    # Step 2: Remove suffix
-    name = SUFFIX_PATTERN.sub('', name)
+    # Step 1: Remove title prefix (must be followed by whitespace)
+    lowered = name.lower()
+    for title in NAME_TITLES:
+        if lowered.startswith(title) and name[len(title):len(title) + 1].isspace():
+            name = name[len(title):].lstrip()
+            break
 
-    # Step 3: Normalize whitespace and case
-    name = ' '.join(name.split()).lower().strip()
+    # Step 2: Remove suffix (a whitespace-separated last token, optional comma before it)
+    parts = name.rsplit(None, 1)
+    if len(parts) == 2 and parts[1].lower() in NAME_SUFFIXES:
+        name = parts[0][:-1] if parts[0].endswith(',') else parts[0]
 
-    return name
+    # Step 3: Normalize whitespace and case
+    return ' '.join(name.split()).lower()
 
 
+@lru_cache(maxsize=8192)
 def normalize_name_for_lookup(raw_name: str) -> str:
     """
     Create a simplified lookup key from a name.
@@ -184,17 +232,19 @@ def normalize_name_for_lookup(raw_name: str) -> str:
 
 
 def _parse_action_date(date_str: str) -> Optional[datetime]:
-    """Parse IL action date in M/D/YYYY format."""
+    """Parse IL action date in M/D/YYYY format (or YYYY-MM-DD, as stored in the database)."""
     if not date_str:
         return None
     try:
+        if "-" in date_str:
+            return datetime.strptime(date_str.strip(), "%Y-%m-%d")
         return datetime.strptime(date_str.strip(), "%m/%d/%Y")
     except ValueError:
         return None
 
 
 def _calculate_days_between(start_date_str: str, end_date_str: str) -> Optional[int]:
-    """Calculate days between two date strings in M/D/YYYY format."""
+    """Calculate days between two IL date strings (see _parse_action_date)."""
     start = _parse_action_date(start_date_str)
     end = _parse_action_date(end_date_str)
     if start and end:
@@ -407,18 +457,18 @@ def _split_name_list(raw: str) -> List[str]:
         text = text[1:-1].strip()
 
     # Remove leading title like "Rep." / "Reps."
-    text = re.sub(r'^(Reps?\.|Rep\.|Sens?\.|Sen\.|Representatives?|Senators?)\s+', '', text, flags=re.IGNORECASE)
+    text = NAME_LIST_TITLE_PATTERN.sub('', text)
 
     # Protect suffix commas like "Coffey, Jr."
-    text = re.sub(r',\s*(Jr\.?|Sr\.?|II|III|IV|V)\b', r' \1', text)
+    text = SUFFIX_COMMA_PATTERN.sub(r' \1', text)
 
     # Normalize separators
-    text = re.sub(r'\s+and\s+', ', ', text, flags=re.IGNORECASE)
+    text = AND_SEPARATOR_PATTERN.sub(', ', text)
 
     parts = [p.strip() for p in text.split(',') if p.strip()]
     names: List[str] = []
     for part in parts:
-        part = re.sub(r'^(Reps?\.|Rep\.|Sens?\.|Sen\.|Representatives?|Senators?)\s+', '', part, flags=re.IGNORECASE)
+        part = NAME_LIST_TITLE_PATTERN.sub('', part)
         part = _strip_action_suffixes(part)
         if part:
             names.append(part)
@@ -470,7 +520,7 @@ def _extract_primary_sponsor_from_actions(actions: List[Dict[str, Any]]) -> Opti
         filed_match = PRIMARY_FILED_PATTERN.search(text)
         if filed_match:
             name_text = _strip_action_suffixes(filed_match.group(2) or "")
-            if not re.search(r'(Rep\.|Sen\.|Representative|Senator)', name_text, re.IGNORECASE):
+            if not TITLE_IN_NAME_PATTERN.search(name_text):
                 continue
             cleaned = _strip_title_prefix(name_text)
             if cleaned:
@@ -495,7 +545,9 @@ def _parse_actions(root: ET.Element) -> List[Dict[str, Any]]:
 
     # Try flat action list first (<actions><statusdate>...</statusdate><action>...</action>...)
     # This is the format used by ILGA FTP XML files
-    actions_elem = root.find('.//actions') or root.find('.//Actions')
+    actions_elem = root.find('.//actions')
+    if actions_elem is None or not len(actions_elem):
+        actions_elem = root.find('.//Actions')
     if actions_elem is not None:
         current: Dict[str, Any] = {}
         for child in list(actions_elem):
@@ -535,28 +587,24 @@ def _parse_actions(root: ET.Element) -> List[Dict[str, Any]]:
     return actions
 
 
-def _apply_sponsor_action(names: List[str], name: str, add: bool) -> None:
-    """Add or remove a sponsor name with normalization-based de-duplication."""
+def _apply_sponsor_action(names: Dict[str, str], name: str, add: bool) -> None:
+    """Add or remove a sponsor name in a normalized-key -> name map (insertion ordered)."""
     if not name:
         return
     key = normalize_name(name)
     if not key:
         return
     if add:
-        if any(normalize_name(existing) == key for existing in names):
-            return
-        names.append(name)
+        names.setdefault(key, name)
     else:
-        for idx, existing in enumerate(list(names)):
-            if normalize_name(existing) == key:
-                del names[idx]
-                break
+        names.pop(key, None)
 
 
 def _extract_sponsor_changes_from_actions(actions: List[Dict[str, Any]]) -> Tuple[List[str], List[str]]:
     """Extract chief co-sponsors and co-sponsors from action text."""
-    chief_co: List[str] = []
-    co: List[str] = []
+    # Keyed by normalized name so duplicate checks and removals are O(1)
+    chief_co: Dict[str, str] = {}
+    co: Dict[str, str] = {}
 
     for action in actions:
         text = _normalize_action_text(action.get("text", ""))
@@ -579,7 +627,7 @@ def _extract_sponsor_changes_from_actions(actions: List[Dict[str, Any]]) -> Tupl
         if CO_ADD_PATTERN.search(text):
             names = _extract_names_from_action(text, CO_ADD_PATTERN)
             for name in names:
-                if any(normalize_name(existing) == normalize_name(name) for existing in chief_co):
+                if normalize_name(name) in chief_co:
                     continue
                 _apply_sponsor_action(co, name, True)
             continue
@@ -590,16 +638,16 @@ def _extract_sponsor_changes_from_actions(actions: List[Dict[str, Any]]) -> Tupl
                 _apply_sponsor_action(co, name, False)
             continue
 
-    return chief_co, co
+    return list(chief_co.values()), list(co.values())
 
 
 def _infer_chamber_from_name(raw_name: str) -> Optional[str]:
     """Infer chamber from title in raw name."""
     if not raw_name:
         return None
-    if re.search(r'\b(Sen\.|Senator)\b', raw_name, re.IGNORECASE):
+    if SENATE_TITLE_PATTERN.search(raw_name):
         return "senate"
-    if re.search(r'\b(Rep\.|Representative)\b', raw_name, re.IGNORECASE):
+    if HOUSE_TITLE_PATTERN.search(raw_name):
         return "house"
     return None
 
@@ -631,7 +679,10 @@ class ILNameMatcher:
         self.lookup_exact = {}  # Exact normalized name -> member
         self.lookup_simple = {}  # First + last name -> member
         self.lookup_last = {}  # Last name -> list of members
+        self.lookup_last_by_chamber = {}  # (last name, chamber) -> list of members
         self.unmatched: List[Dict[str, Any]] = []
+        # (sponsor name, chamber) -> member or None; sponsors recur on every bill
+        self._match_cache: Dict[Tuple[str, Optional[str]], Optional[Dict[str, Any]]] = {}
 
         self._build_lookups()
 
@@ -659,6 +710,7 @@ class ILNameMatcher:
                 if last_lower not in self.lookup_last:
                     self.lookup_last[last_lower] = []
                 self.lookup_last[last_lower].append(m)
+                self.lookup_last_by_chamber.setdefault((last_lower, m.get("chamber")), []).append(m)
 
     def match(self, sponsor_name: str, chamber: str = None) -> Optional[Dict[str, Any]]:
         """
@@ -668,6 +720,21 @@ class ILNameMatcher:
         if not sponsor_name:
             return None
 
+        cache_key = (sponsor_name, chamber)
+        if cache_key in self._match_cache:
+            member = self._match_cache[cache_key]
+        else:
+            member = self._match_cache[cache_key] = self._match_uncached(sponsor_name, chamber)
+
+        if member is None:
+            self.unmatched.append({
+                "name": sponsor_name,
+                "chamber": chamber,
+                "normalized": normalize_name(sponsor_name),
+            })
+        return member
+
+    def _match_uncached(self, sponsor_name: str, chamber: Optional[str]) -> Optional[Dict[str, Any]]:
         # Strategy 1: Exact normalized match
         exact_key = normalize_name(sponsor_name)
         if exact_key in self.lookup_exact:
@@ -685,28 +752,64 @@ class ILNameMatcher:
             candidates = self.lookup_last.get(last_name, [])
 
             # Filter by chamber if provided
-            if chamber and candidates:
-                chamber_filtered = [m for m in candidates if m.get("chamber") == chamber]
-                if len(chamber_filtered) == 1:
-                    return chamber_filtered[0]
+            if chamber:
+                chamber_candidates = self.lookup_last_by_chamber.get((last_name, chamber), ())
+                if len(chamber_candidates) == 1:
+                    return chamber_candidates[0]
 
             # If only one candidate with that last name, use it
             if len(candidates) == 1:
                 return candidates[0]
 
         # No match found
-        self.unmatched.append({
-            "name": sponsor_name,
-            "chamber": chamber,
-            "normalized": exact_key,
-        })
         return None
 
 
 # =======================
 # XML Parsing
 # =======================
-def parse_members_xml(xml_content: str, chamber: str, ga_session: int) -> List[Dict[str, Any]]:
+# lxml rejects str input that still carries an encoding declaration
+_XML_DECLARATION = re.compile(r'^\s*<\?xml[^>]*\?>')
+# lxml parser objects must not be shared between the fetch threads
+_xml_parsers = threading.local()
+
+
+def _parse_xml_document(xml_content: Union[str, bytes]):
+    if not lxml_available:
+        return ET.fromstring(xml_content)
+    parser = getattr(_xml_parsers, "parser", None)
+    if parser is None:
+        parser = _xml_parsers.parser = ET.XMLParser(
+            remove_comments=True, remove_pis=True, resolve_entities=False
+        )
+    if isinstance(xml_content, str):
+        xml_content = _XML_DECLARATION.sub('', xml_content, count=1)
+    return ET.fromstring(xml_content, parser)
+
+
+def _parse_xml(xml_content: Union[str, bytes]):
+    """
+    Parse an XML document into its root element, with lxml (libxml2) when
+    installed. The lxml parser is set up to match ElementTree: no comments or
+    processing instructions in the tree and no entity expansion.
+
+    Bytes go to the parser undecoded so it can honour the BOM and encoding
+    declaration itself; some ILGA files are Latin-1 without saying so, and
+    those are re-parsed from a Latin-1 decode.
+    """
+    try:
+        return _parse_xml_document(xml_content)
+    except ET.ParseError:
+        if not isinstance(xml_content, bytes):
+            raise
+        try:
+            xml_content.decode('utf-8')
+        except UnicodeDecodeError:
+            return _parse_xml_document(xml_content.decode('latin-1'))
+        raise
+
+
+def parse_members_xml(xml_content: Union[str, bytes], chamber: str, ga_session: int) -> List[Dict[str, Any]]:
     """
     Parse member XML file and return list of member dicts.
     Expected structure:
@@ -724,8 +827,8 @@ def parse_members_xml(xml_content: str, chamber: str, ga_session: int) -> List[D
     members = []
 
     try:
-        root = ET.fromstring(xml_content)
-    except ET.ParseError as e:
+        root = _parse_xml(xml_content)
+    except (ET.ParseError, ValueError) as e:
         print(f"[il_xml] Failed to parse members XML: {e}", flush=True)
         return members
 
@@ -761,7 +864,7 @@ def parse_members_xml(xml_content: str, chamber: str, ga_session: int) -> List[D
     return members
 
 
-def parse_bill_xml(xml_content: str, filename: str, ga_session: int) -> Optional[Dict[str, Any]]:
+def parse_bill_xml(xml_content: Union[str, bytes], filename: str, ga_session: int) -> Optional[Dict[str, Any]]:
     """
     Parse bill status XML file and return bill dict.
     Expected structure varies, but typically:
@@ -780,7 +883,7 @@ def parse_bill_xml(xml_content: str, filename: str, ga_session: int) -> Optional
     """
     # Extract bill type and number from filename
     # Format: 10400HB0001.xml or 10400SB0001.xml
-    match = re.match(r'(\d{3})00(HB|SB|HR|SR|HJR|SJR|HJRCA|SJRCA)(\d+)\.xml', filename, re.IGNORECASE)
+    match = BILL_FILENAME_PATTERN.match(filename)
     if not match:
         return None
 
@@ -789,8 +892,8 @@ def parse_bill_xml(xml_content: str, filename: str, ga_session: int) -> Optional
     bill_number = int(match.group(3))
 
     try:
-        root = ET.fromstring(xml_content)
-    except ET.ParseError as e:
+        root = _parse_xml(xml_content)
+    except (ET.ParseError, ValueError) as e:
         print(f"[il_xml] Failed to parse bill XML {filename}: {e}", flush=True)
         return None
 
@@ -834,7 +937,7 @@ def parse_bill_xml(xml_content: str, filename: str, ga_session: int) -> Optional
 
             # Track filing date (first Filed/Prefiled action)
             if filing_date is None and action_date:
-                if re.search(r'\b(Filed|Prefiled)\b', action_text, re.IGNORECASE):
+                if FILED_ACTION_PATTERN.search(action_text):
                     filing_date = action_date
 
             # Check for Public Act
@@ -923,8 +1026,6 @@ class ILDataFetcher:
         except Exception as e:
             print(f"[il_fetch] Error fetching House members: {e}", flush=True)
 
-        time.sleep(IL_REQUEST_DELAY)
-
         # Fetch Senate members
         senate_url = f"{self.members_url}/{self.ga_session}SenateMembers.xml"
         try:
@@ -941,7 +1042,7 @@ class ILDataFetcher:
         try:
             files = il_fetch_directory_listing(self.bills_url)
             # Filter to HB and SB files only (exclude amendments, resolutions, etc. for now)
-            bill_files = [f for f in files if re.match(r'\d{3}00(HB|SB)\d+\.xml', f, re.IGNORECASE)]
+            bill_files = [f for f in files if BILL_LIST_FILENAME_PATTERN.match(f)]
             print(f"[il_fetch] Found {len(bill_files)} bill XML files", flush=True)
             return bill_files
         except Exception as e:
@@ -953,12 +1054,16 @@ class ILDataFetcher:
         url = f"{self.bills_url}/{filename}"
         try:
             xml_content = il_fetch_xml(url)
-            time.sleep(IL_REQUEST_DELAY)
             return parse_bill_xml(xml_content, filename, self.ga_session)
         except Exception as e:
             print(f"[il_fetch] Error fetching bill {filename}: {e}", flush=True)
             return None
 
+    def fetch_bills(self, filenames: List[str]) -> Iterator[Optional[Dict[str, Any]]]:
+        """Fetch and parse bills concurrently, yielding results in input order."""
+        with ThreadPoolExecutor(max_workers=IL_MAX_WORKERS) as pool:
+            yield from pool.map(self.fetch_bill, filenames)
+
 
 # =======================
 # Cache helpers
@@ -1011,8 +1116,9 @@ def load_il_cache(ga_session: int) -> Optional[Dict[str, Any]]:
     fp = il_cache_path(ga_session)
     if os.path.exists(fp):
         try:
-            with open(fp, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(fp, "rb") as f:
+                raw = f.read()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
         except Exception:
             pass
 
@@ -1031,8 +1137,13 @@ def save_il_cache(ga_session: int, data: Dict[str, Any]) -> None:
     """Save Illinois stats to both file and database cache."""
     # Save to file (atomic write)
     tmp = il_cache_path(ga_session) + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f)
+    if orjson is not None:
+        # Non-str keys are stringified, matching json.dump.
+        payload = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data).encode("utf-8")
+    with open(tmp, "wb") as f:
+        f.write(payload)
     os.replace(tmp, il_cache_path(ga_session))
 
     # Save to database
@@ -1182,9 +1293,6 @@ def _rebuild_stats_from_db(ga_session: int, all_members: List[Dict[str, Any]], m
         "note": f"Data from Illinois General Assembly FTP XML files for the {ga_session}th GA ({years}).",
     }
 
-    # Update cache
-    save_il_cache(ga_session, stats)
-
     print(
         f"[il_build] Rebuilt from DB: {len(rows)} legislators, {len(db_bills)} bills, {len(laws)} laws",
         flush=True
@@ -1204,6 +1312,9 @@ def build_il_stats(ga_session: int, incremental: bool = True) -> Dict[str, Any]:
         ga_session: The GA session number (e.g., 104)
         incremental: If True, only fetch bills not already in the database.
                      If False, fetch all bills (full refresh).
+
+    The stats are returned, not cached; callers persist them once with
+    save_il_cache.
     """
     print(f"[il_build] Starting stats build for IL GA session {ga_session} (incremental={incremental})", flush=True)
 
@@ -1252,40 +1363,38 @@ def build_il_stats(ga_session: int, incremental: bool = True) -> Dict[str, Any]:
             # Re-fetch pending bills to check for updates
             pending_files = list(pending_by_file.keys())
             updates_found = 0
+            status_updates: List[Tuple[str, Dict[str, Any]]] = []
 
-            with ThreadPoolExecutor(max_workers=IL_MAX_WORKERS) as pool:
-                futures = {pool.submit(fetcher.fetch_bill, f): f for f in pending_files}
-                for fut in as_completed(futures):
-                    filename = futures[fut]
-                    try:
-                        new_bill = fut.result()
-                        if not new_bill:
-                            continue
-
-                        old_bill = pending_by_file.get(filename.lower())
-                        if not old_bill:
-                            continue
-
-                        # Option 2: Only update if latest_action_date changed
-                        old_date = old_bill.get("latest_action_date") or ""
-                        new_date = new_bill.get("latest_action_date") or ""
-
-                        if new_date != old_date:
-                            # Bill has been updated - check if it's now enacted
-                            bill_id = new_bill.get("bill_id")
-                            if bill_id:
-                                il_db.update_il_bill(bill_id, {
-                                    "public_act_number": new_bill.get("public_act_number"),
-                                    "latest_action_date": new_date,
-                                    "latest_action_text": new_bill.get("latest_action_text"),
-                                })
-                                updated_pending_bills.append(new_bill)
-                                updates_found += 1
-                                if new_bill.get("public_act_number"):
-                                    print(f"[il_build] Bill {bill_id} is now Public Act {new_bill['public_act_number']}", flush=True)
-
-                    except Exception as e:
-                        print(f"[il_build] Error checking pending bill {filename}: {e}", flush=True)
+            for filename, new_bill in zip(pending_files, fetcher.fetch_bills(pending_files)):
+                if not new_bill:
+                    continue
+
+                old_bill = pending_by_file.get(filename.lower())
+                if not old_bill:
+                    continue
+
+                # Option 2: Only update if latest_action_date changed
+                old_date = old_bill.get("latest_action_date") or ""
+                new_date = new_bill.get("latest_action_date") or ""
+
+                if new_date != old_date:
+                    # Bill has been updated - check if it's now enacted
+                    bill_id = new_bill.get("bill_id")
+                    if bill_id:
+                        status_updates.append((bill_id, {
+                            "public_act_number": new_bill.get("public_act_number"),
+                            "latest_action_date": new_date,
+                            "latest_action_text": new_bill.get("latest_action_text"),
+                        }))
+                        updated_pending_bills.append(new_bill)
+                        updates_found += 1
+                        if new_bill.get("public_act_number"):
+                            print(f"[il_build] Bill {bill_id} is now Public Act {new_bill['public_act_number']}", flush=True)
+
+            # Apply the updates in one transaction once fetching is done, so the
+            # write lock is not held across network calls.
+            if status_updates:
+                il_db.update_il_bills_batch(status_updates)
 
             print(f"[il_build] Updated {updates_found} pending bills with new status", flush=True)
 
@@ -1300,38 +1409,31 @@ def build_il_stats(ga_session: int, incremental: bool = True) -> Dict[str, Any]:
 
     print(f"[il_build] Fetching {len(bill_files)} bills...", flush=True)
 
-    with ThreadPoolExecutor(max_workers=IL_MAX_WORKERS) as pool:
-        futures = {pool.submit(fetcher.fetch_bill, f): f for f in bill_files}
-        done = 0
-        for fut in as_completed(futures):
-            try:
-                bill = fut.result()
-                if bill:
-                    bills.append(bill)
-                else:
-                    errors += 1
-            except Exception as e:
-                print(f"[il_build] Error processing {futures[fut]}: {e}", flush=True)
-                errors += 1
-
-            done += 1
-            if done % 100 == 0 or done == len(bill_files):
-                print(f"[il_build] Bills fetched: {done}/{len(bill_files)} (errors: {errors})", flush=True)
+    # fetch_bill logs and swallows its own errors, returning None
+    for done, bill in enumerate(fetcher.fetch_bills(bill_files), 1):
+        if bill:
+            bills.append(bill)
+        else:
+            errors += 1
+
+        if done % 100 == 0 or done == len(bill_files):
+            print(f"[il_build] Bills fetched: {done}/{len(bill_files)} (errors: {errors})", flush=True)
 
     print(f"[il_build] Successfully parsed {len(bills)} new bills", flush=True)
 
     # Step 4b: In incremental mode, merge with existing bills from database
     if incremental:
-        existing_bills = il_db.get_all_bills_for_session(ga_session)
-        print(f"[il_build] Merging with {len(existing_bills)} existing bills from database", flush=True)
         # Existing bills go first, new bills override by bill_id.
         # Updated pending bills also override (they have fresh data from server).
         merged_by_id: Dict[str, Dict[str, Any]] = {}
-        for bill in existing_bills:
+        existing_count = 0
+        for bill in il_db.iter_bills_for_session(ga_session):
+            existing_count += 1
             bill_id = bill.get("bill_id")
             if not bill_id:
                 continue
             merged_by_id[bill_id] = bill
+        print(f"[il_build] Merging with {existing_count} existing bills from database", flush=True)
         for bill in bills:
             bill_id = bill.get("bill_id")
             if not bill_id:
@@ -1344,7 +1446,7 @@ def build_il_stats(ga_session: int, incremental: bool = True) -> Dict[str, Any]:
                 continue
             merged_by_id[bill_id] = bill
         all_bills = list(merged_by_id.values())
-        removed_duplicates = (len(existing_bills) + len(bills) + len(updated_pending_bills)) - len(all_bills)
+        removed_duplicates = (existing_count + len(bills) + len(updated_pending_bills)) - len(all_bills)
         if removed_duplicates > 0:
             print(f"[il_build] Deduped {removed_duplicates} overlapping bills during merge", flush=True)
     else:
@@ -1498,9 +1600,9 @@ def build_il_stats(ga_session: int, incremental: bool = True) -> Dict[str, Any]:
     try:
         il_db.save_il_legislators_batch(ga_session, all_members)
         if bills:  # Only save if there are new bills
-            il_db.save_il_bills_batch(ga_session, bills)
+            members_by_id = {m["member_id"]: m for m in all_members if m.get("member_id")}
+            il_db.save_il_bills_batch(ga_session, bills, members_by_id)
         il_db.save_il_laws_batch(ga_session, laws)
-        il_db.save_il_stats_cache(ga_session, stats)
         print(f"[il_db] Persisted data for IL session {ga_session}", flush=True)
     except Exception as e:
         print(f"[il_db] Warning: Failed to persist to database: {e}", flush=True)
@@ -4,6 +4,7 @@ import time
 import json
 from typing import Dict, Any, List, Optional, Tuple, Iterable
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import zip_longest
 
 import requests
 from requests.exceptions import Timeout, RequestException, ConnectionError as ReqConnErr
@@ -246,7 +247,11 @@ def _load_bulk_bill_status_map(congress: int) -> Dict[str, Dict[str, Any]]:
     workers = int(os.environ.get("BILL_STATUS_BULK_WORKERS", "4"))
     data = bulk_status.load_bulk_bill_status(congress, base_dir=base_dir, max_workers=workers)
     _bulk_status_cache[cache_key] = data
-    print(f"[bulk] Loaded {len(data)} bill status XML records for Congress {congress}", flush=True)
+    print(
+        f"[bulk] Loaded {len(data)} bill status XML records for Congress {congress} "
+        f"(parser={bulk_status.XML_PARSER_BACKEND})",
+        flush=True,
+    )
     return data
 
 
@@ -508,13 +513,18 @@ def fetch_primary_sponsor_from_item(
 # -------------------------------
 # Cosponsor extraction helpers
 # -------------------------------
+_TRUTHY = frozenset(("true", "t", "yes", "y", "1"))
+
+
 def _boolish(value: Any) -> bool:
-    if isinstance(value, bool):
+    if value is None:
+        return False
+    if value is True or value is False:
         return value
-    if isinstance(value, int):
+    if type(value) is str:
+        return value.strip().lower() in _TRUTHY
+    if type(value) is int:
         return value != 0
-    if isinstance(value, str):
-        return value.strip().lower() in ("true", "t", "yes", "y", "1")
     return False
 
 
@@ -934,24 +944,39 @@ def build_stats(
         bill_key: str,
         bill_obj: Dict[str, Any],
         update_date: Optional[str],
-        cosponsors: List[Dict[str, Any]],
+        cosponsors: Any,
         mark_refreshed: bool,
     ) -> None:
+        """Record one bill's cosponsors, given as a list of dicts or bulk XML's columns."""
         if mark_refreshed:
             refreshed_bill_ids.append(bill_key)
             refreshed_updates[bill_key] = update_date
         if include_cosponsors_in_memory:
+            if isinstance(cosponsors, dict):
+                # Per-row dicts are only needed for the in-memory totals
+                cosponsors = list(bulk_status.iter_cosponsor_rows(cosponsors))
             cosponsors_by_bill[bill_key] = cosponsors
             bill_by_key[bill_key] = bill_obj
-        for c in cosponsors:
-            bioguide = c.get("bioguideId")
+        if isinstance(cosponsors, dict):
+            columns = zip_longest(
+                cosponsors.get("bioguideId") or (),
+                cosponsors.get("is_original") or (),
+                cosponsors.get("withdrawn") or (),
+                fillvalue=0,
+            )
+        else:
+            columns = (
+                (c.get("bioguideId"), c.get("is_original"), c.get("withdrawn"))
+                for c in cosponsors or ()
+            )
+        for bioguide, is_original, withdrawn in columns:
             if not bioguide:
                 continue
             cosponsor_records.append({
                 "bill_id": bill_key,
                 "bioguide_id": bioguide,
-                "is_original": bool(c.get("is_original")),
-                "withdrawn": bool(c.get("withdrawn")),
+                "is_original": bool(is_original),
+                "withdrawn": bool(withdrawn),
             })
 
     if cosponsor_targets:
@@ -960,8 +985,7 @@ def build_stats(
         for b, bill_key, update_date in cosponsor_targets:
             bulk_entry = bulk_by_bill.get(bill_key) if bulk_by_bill else None
             if bulk_entry is not None and cosponsor_source in ("bulk", "auto"):
-                cosponsors = bulk_entry.get("cosponsors") or []
-                _record_cosponsors(bill_key, b, update_date, cosponsors, mark_refreshed=True)
+                _record_cosponsors(bill_key, b, update_date, bulk_entry.get("cosponsors"), mark_refreshed=True)
                 bulk_hits += 1
                 continue
             if cosponsor_source == "bulk":
@@ -1117,43 +1141,45 @@ def build_stats(
     # Save to database for persistence
     final_stats = stats
     try:
-        # Save legislators
-        db.save_legislators_batch(rows)
-
-        # Prepare bills with sponsor info for database
-        bills_with_sponsors = []
-        for b, sponsor_info in pairs:
-            if sponsor_info:
-                b["_sponsor_info"] = sponsor_info
-                bills_with_sponsors.append(b)
-        db.save_bills_batch(congress, bills_with_sponsors)
-
-        # Save bill cosponsors
-        if cosponsor_mode == "full":
-            db.clear_bill_cosponsors_for_congress(congress)
-        elif cosponsor_mode == "incremental" and refreshed_bill_ids:
-            db.delete_bill_cosponsors_for_bills(congress, refreshed_bill_ids)
-
-        if cosponsor_records:
-            db.save_bill_cosponsors_batch(congress, cosponsor_records)
-        if cosponsor_mode in ("full", "incremental") and refreshed_updates:
-            db.mark_bill_cosponsors_refreshed(congress, refreshed_updates)
-
-        # Save laws with sponsor info
-        for law in laws:
-            bill = law.get("bill") or law
-            bill_type = (bill.get("type") or "").lower()
-            bill_number = bill.get("number")
-            if bill_type and bill_number:
-                bill_key = normalize_bill_key(congress, bill_type, bill_number)
-                # Find sponsor from our pairs
-                for b, sponsor_info in pairs:
-                    b_type = (b.get("type") or "").lower()
-                    b_num = b.get("number")
-                    if b_type == bill_type and b_num == bill_number and sponsor_info:
-                        law["_sponsor_bioguide_id"] = sponsor_info["bioguideId"]
-                        break
-        db.save_laws_batch(congress, laws)
+        # One transaction for all the row writes below
+        with db.bulk_transaction():
+            # Save legislators
+            db.save_legislators_batch(rows)
+
+            # Prepare bills with sponsor info for database
+            bills_with_sponsors = []
+            for b, sponsor_info in pairs:
+                if sponsor_info:
+                    b["_sponsor_info"] = sponsor_info
+                    bills_with_sponsors.append(b)
+            db.save_bills_batch(congress, bills_with_sponsors)
+
+            # Save bill cosponsors
+            if cosponsor_mode == "full":
+                db.clear_bill_cosponsors_for_congress(congress)
+            elif cosponsor_mode == "incremental" and refreshed_bill_ids:
+                db.delete_bill_cosponsors_for_bills(congress, refreshed_bill_ids)
+
+            if cosponsor_records:
+                db.save_bill_cosponsors_batch(congress, cosponsor_records)
+            if cosponsor_mode in ("full", "incremental") and refreshed_updates:
+                db.mark_bill_cosponsors_refreshed(congress, refreshed_updates)
+
+            # Save laws with sponsor info
+            for law in laws:
+                bill = law.get("bill") or law
+                bill_type = (bill.get("type") or "").lower()
+                bill_number = bill.get("number")
+                if bill_type and bill_number:
+                    bill_key = normalize_bill_key(congress, bill_type, bill_number)
+                    # Find sponsor from our pairs
+                    for b, sponsor_info in pairs:
+                        b_type = (b.get("type") or "").lower()
+                        b_num = b.get("number")
+                        if b_type == bill_type and b_num == bill_number and sponsor_info:
+                            law["_sponsor_bioguide_id"] = sponsor_info["bioguideId"]
+                            break
+            db.save_laws_batch(congress, laws)
 
         # Save stats cache
         if use_db_cosponsor_totals:
@@ -7,7 +7,7 @@ import sys
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from bulk_bill_status import parse_bill_status_xml, load_bulk_bill_status
+from bulk_bill_status import iter_cosponsor_rows, parse_bill_status_xml, load_bulk_bill_status
 
 
 def test_parse_bill_status_xml_with_namespace():
@@ -45,9 +45,15 @@ def test_parse_bill_status_xml_with_namespace():
     assert parsed is not None
     assert parsed["bill_id"] == "119-hr-123"
     assert parsed["sponsor"]["bioguideId"] == "A000001"
-    assert len(parsed["cosponsors"]) == 2
-    assert parsed["cosponsors"][0]["is_original"] is True
-    assert parsed["cosponsors"][1]["withdrawn"] is True
+    cosponsors = parsed["cosponsors"]
+    assert cosponsors["bioguideId"] == ["B000002", "C000003"]
+    assert list(cosponsors["is_original"]) == [1, 0]
+    assert list(cosponsors["withdrawn"]) == [0, 1]
+
+    rows = list(iter_cosponsor_rows(cosponsors))
+    assert len(rows) == 2
+    assert rows[0]["is_original"] is True
+    assert rows[1]["withdrawn"] is True
 
 
 def test_load_bulk_bill_status_filters_congress(tmp_path):
@@ -63,3 +69,30 @@ def test_load_bulk_bill_status_filters_congress(tmp_path):
     assert "119-hr-1" in records
     assert "118-s-2" not in records
 
+
+def test_load_bulk_bill_status_skips_other_congress_filenames(tmp_path):
+    xml_119 = """<billStatus><bill><congress>119</congress><billType>hr</billType><billNumber>5</billNumber></bill></billStatus>"""
+    # Filename claims the 118th Congress, so the file is never parsed.
+    (tmp_path / "BILLSTATUS-118hr5.xml").write_text(xml_119, encoding="utf-8")
+    (tmp_path / "BILLSTATUS-119hr5.xml").write_text(xml_119, encoding="utf-8")
+
+    records = load_bulk_bill_status(119, str(tmp_path), max_workers=1)
+    assert list(records) == ["119-hr-5"]
+
+
+def test_parse_bill_status_xml_congress_mismatch_returns_none():
+    xml_text = """<billStatus><bill><congress>118</congress><billType>s</billType><billNumber>2</billNumber></bill></billStatus>"""
+    assert parse_bill_status_xml(xml_text, congress=119) is None
+    assert parse_bill_status_xml(xml_text, congress=118)["bill_id"] == "118-s-2"
+
+
+def test_discover_xml_files_cache_sees_new_files(tmp_path):
+    from bulk_bill_status import _discover_xml_files
+
+    (tmp_path / "a.xml").write_text("<a/>", encoding="utf-8")
+    assert _discover_xml_files(str(tmp_path)) == [str(tmp_path / "a.xml")]
+
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    (sub / "b.xml").write_text("<b/>", encoding="utf-8")
+    assert _discover_xml_files(str(tmp_path)) == [str(tmp_path / "a.xml"), str(sub / "b.xml")]
@@ -45,6 +45,12 @@ class TestExtractCosponsors:
 
 
 class TestCosponsorAggregation:
+    @pytest.fixture(autouse=True)
+    def no_db_transaction(self):
+        """The save helpers are mocked below; keep build_stats' transaction off the real DB too."""
+        with patch("main.db.bulk_transaction"):
+            yield
+
     @patch("main.fetch_all_laws_for_congress")
     @patch("main.fetch_cosponsors_for_bill")
     @patch("main.db.save_legislators_batch")
@@ -320,6 +326,60 @@ class TestCosponsorAggregation:
         assert rows["C3"]["cosponsor_total"] == 1
         mock_fetch_cosponsors.assert_not_called()
 
+    @patch("main._load_bulk_bill_status_map")
+    @patch("main.db.get_stats_from_db")
+    @patch("main.db.get_bill_cosponsor_refresh_map")
+    @patch("main.db.mark_bill_cosponsors_refreshed")
+    @patch("main.db.delete_bill_cosponsors_for_bills")
+    @patch("main.db.save_bill_cosponsors_batch")
+    @patch("main.db.save_legislators_batch")
+    @patch("main.db.save_bills_batch")
+    @patch("main.db.save_laws_batch")
+    @patch("main.db.save_stats_cache")
+    @patch("main.fetch_all_laws_for_congress")
+    def test_build_stats_columnar_bulk_cosponsors_skip_row_dicts(
+        self,
+        mock_fetch_laws,
+        mock_save_stats,
+        mock_save_laws,
+        mock_save_bills,
+        mock_save_legs,
+        mock_save_cosponsors,
+        mock_delete_cosponsors,
+        mock_mark_cosponsors,
+        mock_refresh_map,
+        mock_get_stats,
+        mock_load_bulk,
+    ):
+        """Bulk XML's cosponsor columns become DB records without per-row dicts."""
+        mock_fetch_laws.return_value = []
+        mock_refresh_map.return_value = {}
+        mock_get_stats.return_value = {"congress": 119, "rows": [], "summary": {}}
+        mock_load_bulk.return_value = {
+            "119-hr-1": {
+                "sponsor": {"bioguideId": "A1", "fullName": "Rep. Alpha", "party": "D", "state": "NY", "chamber": "House"},
+                "cosponsors": {
+                    "bioguideId": ["C3", "", "D4"],
+                    "fullName": ["Rep. Gamma", "Rep. Nobody", "Rep. Delta"],
+                    "party": ["D", "", "R"],
+                    "state": ["CA", "", "FL"],
+                    "chamber": ["House", "", "House"],
+                    "is_original": bytearray([1, 0, 0]),
+                    "withdrawn": bytearray([0, 0, 1]),
+                },
+            }
+        }
+        bills = [{"type": "hr", "number": 1, "updateDate": "2024-01-01", "originChamber": "House"}]
+
+        with patch("main.fetch_all_bills_for_congress", return_value=bills), \
+                patch("main.bulk_status.iter_cosponsor_rows", side_effect=AssertionError("row dicts built")):
+            build_stats(119, cosponsor_mode="incremental", cosponsor_source="bulk")
+
+        mock_save_cosponsors.assert_called_once_with(119, [
+            {"bill_id": "119-hr-1", "bioguide_id": "C3", "is_original": True, "withdrawn": False},
+            {"bill_id": "119-hr-1", "bioguide_id": "D4", "is_original": False, "withdrawn": True},
+        ])
+
     @patch("main._load_bulk_bill_status_map")
     @patch("main.fetch_all_laws_for_congress")
     @patch("main.fetch_cosponsors_for_bill")
@@ -1,8 +1,12 @@
 """
 Tests for GovInfo BILLSTATUS bulk sync helpers.
 """
+import io
+import json
 import os
+import sqlite3
 import sys
+import zipfile
 from unittest.mock import patch
 
 # Add parent directory to path for imports
@@ -21,6 +25,18 @@ class _Resp:
         return self._payload
 
 
+def _fake_download(payload):
+    """side_effect for _download_to that writes payload to the target path."""
+    def download(url, path, api_key, session, validators=None):
+        if validators and validators.get("etag") == '"v1"':
+            return {"not_modified": True}
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(payload)
+        return {"etag": '"v1"', "last_modified": None}
+    return download
+
+
 class _FakeSession:
     def __init__(self, mapping):
         self.mapping = mapping
@@ -64,17 +80,17 @@ def test_discover_billstatus_files_walks_json_tree():
     assert files[0].modified == "2026-01-01T00:00:00Z"
 
 
-@patch("govinfo_bulk_sync.discover_billstatus_files")
-@patch("govinfo_bulk_sync._download_bytes")
+@patch("govinfo_bulk_sync.iter_billstatus_listings")
+@patch("govinfo_bulk_sync._download_to")
 def test_sync_billstatus_bulk_uses_manifest_skip(mock_download, mock_discover, tmp_path):
-    mock_discover.return_value = [
+    mock_discover.return_value = [[
         RemoteFile(
             url="https://www.govinfo.gov/bulkdata/BILLSTATUS/119/hr/BILLSTATUS-119hr1.xml",
             relative_path="119/hr/BILLSTATUS-119hr1.xml",
             modified="2026-01-01T00:00:00Z",
         )
-    ]
-    mock_download.return_value = b"<billStatus></billStatus>"
+    ]]
+    mock_download.side_effect = _fake_download(b"<billStatus></billStatus>")
 
     first = sync_billstatus_bulk(119, dest_dir=str(tmp_path))
     assert first["downloaded"] == 1
@@ -84,3 +100,131 @@ def test_sync_billstatus_bulk_uses_manifest_skip(mock_download, mock_discover, t
     assert second["downloaded"] == 0
     assert second["skipped"] == 1
     assert mock_download.call_count == 1
+
+
+@patch("govinfo_bulk_sync.iter_billstatus_listings")
+@patch("govinfo_bulk_sync._download_to")
+def test_sync_billstatus_bulk_extracts_zip_members(mock_download, mock_discover, tmp_path):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("BILLSTATUS-119hr1.xml", "<billStatus/>")
+        zf.writestr("README.txt", "ignored")
+    mock_discover.return_value = [[
+        RemoteFile(
+            url="https://www.govinfo.gov/bulkdata/BILLSTATUS/119/hr/BILLSTATUS-119-hr.zip",
+            relative_path="119/hr/BILLSTATUS-119-hr.zip",
+            modified="2026-01-01T00:00:00Z",
+        )
+    ]]
+    mock_download.side_effect = _fake_download(buf.getvalue())
+
+    summary = sync_billstatus_bulk(119, dest_dir=str(tmp_path))
+
+    assert summary["downloaded"] == 1
+    written = tmp_path / "119" / "hr" / "BILLSTATUS-119hr1.xml"
+    assert written.read_text() == "<billStatus/>"
+    assert not (tmp_path / "119" / "hr" / "README.txt").exists()
+    assert not list(tmp_path.glob("*.zip"))
+
+
+@patch("govinfo_bulk_sync.iter_billstatus_listings")
+@patch("govinfo_bulk_sync._download_to")
+def test_sync_billstatus_bulk_conditional_get_without_modified(mock_download, mock_discover, tmp_path):
+    mock_discover.return_value = [[
+        RemoteFile(
+            url="https://www.govinfo.gov/bulkdata/BILLSTATUS/119/hr/BILLSTATUS-119hr1.xml",
+            relative_path="119/hr/BILLSTATUS-119hr1.xml",
+            modified=None,
+        )
+    ]]
+    mock_download.side_effect = _fake_download(b"<billStatus></billStatus>")
+
+    first = sync_billstatus_bulk(119, dest_dir=str(tmp_path))
+    assert first["downloaded"] == 1
+
+    # No listing timestamp, so the stored ETag drives a 304 skip.
+    second = sync_billstatus_bulk(119, dest_dir=str(tmp_path))
+    assert second["downloaded"] == 0
+    assert second["skipped"] == 1
+    assert mock_download.call_args.args[4] == {
+        "source_url": "https://www.govinfo.gov/bulkdata/BILLSTATUS/119/hr/BILLSTATUS-119hr1.xml",
+        "modified": None,
+        "etag": '"v1"',
+        "last_modified": None,
+    }
+
+
+@patch("govinfo_bulk_sync.iter_billstatus_listings")
+@patch("govinfo_bulk_sync._download_to")
+def test_sync_billstatus_bulk_imports_json_manifest(mock_download, mock_discover, tmp_path):
+    legacy = tmp_path / ".billstatus_manifest.json"
+    legacy.write_text(json.dumps({
+        "119/hr/BILLSTATUS-119hr1.xml": {
+            "source_url": "https://www.govinfo.gov/bulkdata/BILLSTATUS/119/hr/BILLSTATUS-119hr1.xml",
+            "modified": "2026-01-01T00:00:00Z",
+        }
+    }))
+    mock_discover.return_value = [[
+        RemoteFile(
+            url="https://www.govinfo.gov/bulkdata/BILLSTATUS/119/hr/BILLSTATUS-119hr1.xml",
+            relative_path="119/hr/BILLSTATUS-119hr1.xml",
+            modified="2026-01-01T00:00:00Z",
+        )
+    ]]
+
+    summary = sync_billstatus_bulk(119, dest_dir=str(tmp_path))
+
+    assert summary["skipped"] == 1
+    assert mock_download.call_count == 0
+    assert not legacy.exists()
+
+
+@patch("govinfo_bulk_sync.iter_billstatus_listings")
+@patch("govinfo_bulk_sync._download_to")
+def test_sync_billstatus_bulk_reads_manifest_once_per_listing(mock_download, mock_discover, tmp_path):
+    mock_discover.return_value = [[
+        RemoteFile(
+            url=f"https://www.govinfo.gov/bulkdata/BILLSTATUS/119/hr/BILLSTATUS-119hr{n}.xml",
+            relative_path=f"119/hr/BILLSTATUS-119hr{n}.xml",
+            modified="2026-01-01T00:00:00Z",
+        )
+        for n in range(1, 4)
+    ]]
+    mock_download.side_effect = _fake_download(b"<billStatus></billStatus>")
+
+    with patch("govinfo_bulk_sync._load_manifest_entries", return_value={}) as mock_lookup:
+        summary = sync_billstatus_bulk(119, dest_dir=str(tmp_path))
+
+    assert summary["discovered"] == 3
+    assert summary["downloaded"] == 3
+    assert mock_lookup.call_count == 1
+    assert len(mock_lookup.call_args.args[1]) == 3
+
+
+@patch("govinfo_bulk_sync.iter_billstatus_listings")
+@patch("govinfo_bulk_sync._download_to")
+def test_sync_billstatus_bulk_not_modified_records_listing_timestamp(mock_download, mock_discover, tmp_path):
+    url = "https://www.govinfo.gov/bulkdata/BILLSTATUS/119/hr/BILLSTATUS-119hr1.xml"
+    rel_path = "119/hr/BILLSTATUS-119hr1.xml"
+    mock_download.side_effect = _fake_download(b"<billStatus></billStatus>")
+
+    mock_discover.return_value = [[RemoteFile(url=url, relative_path=rel_path, modified="2026-01-01T00:00:00Z")]]
+    sync_billstatus_bulk(119, dest_dir=str(tmp_path))
+
+    # The listing timestamp moved but the server still answers 304.
+    mock_discover.return_value = [[RemoteFile(url=url, relative_path=rel_path, modified="2026-02-01T00:00:00Z")]]
+    second = sync_billstatus_bulk(119, dest_dir=str(tmp_path))
+    assert second["skipped"] == 1
+    assert mock_download.call_count == 2
+
+    # The manifest now carries the new timestamp, so no request is made.
+    third = sync_billstatus_bulk(119, dest_dir=str(tmp_path))
+    assert third["skipped"] == 1
+    assert mock_download.call_count == 2
+
+    conn = sqlite3.connect(str(tmp_path / ".billstatus_manifest.sqlite"))
+    row = conn.execute(
+        "SELECT modified, etag FROM billstatus_manifest WHERE rel_path = ?", (rel_path,)
+    ).fetchone()
+    conn.close()
+    assert row == ("2026-02-01T00:00:00Z", '"v1"')
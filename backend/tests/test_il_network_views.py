@@ -111,3 +111,27 @@ def test_get_il_network_data_edge_bundling_includes_hierarchy(temp_network_db):
     assert "hierarchy" in payload
     leaf_ids = set(_collect_leaf_ids(payload["hierarchy"]))
     assert leaf_ids == {"104-house-1", "104-house-2"}
+
+
+def test_network_cosponsor_rows_resolve_when_roster_saved_later(temp_network_db):
+    temp_network_db.save_il_bills_batch(104, [
+        {
+            "bill_type": "hb",
+            "bill_number": n,
+            "sponsor_member_id": "104-house-1",
+            "chief_co_sponsors": ["Rep. Bob Brown"],
+            "co_sponsors": ["Bob Brown", "Nobody Known"],
+        }
+        for n in (1, 2)
+    ])
+    temp_network_db.save_il_legislators_batch(104, [
+        {"member_id": "104-house-1", "chamber": "house", "district": 1, "name": "Alice Adams",
+         "first_name": "Alice", "last_name": "Adams", "party": "D"},
+        {"member_id": "104-house-2", "chamber": "house", "district": 2, "name": "Bob Brown",
+         "first_name": "Bob", "last_name": "Brown", "party": "R"},
+    ])
+
+    payload = temp_network_db.get_il_network_data(104, min_connections=2)
+    assert payload["links"] == [{"source": "104-house-1", "target": "104-house-2", "value": 2}]
+
+    assert temp_network_db.get_il_network_data(104, min_connections=3)["links"] == []
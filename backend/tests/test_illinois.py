@@ -232,6 +232,17 @@ class TestILNameMatcher:
         assert result is not None
         assert result["member_id"] == "104-senate-15"
 
+    def test_last_name_chamber_lookup_and_repeat_misses(self, sample_members):
+        """Last-name matches use the chamber index; repeated misses are still tracked."""
+        matcher = ILNameMatcher(sample_members)
+        assert matcher.match("Rep. Johnson", "house")["member_id"] == "104-house-10"
+        assert matcher.match("Sen. Johnson", "senate")["member_id"] == "104-senate-15"
+        assert matcher.match("Johnson") is None
+
+        matcher.match("Rep. Unknown Person", "house")
+        matcher.match("Rep. Unknown Person", "house")
+        assert [u["name"] for u in matcher.unmatched] == ["Johnson"] + ["Rep. Unknown Person"] * 2
+
     def test_empty_sponsor_name(self, sample_members):
         """Test empty sponsor name returns None."""
         matcher = ILNameMatcher(sample_members)
@@ -383,6 +394,17 @@ class TestBillXMLParsing:
         bill = parse_bill_xml(self.SAMPLE_ENACTED_BILL_XML, "10400HB0001.xml", 104)
         assert bill["bill_id"] == "104-hb-1"
 
+    def test_parse_bill_from_bytes(self):
+        """Raw bytes parse directly, including a BOM or undeclared Latin-1."""
+        utf8 = b"\xef\xbb\xbf" + self.SAMPLE_ENACTED_BILL_XML.strip().encode("utf-8")
+        bill = parse_bill_xml(utf8, "10400HB0001.xml", 104)
+        assert bill["public_act_number"] == "104-0001"
+
+        latin1 = self.SAMPLE_NON_ENACTED_BILL_XML.strip().replace(
+            "Jane Doe", "Jos\u00e9 Doe").encode("latin-1")
+        bill = parse_bill_xml(latin1, "10400HB0002.xml", 104)
+        assert bill["primary_sponsor_name"] == "Rep. Jos\u00e9 Doe"
+
 
 class TestActionSponsorParsing:
     """Tests for parsing sponsor roles from action lists."""
@@ -474,6 +496,23 @@ class TestSessionHelpers:
         assert sessions[0]["current"] is True
 
 
+class TestILHttpSession:
+    """Tests for the shared ILGA HTTP session."""
+
+    def test_retry_backoff_matches_polite_delays(self):
+        """Retries wait 1.2s and then 2.4s, never hitting ILGA back-to-back."""
+        from illinois_stats import _new_il_session
+
+        retry = _new_il_session().get_adapter("https://www.ilga.gov/").max_retries
+        assert retry.get_backoff_time() == 0
+
+        retry = retry.increment(method="GET", url="/", error=ConnectionError())
+        assert retry.get_backoff_time() == pytest.approx(1.2)
+
+        retry = retry.increment(method="GET", url="/", error=ConnectionError())
+        assert retry.get_backoff_time() == pytest.approx(2.4)
+
+
 class TestILDatabase:
     """Tests for Illinois database operations."""
 
@@ -496,6 +535,7 @@ class TestILDatabase:
 
     def test_init_il_database(self, temp_db):
         """Test Illinois database initialization."""
+        temp_db.init_il_database()
         conn = sqlite3.connect(os.environ["DATABASE_PATH"])
         cursor = conn.cursor()
 
@@ -508,6 +548,9 @@ class TestILDatabase:
         assert "il_laws" in tables
         assert "il_cache_metadata" in tables
 
+        cursor.execute("SELECT version FROM il_schema_version")
+        assert cursor.fetchone()[0] == temp_db.IL_SCHEMA_VERSION
+
         conn.close()
 
     def test_save_and_load_il_legislators(self, temp_db):
@@ -559,6 +602,137 @@ class TestILDatabase:
 
         assert row is not None
 
+    def test_save_il_bills_batch_packs_rows(self, temp_db):
+        """Batches larger than one packed statement are written in full."""
+        bills = [
+            {"bill_type": "hb", "bill_number": n, "title": f"Bill {n}"}
+            for n in range(1, 131)
+        ]
+        temp_db.save_il_bills_batch(104, bills)
+
+        conn = sqlite3.connect(os.environ["DATABASE_PATH"])
+        count = conn.execute("SELECT COUNT(*) FROM il_bills WHERE ga_session = 104").fetchone()[0]
+        title = conn.execute("SELECT title FROM il_bills WHERE bill_id = '104-hb-130'").fetchone()[0]
+        conn.close()
+
+        assert count == 130
+        assert title == "Bill 130"
+
+    def test_save_il_bills_batch_upsert_skips_unchanged_rows(self, temp_db):
+        """Re-saving an identical bill leaves the row alone; a change updates it."""
+        bill = {"bill_type": "hb", "bill_number": 1, "title": "Original"}
+        temp_db.save_il_bills_batch(104, [bill])
+
+        conn = sqlite3.connect(os.environ["DATABASE_PATH"])
+        conn.execute("UPDATE il_bills SET updated_at = 1")
+        conn.commit()
+
+        temp_db.save_il_bills_batch(104, [bill])
+        assert conn.execute("SELECT updated_at FROM il_bills").fetchone()[0] == 1
+
+        temp_db.save_il_bills_batch(104, [dict(bill, title="Changed")])
+        title, updated_at = conn.execute("SELECT title, updated_at FROM il_bills").fetchone()
+        conn.close()
+        assert title == "Changed"
+        assert updated_at > 1
+
+    def test_il_stats_from_db_uses_denormalized_sponsor(self, temp_db):
+        """Bills carry their sponsor's party/chamber and enacted flag."""
+        temp_db.save_il_legislators_batch(104, [
+            {"member_id": "104-house-1", "chamber": "house", "district": 1,
+             "name": "John Smith", "party": "D"},
+        ])
+        temp_db.save_il_bills_batch(104, [
+            {"bill_type": "hb", "bill_number": 1, "sponsor_member_id": "104-house-1",
+             "public_act_number": "104-0001"},
+            {"bill_type": "hb", "bill_number": 2, "sponsor_member_id": "104-house-1"},
+        ])
+        temp_db.update_il_bill("104-hb-2", {"public_act_number": "104-0002"})
+
+        conn = sqlite3.connect(os.environ["DATABASE_PATH"])
+        row = conn.execute(
+            "SELECT sponsor_party, sponsor_chamber, sponsor_district, is_enacted "
+            "FROM il_bills WHERE bill_id = '104-hb-1'"
+        ).fetchone()
+        conn.close()
+        assert row == ("D", "house", 1, 1)
+
+        stats = temp_db.get_il_stats_from_db(104)
+        assert stats["rows"] == [{
+            "memberId": "104-house-1",
+            "sponsorName": "John Smith",
+            "party": "D",
+            "chamber": "house",
+            "district": 1,
+            "sponsored_total": 2,
+            "enacted_total": 2,
+        }]
+
+    def test_il_sponsor_stats_follow_bill_writes(self, temp_db):
+        """Triggers keep il_sponsor_stats in step with inserts, updates and deletes."""
+        temp_db.save_il_legislators_batch(104, [
+            {"member_id": "104-house-1", "chamber": "house", "district": 1, "name": "John Smith"},
+            {"member_id": "104-house-2", "chamber": "house", "district": 2, "name": "Jane Doe"},
+        ])
+        temp_db.save_il_bills_batch(104, [
+            {"bill_type": "hb", "bill_number": 1, "sponsor_member_id": "104-house-1"},
+            {"bill_type": "hb", "bill_number": 2, "sponsor_member_id": "104-house-1"},
+        ])
+        temp_db.update_il_bill("104-hb-1", {"public_act_number": "104-0001"})
+        temp_db.save_il_bill(104, "HB", 2, sponsor_member_id="104-house-2")
+        temp_db.save_il_bill(104, "HB", 2, sponsor_member_id="104-house-2")
+
+        def totals():
+            conn = sqlite3.connect(os.environ["DATABASE_PATH"])
+            rows = conn.execute(
+                "SELECT member_id, sponsored_total, enacted_total FROM il_sponsor_stats "
+                "WHERE ga_session = 104 ORDER BY member_id"
+            ).fetchall()
+            conn.close()
+            return rows
+
+        assert totals() == [("104-house-1", 1, 1), ("104-house-2", 1, 0)]
+
+        temp_db.clear_il_session_data(104)
+        assert totals() == []
+
+    def test_il_writes_wait_for_congress_writer_lock(self, temp_db):
+        """IL writers queue behind database.py's writer instead of hitting busy_timeout."""
+        import threading
+        import database
+
+        temp_db.init_il_database()
+        with database._write_lock:
+            writer = threading.Thread(
+                target=temp_db.save_il_legislator,
+                args=("104-house-1", 104, "house", 1, "John Smith"),
+            )
+            writer.start()
+            writer.join(timeout=0.3)
+            assert writer.is_alive()
+        writer.join(timeout=5)
+        assert not writer.is_alive()
+        assert temp_db.get_il_legislator_by_id("104-house-1")["name"] == "John Smith"
+
+    def test_il_timeline_buckets_by_year_and_month(self, temp_db):
+        """Dates are stored as ISO so months from different years stay apart."""
+        temp_db.save_il_bills_batch(104, [
+            {"bill_type": "hb", "bill_number": 1, "filing_date": "1/10/2025",
+             "enactment_date": "8/1/2025", "public_act_number": "104-0001"},
+            {"bill_type": "hb", "bill_number": 2, "filing_date": "1/10/2026"},
+            {"bill_type": "hb", "bill_number": 3, "filing_date": "1/12/2025"},
+        ])
+
+        conn = sqlite3.connect(os.environ["DATABASE_PATH"])
+        stored = conn.execute("SELECT filing_date FROM il_bills WHERE bill_id = '104-hb-1'").fetchone()[0]
+        conn.close()
+        assert stored == "2025-01-10"
+
+        timeline = temp_db.get_il_timeline_data(104)
+        assert timeline["months"] == ["2025-01", "2025-08", "2026-01"]
+        assert timeline["filed"] == [2, 0, 1]
+        assert timeline["enacted"] == [0, 1, 0]
+
     def test_save_and_load_il_stats_cache(self, temp_db):
         """Test saving and loading IL stats cache."""
         stats = {
@@ -574,6 +748,19 @@ class TestILDatabase:
         assert loaded["ga_session"] == 104
         assert len(loaded["rows"]) == 1
 
+    def test_il_stats_cache_memo_returns_copies_and_invalidates(self, temp_db):
+        """Repeat loads reuse the parsed blob until the cache is rewritten."""
+        temp_db.save_il_stats_cache(104, {"ga_session": 104, "rows": [], "summary": {"total_bills": 1}})
+
+        first = temp_db.load_il_stats_cache(104)
+        first["_refresh_status"] = "pending"
+        second = temp_db.load_il_stats_cache(104)
+        assert "_refresh_status" not in second
+        assert second["summary"] is first["summary"]
+
+        temp_db.save_il_stats_cache(104, {"ga_session": 104, "rows": [], "summary": {"total_bills": 2}})
+        assert temp_db.load_il_stats_cache(104)["summary"]["total_bills"] == 2
+
     def test_il_cache_miss(self, temp_db):
         """Test that cache miss returns None."""
         result = temp_db.load_il_stats_cache(999)
@@ -642,6 +829,23 @@ class TestILRemoteCache:
         assert result["ga_session"] == 104
         mock_db.assert_not_called()
 
+    @patch("illinois_stats.il_db.save_il_stats_cache")
+    @patch("illinois_stats.il_db.load_il_stats_cache")
+    def test_save_then_load_file_cache_round_trip(self, mock_load_db, mock_save_db, monkeypatch, tmp_path):
+        """The file cache written by save_il_cache reads back unchanged, non-ASCII included."""
+        monkeypatch.delenv("REMOTE_CACHE_BASE_URL", raising=False)
+        monkeypatch.delenv("REMOTE_IL_CACHE_BASE_URL", raising=False)
+        monkeypatch.setattr("illinois_stats.IL_CACHE_DIR", str(tmp_path))
+        data = {"ga_session": 104, "rows": [{"sponsorName": "Jos\u00e9 Doe", "sponsored_total": 3}]}
+
+        from illinois_stats import save_il_cache
+        save_il_cache(104, data)
+
+        assert load_il_cache(104) == data
+        assert json.loads((tmp_path / "il_stats_104.json").read_text(encoding="utf-8")) == data
+        mock_save_db.assert_called_once()
+        mock_load_db.assert_not_called()
+
 
 class TestILAPIEndpoints:
     """Tests for Illinois API endpoints."""
@@ -750,13 +954,13 @@ class TestILAPIEndpoints:
 
 
 class TestILIncrementalMerge:
-    @patch("illinois_stats.il_db.update_il_bill")
+    @patch("illinois_stats.il_db.update_il_bills_batch")
     @patch("illinois_stats.il_db.get_pending_bills_for_update")
     @patch("illinois_stats.il_db.save_il_legislators_batch")
     @patch("illinois_stats.il_db.save_il_bills_batch")
     @patch("illinois_stats.il_db.save_il_laws_batch")
     @patch("illinois_stats.il_db.save_il_stats_cache")
-    @patch("illinois_stats.il_db.get_all_bills_for_session")
+    @patch("illinois_stats.il_db.iter_bills_for_session")
     @patch("illinois_stats.il_db.get_existing_bill_filenames")
     @patch("illinois_stats.ILDataFetcher.fetch_bill")
     @patch("illinois_stats.ILDataFetcher.fetch_bill_list")
@@ -959,13 +1163,60 @@ class TestBillStatusUpdateLogic:
         assert all_bills[0]["public_act_number"] == "104-0050"
         assert all_bills[0]["latest_action_date"] == "06/15/2025"
 
-    @patch("illinois_stats.il_db.update_il_bill")
+    def test_update_il_bills_batch_mixed_shapes(self, temp_db):
+        """Updates with different field sets are all applied."""
+        temp_db.save_il_bills_batch(104, [
+            {"bill_type": "hb", "bill_number": n, "latest_action_date": "03/10/2025"}
+            for n in (1, 2, 3)
+        ])
+
+        temp_db.update_il_bills_batch([
+            ("104-hb-1", {"public_act_number": "104-0001", "latest_action_date": "06/15/2025"}),
+            ("104-hb-2", {"latest_action_date": "05/01/2025"}),
+            ("104-hb-3", {"public_act_number": "104-0003", "latest_action_date": "06/20/2025"}),
+        ])
+
+        by_id = {b["bill_id"]: b for b in temp_db.get_all_bills_for_session(104)}
+        assert by_id["104-hb-1"]["public_act_number"] == "104-0001"
+        assert by_id["104-hb-2"]["latest_action_date"] == "05/01/2025"
+        assert by_id["104-hb-2"]["public_act_number"] is None
+        assert by_id["104-hb-3"]["latest_action_date"] == "06/20/2025"
+        assert [b["bill_id"] for b in temp_db.get_pending_bills_for_update(104)] == ["104-hb-2"]
+
+    def test_update_il_bills_batch_rebuilds_cosponsors_per_session(self, temp_db):
+        """Co-sponsor changes are re-resolved with one matcher per session."""
+        temp_db.save_il_legislators_batch(104, [
+            {"member_id": "104-house-1", "chamber": "house", "district": 1,
+             "name": "John Smith", "first_name": "John", "last_name": "Smith"},
+            {"member_id": "104-house-2", "chamber": "house", "district": 2,
+             "name": "Jane Doe", "first_name": "Jane", "last_name": "Doe"},
+        ])
+        temp_db.save_il_bills_batch(104, [
+            {"bill_type": "hb", "bill_number": n, "sponsor_member_id": "104-house-1"}
+            for n in (1, 2)
+        ])
+
+        with patch.object(temp_db, "_cosponsor_matcher", wraps=temp_db._cosponsor_matcher) as matcher:
+            temp_db.update_il_bills_batch([
+                ("104-hb-1", {"chief_co_sponsors": ["Jane Doe"]}),
+                ("104-hb-2", {"co_sponsors": ["Jane Doe", "Nobody Known"]}),
+            ])
+        assert matcher.call_count == 1
+
+        conn = sqlite3.connect(os.environ["DATABASE_PATH"])
+        rows = conn.execute(
+            "SELECT bill_id, member_id, role FROM il_bill_cosponsors ORDER BY bill_id"
+        ).fetchall()
+        conn.close()
+        assert rows == [("104-hb-1", "104-house-2", "chief"), ("104-hb-2", "104-house-2", "co")]
+
+    @patch("illinois_stats.il_db.update_il_bills_batch")
     @patch("illinois_stats.il_db.get_pending_bills_for_update")
     @patch("illinois_stats.il_db.save_il_legislators_batch")
     @patch("illinois_stats.il_db.save_il_bills_batch")
     @patch("illinois_stats.il_db.save_il_laws_batch")
     @patch("illinois_stats.il_db.save_il_stats_cache")
-    @patch("illinois_stats.il_db.get_all_bills_for_session")
+    @patch("illinois_stats.il_db.iter_bills_for_session")
     @patch("illinois_stats.il_db.get_existing_bill_filenames")
     @patch("illinois_stats.ILDataFetcher.fetch_bill")
     @patch("illinois_stats.ILDataFetcher.fetch_bill_list")
@@ -1041,13 +1292,13 @@ class TestBillStatusUpdateLogic:
         rows = {row["memberId"]: row for row in stats["rows"]}
         assert rows["104-house-1"]["enacted_total"] == 1
 
-    @patch("illinois_stats.il_db.update_il_bill")
+    @patch("illinois_stats.il_db.update_il_bills_batch")
     @patch("illinois_stats.il_db.get_pending_bills_for_update")
     @patch("illinois_stats.il_db.save_il_legislators_batch")
     @patch("illinois_stats.il_db.save_il_bills_batch")
     @patch("illinois_stats.il_db.save_il_laws_batch")
     @patch("illinois_stats.il_db.save_il_stats_cache")
-    @patch("illinois_stats.il_db.get_all_bills_for_session")
+    @patch("illinois_stats.il_db.iter_bills_for_session")
     @patch("illinois_stats.il_db.get_existing_bill_filenames")
     @patch("illinois_stats.ILDataFetcher.fetch_bill")
     @patch("illinois_stats.ILDataFetcher.fetch_bill_list")
@@ -1153,6 +1404,33 @@ class TestIntegration:
         assert len(house) == 1
         assert house[0]["name"] == "John Smith"
 
+    @patch("illinois_stats.il_http_get")
+    def test_directory_listing_extracts_file_links(self, mock_get):
+        """Listing links are pulled from <a href> tags; sort links and dirs are skipped."""
+        mock_get.return_value = MagicMock(content=(
+            b'<pre><a href="?C=N;O=D">Name</a>\n'
+            b'<A HREF="/ftp/legislation/104/BillStatus/XML/10400HB0001.xml">10400HB0001.xml</A>\n'
+            b"<a href='10400SB0002.xml'>10400SB0002.xml</a>\n"
+            b'<a href="/ftp/legislation/104/">Parent</a></pre>'
+        ))
+
+        from illinois_stats import il_fetch_directory_listing
+
+        assert il_fetch_directory_listing("https://example/XML") == ["10400HB0001.xml", "10400SB0002.xml"]
+
+    @patch("illinois_stats.il_fetch_xml")
+    def test_fetch_bills_yields_in_input_order(self, mock_xml):
+        """fetch_bills runs concurrently but keeps results aligned with filenames."""
+        bill_xml = "<BillStatus><ShortTitle>T</ShortTitle></BillStatus>"
+        mock_xml.side_effect = lambda url: "not xml" if "HB0002" in url else bill_xml
+
+        from illinois_stats import ILDataFetcher
+
+        files = ["10400HB0001.xml", "10400HB0002.xml", "10400HB0003.xml"]
+        bills = list(ILDataFetcher(104).fetch_bills(files))
+
+        assert [b and b["bill_id"] for b in bills] == ["104-hb-1", None, "104-hb-3"]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -276,7 +276,9 @@ class TestDatabase:
 
     def test_init_database(self, temp_db):
         """Test database initialization."""
-        # Database should already be initialized from import
+        # The schema is applied lazily, on the first connection request
+        with temp_db.get_db_connection():
+            pass
         conn = sqlite3.connect(os.environ["DATABASE_PATH"])
         cursor = conn.cursor()
 
@@ -290,6 +292,9 @@ class TestDatabase:
         assert "laws" in tables
         assert "cache_metadata" in tables
 
+        cursor.execute("PRAGMA user_version")
+        assert cursor.fetchone()[0] == temp_db.CURRENT_SCHEMA_VERSION
+
         cursor.execute("PRAGMA table_info(bills)")
         bill_cols = {row[1] for row in cursor.fetchall()}
         assert "update_date" in bill_cols
@@ -336,6 +341,69 @@ class TestDatabase:
         assert loaded["congress"] == 119
         assert len(loaded["rows"]) == 1
 
+    def test_batch_writer_flushes_rows(self, temp_db):
+        """BatchWriter buffers rows and writes them on flush/exit."""
+        with temp_db.BatchWriter(flush_size=2) as writer:
+            writer.add_legislator("A000001", "Rep. Alpha", "D", "NY", "House")
+            writer.add_bill(119, "HR", 1, "A000001", title="First")
+            writer.add_law(119, "public", "119-1", "119-hr-1", "A000001")
+
+        conn = sqlite3.connect(os.environ["DATABASE_PATH"])
+        cursor = conn.cursor()
+        cursor.execute("SELECT bill_type, title FROM bills WHERE bill_id = ?", ("119-hr-1",))
+        assert cursor.fetchone() == ("hr", "First")
+        cursor.execute("SELECT COUNT(*) FROM laws")
+        assert cursor.fetchone()[0] == 1
+        cursor.execute("SELECT COUNT(*) FROM legislators")
+        assert cursor.fetchone()[0] == 1
+        conn.close()
+
+    def test_bulk_transaction_commits_once_or_rolls_back(self, temp_db):
+        """Saves inside bulk_transaction land together or not at all."""
+        with pytest.raises(RuntimeError):
+            with temp_db.bulk_transaction():
+                temp_db.save_bills_batch(119, [{"type": "HR", "number": 1}])
+                raise RuntimeError("boom")
+        assert temp_db.get_bill_cosponsor_refresh_map(119) == {}
+
+        with temp_db.bulk_transaction():
+            temp_db.save_bills_batch(119, [{"type": "HR", "number": 1}])
+            temp_db.save_laws_batch(119, [{"number": "119-1"}])
+        assert set(temp_db.get_bill_cosponsor_refresh_map(119)) == {"119-hr-1"}
+
+    def test_save_bills_batch_packs_rows(self, temp_db):
+        """Batches larger than one multi-row statement are saved in full."""
+        bills = [{"type": "HR", "number": n, "title": f"Bill {n}"} for n in range(1, 251)]
+        bills.append({"type": "HR", "number": 1, "title": "Renamed"})
+        temp_db.save_bills_batch(119, bills)
+
+        conn = sqlite3.connect(os.environ["DATABASE_PATH"])
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM bills WHERE congress = 119")
+        assert cursor.fetchone()[0] == 250
+        cursor.execute("SELECT title FROM bills WHERE bill_id = '119-hr-1'")
+        assert cursor.fetchone()[0] == "Renamed"
+        conn.close()
+
+    def test_readonly_connections_reject_writes(self, temp_db):
+        """Pool readers are opened read-only."""
+        with temp_db.get_db_connection(readonly=True) as conn:
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM bills")
+
+    def test_checkpoint_wal_truncates_log(self, temp_db):
+        """checkpoint_wal folds pending writes into the main file."""
+        temp_db.save_bills_batch(119, [{"type": "HR", "number": 1, "title": "First"}])
+        temp_db.checkpoint_wal()
+
+        wal_path = os.environ["DATABASE_PATH"] + "-wal"
+        assert not os.path.exists(wal_path) or os.path.getsize(wal_path) == 0
+
+    def test_multi_row_sql_rejects_mismatched_column_count(self, temp_db):
+        """Packing refuses a statement whose VALUES tuple doesn't match ncols."""
+        with pytest.raises(ValueError):
+            temp_db._multi_row_sql("INSERT INTO t (a, b) VALUES (?, ?)", 3, 2)
+
     def test_cache_miss(self, temp_db):
         """Test that cache miss returns None."""
         result = temp_db.load_stats_cache(999)